@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Throughput of the evaluation cache under concurrent access.
+
+Compares the single-lock LRUCache with ShardedLRUCache at 1, 8 and 64
+threads doing a 90/10 mix of lookups and stores.
+
+Usage:
+    python benchmarks/bench_cache_concurrency.py [--ops N] [--shards N]
+"""
+
+import argparse
+import random
+import threading
+import time
+
+from togglr.cache import LRUCache, ShardedLRUCache
+
+
+def run(cache, threads: int, ops_per_thread: int, keyspace: int) -> float:
+    """Run the workload and return operations per second."""
+    keys = [f"feature_{i % 40}:{i:032x}" for i in range(keyspace)]
+    for key in keys[: keyspace // 2]:
+        cache.set(key, "A", True, True)
+    
+    barrier = threading.Barrier(threads + 1)
+    
+    def worker(seed: int) -> None:
+        rnd = random.Random(seed)
+        picks = [rnd.choice(keys) for _ in range(ops_per_thread)]
+        writes = [rnd.random() < 0.1 for _ in range(ops_per_thread)]
+        barrier.wait()
+        for key, write in zip(picks, writes):
+            if write:
+                cache.set(key, "B", True, True)
+            else:
+                cache.get(key)
+    
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return threads * ops_per_thread / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=200_000, help="total operations per run")
+    parser.add_argument("--shards", type=int, default=16)
+    parser.add_argument("--keyspace", type=int, default=10_000)
+    args = parser.parse_args()
+    
+    print(f"{'threads':>8} {'LRUCache ops/s':>16} {'Sharded ops/s':>16}")
+    for threads in (1, 8, 64):
+        per_thread = max(1, args.ops // threads)
+        single = run(LRUCache(args.keyspace, 60), threads, per_thread, args.keyspace)
+        sharded = run(
+            ShardedLRUCache(args.keyspace, 60, shards=args.shards),
+            threads,
+            per_thread,
+            args.keyspace,
+        )
+        print(f"{threads:>8} {single:>16,.0f} {sharded:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
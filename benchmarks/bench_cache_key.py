@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Cost of building the evaluation cache key on the cache-hit path.
+
+Compares the previous key derivation (dict copy + json.dumps + md5 on
+every lookup) with the memoized RequestContext.fingerprint(), and times a
+full Client.evaluate() cache hit.
+
+Usage:
+    python benchmarks/bench_cache_key.py [--iterations N]
+"""
+
+import argparse
+import hashlib
+import json
+import timeit
+
+from togglr import Client, ClientConfig, RequestContext
+
+
+def legacy_cache_key(feature_key: str, context: RequestContext) -> str:
+    """Cache key as computed before fingerprints were memoized."""
+    context_str = json.dumps(context.to_dict(), sort_keys=True)
+    context_hash = hashlib.md5(context_str.encode()).hexdigest()
+    return f"{feature_key}:{context_hash}"
+
+
+def make_context() -> RequestContext:
+    return RequestContext.new() \
+        .with_user_id("user-42") \
+        .with_user_email("user42@example.com") \
+        .with_country("US") \
+        .with_device_type("mobile") \
+        .with_os("iOS") \
+        .with_os_version("17.1") \
+        .with_browser("Safari") \
+        .with_language("en-US") \
+        .with_app_version("3.14.0")
+
+
+def report(label: str, seconds: float, iterations: int) -> None:
+    print(f"{label:<32} {seconds / iterations * 1e9:>10,.0f} ns/op")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200_000)
+    args = parser.parse_args()
+    n = args.iterations
+    
+    context = make_context()
+    client = Client(ClientConfig.default("bench").with_cache(enabled=True, max_size=1000, ttl_seconds=3600))
+    key = client._get_cache_key("new_ui", context)
+    client._cache.set(key, "A", True, True)
+    legacy_key = legacy_cache_key("new_ui", context)
+    
+    report("legacy key (json + md5)", timeit.timeit(lambda: legacy_cache_key("new_ui", context), number=n), n)
+    report("fingerprint key", timeit.timeit(lambda: client._get_cache_key("new_ui", context), number=n), n)
+    report(
+        "hit path, legacy key",
+        timeit.timeit(lambda: client._cache.get(legacy_cache_key("new_ui", context)), number=n),
+        n,
+    )
+    report("hit path, evaluate()", timeit.timeit(lambda: client.evaluate("new_ui", context), number=n), n)
+    assert legacy_key == key
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Memory used per cache entry.
+
+Fills an LRUCache with entries whose values are a handful of variant
+strings, each decoded freshly as they would be from API responses, and
+reports the traced bytes per entry. The previous dataclass entry (with a
+__dict__, a wall-clock timestamp and its own copy of every value) is
+measured the same way for comparison.
+
+Usage:
+    python benchmarks/bench_cache_memory.py [--entries N] [--value-size N]
+"""
+
+import argparse
+import gc
+import hashlib
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+
+from togglr.cache import CacheEntry, LRUCache
+
+
+@dataclass
+class LegacyCacheEntry:
+    """Cache entry as stored before entries were made compact."""
+    
+    value: str
+    enabled: bool
+    found: bool
+    timestamp: float = field(default_factory=time.time)
+    expires_at: float = float("inf")
+
+
+def measure(build, count: int) -> float:
+    """Return the traced bytes per item kept alive by build()."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=200_000)
+    parser.add_argument("--variants", type=int, default=4)
+    parser.add_argument("--value-size", type=int, default=64, help="bytes per variant value")
+    args = parser.parse_args()
+    n = args.entries
+    
+    encoded = [(f"variant_{i}:".ljust(args.value_size, "x")).encode() for i in range(args.variants)]
+    keys = [f"feature_{i % 40}:{hashlib.md5(str(i).encode()).hexdigest()}" for i in range(n)]
+    
+    def legacy_entries():
+        now = time.time()
+        return [
+            LegacyCacheEntry(encoded[i % len(encoded)].decode(), True, True, now, now + 60.0)
+            for i in range(n)
+        ]
+    
+    def compact_entries():
+        now = time.monotonic()
+        return [
+            CacheEntry(encoded[i % len(encoded)].decode(), True, True, now, now + 60.0)
+            for i in range(n)
+        ]
+    
+    def filled_cache():
+        cache = LRUCache(max_size=n, ttl_seconds=60)
+        for i, key in enumerate(keys):
+            cache.set(key, encoded[i % len(encoded)].decode(), True, True)
+        return cache
+    
+    legacy = measure(legacy_entries, n)
+    compact = measure(compact_entries, n)
+    print(f"{n:,} entries, {args.variants} variants of {args.value_size} bytes")
+    print(f"{'entry, before (dataclass)':<32} {legacy:>8,.0f} bytes/entry")
+    print(f"{'entry, after (slots + interned)':<32} {compact:>8,.0f} bytes/entry")
+    print(f"{'LRUCache incl. bookkeeping':<32} {measure(filled_cache, n):>8,.0f} bytes/entry (keys excluded)")
+
+
+if __name__ == "__main__":
+    main()
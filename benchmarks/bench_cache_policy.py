@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Hit rates of the cache policies on a skewed lookup trace.
+
+Replays a trace of cache keys against a plain cachetools TTLCache, the
+LRUCache "lru" policy and the "tinylfu" policy: every lookup that misses
+stores the key. By default the trace mixes Zipf-distributed lookups over
+popular flag/context pairs with a stream of one-off user contexts; a real
+trace can be given as a file with one key per line.
+
+Usage:
+    python benchmarks/bench_cache_policy.py [--lookups N] [--keys N]
+        [--one-off FRACTION] [--zipf S] [--sizes 100,1000] [--trace FILE]
+"""
+
+import argparse
+import bisect
+import itertools
+import random
+import time
+from typing import List
+
+from cachetools import TTLCache
+
+from togglr.cache import LRUCache
+
+
+def zipf_trace(lookups: int, keys: int, s: float, one_off: float, seed: int) -> List[str]:
+    """Build a trace of Zipf-distributed keys interleaved with unique keys."""
+    rnd = random.Random(seed)
+    weights = list(itertools.accumulate(1.0 / (rank ** s) for rank in range(1, keys + 1)))
+    total = weights[-1]
+    trace = []
+    for i in range(lookups):
+        if rnd.random() < one_off:
+            trace.append(f"one_off:{i}")
+        else:
+            rank = bisect.bisect_left(weights, rnd.random() * total)
+            trace.append(f"feature_{rank % 40}:{rank}")
+    return trace
+
+
+def replay_ttlcache(trace: List[str], size: int) -> float:
+    """Replay a trace against cachetools.TTLCache and return the hit rate."""
+    cache = TTLCache(maxsize=size, ttl=3600)
+    hits = 0
+    for key in trace:
+        if key in cache:
+            cache[key]
+            hits += 1
+        else:
+            cache[key] = True
+    return hits / len(trace)
+
+
+def replay(trace: List[str], size: int, policy: str) -> float:
+    """Replay a trace against LRUCache and return the hit rate."""
+    cache = LRUCache(max_size=size, ttl_seconds=3600, policy=policy)
+    for key in trace:
+        if not cache.get(key)[1]:
+            cache.set(key, "A", True, True)
+    return cache.stats().hit_ratio
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lookups", type=int, default=200_000)
+    parser.add_argument("--keys", type=int, default=50_000, help="distinct popular keys")
+    parser.add_argument("--one-off", type=float, default=0.3, help="fraction of one-off lookups")
+    parser.add_argument("--zipf", type=float, default=0.9, help="Zipf exponent")
+    parser.add_argument("--sizes", default="100,1000,5000")
+    parser.add_argument("--trace", help="file with one cache key per line")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    
+    if args.trace:
+        with open(args.trace) as f:
+            trace = [line.strip() for line in f if line.strip()]
+    else:
+        trace = zipf_trace(args.lookups, args.keys, args.zipf, args.one_off, args.seed)
+    
+    print(f"{len(trace):,} lookups, {len(set(trace)):,} distinct keys")
+    print(f"{'size':>8} {'TTLCache':>10} {'lru':>10} {'tinylfu':>10} {'tinylfu time':>14}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        baseline = replay_ttlcache(trace, size)
+        lru = replay(trace, size, "lru")
+        start = time.perf_counter()
+        tinylfu = replay(trace, size, "tinylfu")
+        elapsed = time.perf_counter() - start
+        print(
+            f"{size:>8} {baseline:>10.1%} {lru:>10.1%} {tinylfu:>10.1%} "
+            f"{elapsed / len(trace) * 1e9:>11,.0f} ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
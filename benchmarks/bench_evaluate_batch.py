@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Throughput of evaluate_batch() against one evaluate() call per context.
+
+Starts a local stand-in for the SDK evaluate endpoint, with an optional
+per-request latency, and evaluates one feature for a stream of user
+contexts, a fraction of which repeat. Reports contexts per second for a
+plain evaluate() loop and for evaluate_batch() at each concurrency, and
+the number of requests each one sent.
+
+Usage:
+    python benchmarks/bench_evaluate_batch.py [--contexts N] [--users N]
+        [--latency-ms MS] [--concurrency 8,32] [--cache]
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from togglr import Client, ClientConfig, RequestContext
+
+
+class EvaluateHandler(BaseHTTPRequestHandler):
+    """Answers every evaluate request with variant "A" after a fixed delay."""
+    
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    wbufsize = 64 * 1024  # send headers and body together
+    
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.requests += 1
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        feature_key = self.path.split("/")[4]
+        body = json.dumps({"feature_key": feature_key, "enabled": True, "value": "A"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def run(server, config, contexts, concurrency):
+    """Evaluate all contexts and return (seconds, requests sent)."""
+    server.requests = 0
+    client = Client(config)
+    started = time.perf_counter()
+    if concurrency == 0:
+        for context in contexts:
+            client.evaluate("feature", context)
+    else:
+        for _ in client.evaluate_batch("feature", contexts, concurrency=concurrency):
+            pass
+    elapsed = time.perf_counter() - started
+    client.close()
+    return elapsed, server.requests
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--contexts", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=500, help="distinct users among the contexts")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="server latency per request")
+    parser.add_argument("--concurrency", default="8,32")
+    parser.add_argument("--cache", action="store_true", help="enable the evaluation cache")
+    args = parser.parse_args()
+    
+    server = ThreadingHTTPServer(("127.0.0.1", 0), EvaluateHandler)
+    server.daemon_threads = True
+    server.latency = args.latency_ms / 1000
+    server.requests = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    
+    config = ClientConfig.default("bench").with_base_url(f"http://{host}:{port}").with_timeout(5.0)
+    if args.cache:
+        config = config.with_cache(enabled=True, max_size=args.users, ttl_seconds=600)
+    contexts = [
+        RequestContext.new().with_user_id(f"user{i % args.users}")
+        for i in range(args.contexts)
+    ]
+    
+    print(f"{args.contexts:,} contexts, {args.users:,} distinct, {args.latency_ms:g} ms server latency")
+    print(f"{'mode':<24} {'contexts/s':>12} {'requests':>10}")
+    elapsed, requests = run(server, config, contexts, 0)
+    print(f"{'evaluate() loop':<24} {args.contexts / elapsed:>12,.0f} {requests:>10,}")
+    for concurrency in (int(c) for c in args.concurrency.split(",")):
+        elapsed, requests = run(server, config, contexts, concurrency)
+        label = f"evaluate_batch({concurrency})"
+        print(f"{label:<24} {args.contexts / elapsed:>12,.0f} {requests:>10,}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
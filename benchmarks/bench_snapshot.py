@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Time to save and load an evaluation cache snapshot.
+
+Usage:
+    python benchmarks/bench_snapshot.py [--entries N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from togglr.cache import LRUCache
+from togglr.snapshot import load_snapshot, save_snapshot
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    args = parser.parse_args()
+    n = args.entries
+    
+    variants = ["A", "B", "control", '{"limit": 100, "mode": "fast"}']
+    source = LRUCache(n, 3600)
+    for i in range(n):
+        source.set(f"feature_{i % 50}:{i:032x}", variants[i % len(variants)], i % 3 != 0, True)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cache.snap")
+        
+        started = time.perf_counter()
+        written = save_snapshot(source, path)
+        save_seconds = time.perf_counter() - started
+        size = os.path.getsize(path)
+        
+        target = LRUCache(n, 3600)
+        started = time.perf_counter()
+        loaded = load_snapshot(target, path)
+        load_seconds = time.perf_counter() - started
+    
+    print(f"entries:   {written:,} written, {loaded:,} loaded")
+    print(f"file size: {size / 1e6:,.1f} MB ({size / max(written, 1):.1f} bytes/entry)")
+    print(f"save:      {save_seconds:.2f} s")
+    print(f"load:      {load_seconds:.2f} s ({loaded / load_seconds:,.0f} entries/s)")
+
+
+if __name__ == "__main__":
+    main()
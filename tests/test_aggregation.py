@@ -0,0 +1,85 @@
+"""Tests for client-side aggregation of track events."""
+
+import time
+from unittest.mock import Mock, patch
+
+from togglr import Client, ClientConfig, EventSummary, TrackEvent
+from togglr.aggregation import EventAggregator
+
+
+class TestEventAggregator:
+    """Test cases for the EventAggregator class."""
+    
+    def test_sums_per_group(self):
+        """Test that events are grouped by variant, event type and context keys."""
+        emitted = []
+        aggregator = EventAggregator(emitted.append, window_seconds=60, context_keys=["country"])
+        for i in range(100):
+            event = TrackEvent.new("A" if i % 4 else "B", "success").with_reward(1.0)
+            aggregator.add("feature", event.with_context("country", "RU").with_context("user.id", f"u{i}"))
+        for _ in range(10):
+            aggregator.add("feature", TrackEvent.new("A", "success").with_reward(0.5).with_context("country", "DE"))
+        aggregator.add("feature", TrackEvent.new("A", "failure"))
+        aggregator.flush()
+        
+        summaries = {
+            (s.variant_key, s.event_type.value, s.context.get("country")): s for s in emitted
+        }
+        assert len(emitted) == 4
+        ru = summaries[("A", "success", "RU")]
+        assert isinstance(ru, EventSummary)
+        assert (ru.feature_key, ru.count, ru.reward, ru.context) == ("feature", 75, 75.0, {"country": "RU"})
+        assert summaries[("B", "success", "RU")].count == 25
+        assert summaries[("A", "success", "DE")].reward == 5.0
+        single = summaries[("A", "failure", None)]
+        assert (single.count, single.reward, single.context) == (1, 0.0, {})
+        assert aggregator.aggregated() == 111
+        aggregator.close()
+    
+    def test_bypass(self):
+        """Test that deduplicated events and events beyond max_groups are not aggregated."""
+        aggregator = EventAggregator(lambda s: None, window_seconds=60, context_keys=["user.id"], max_groups=2)
+        assert aggregator.add("feature", TrackEvent.new("A", "success").with_dedup_key("d1")) is False
+        assert aggregator.add("feature", TrackEvent.new("A", "success").with_context("user.id", "u1"))
+        assert aggregator.add("feature", TrackEvent.new("A", "success").with_context("user.id", "u2"))
+        assert aggregator.add("feature", TrackEvent.new("A", "success").with_context("user.id", "u3")) is False
+        assert aggregator.add("feature", TrackEvent.new("A", "success").with_context("user.id", "u1"))
+        aggregator.close()
+        assert aggregator.add("feature", TrackEvent.new("A", "success")) is False
+    
+    def test_emits_every_window(self):
+        """Test that summaries are emitted by the background thread."""
+        emitted = []
+        aggregator = EventAggregator(emitted.append, window_seconds=0.05)
+        for _ in range(10):
+            aggregator.add("feature", TrackEvent.new("A", "success").with_reward(1.0))
+        time.sleep(0.3)
+        
+        assert len(emitted) == 1
+        assert (emitted[0].count, emitted[0].reward) == (10, 10.0)
+        aggregator.close()
+
+
+class TestClientEventAggregation:
+    """Test cases for track_event() with event aggregation enabled."""
+    
+    @patch('togglr.client.DefaultApi')
+    def test_track_event_emits_summaries(self, mock_api_class):
+        """Test that aggregated conversions go to the sink and not to the track API."""
+        mock_api = Mock()
+        mock_api_class.return_value = mock_api
+        
+        summaries = []
+        config = ClientConfig.default("test-api-key").with_event_aggregation(summaries.append, window_seconds=60)
+        client = Client(config)
+        for _ in range(1000):
+            client.track_event("feature", TrackEvent.new("A", "success").with_reward(1.0))
+        client.track_event("feature", TrackEvent.new("A", "success").with_dedup_key("order-1"))
+        
+        assert client.flush() is True
+        assert [(s.count, s.reward) for s in summaries] == [(1000, 1000.0)]
+        assert mock_api.track_feature_event.call_count == 1
+        request = mock_api.track_feature_event.call_args.kwargs["track_request"]
+        assert request["dedup_key"] == "order-1"
+        assert client.event_stats().aggregated == 1000
+        client.close()
@@ -0,0 +1,213 @@
+"""Tests for the asyncio client."""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from togglr import AsyncClient, ClientConfig, RequestContext, TrackEvent
+from togglr.errors import FeatureNotFoundError, InternalServerError, TogglrError
+
+
+class FakeServer:
+    """Answers SDK requests for an httpx.MockTransport and records them."""
+    
+    def __init__(self, delay=0.0):
+        self.requests = []
+        self.delay = delay
+        self.statuses = []  # statuses to return before answering normally
+    
+    async def __call__(self, request):
+        self.requests.append(request)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.statuses:
+            return httpx.Response(self.statuses.pop(0))
+        path = request.url.path
+        if path == "/sdk/v1/health":
+            return httpx.Response(200, json={"status": "ok", "server_time": "2024-01-01T00:00:00Z"})
+        if path == "/sdk/v1/features/empty/evaluate":
+            return httpx.Response(200, content=b"null", headers={"Content-Type": "application/json"})
+        if path.startswith("/sdk/v1/features/missing/"):
+            return httpx.Response(404, json={"error": {"message": "not found"}})
+        if path.endswith("/evaluate"):
+            feature_key = path.split("/")[4]
+            return httpx.Response(200, json={"feature_key": feature_key, "enabled": True, "value": "A"})
+        if path.endswith("/health"):
+            return httpx.Response(200, json={
+                "feature_key": path.split("/")[4],
+                "environment_key": "prod",
+                "enabled": True,
+                "auto_disabled": False,
+            })
+        return httpx.Response(202)
+
+
+def make_client(server, config=None):
+    config = config or ClientConfig.default("test-api-key").with_cache().with_backoff(base_delay=0.01)
+    return AsyncClient(config, transport=httpx.MockTransport(server))
+
+
+class TestAsyncClient:
+    """Test cases for the AsyncClient class."""
+    
+    def test_evaluate_is_cached(self):
+        """Test that evaluations are sent once and then served from the cache."""
+        server = FakeServer()
+        
+        async def run():
+            async with make_client(server) as client:
+                context = RequestContext.new().with_user_id("user1")
+                first = await client.evaluate("new_ui", context)
+                second = await client.evaluate("new_ui", context)
+                return first, second, client.cache_stats()
+        
+        first, second, stats = asyncio.run(run())
+        assert first == second == ("A", True, True)
+        assert len(server.requests) == 1
+        request = server.requests[0]
+        assert request.headers["Authorization"] == "test-api-key"
+        assert json.loads(request.content) == {"user.id": "user1"}
+        assert stats.hits == 1
+    
+    def test_not_found(self):
+        """Test that unknown features evaluate to not found."""
+        server = FakeServer()
+        
+        async def run():
+            async with make_client(server) as client:
+                assert await client.evaluate("missing", RequestContext.new()) == ("", False, False)
+                with pytest.raises(FeatureNotFoundError):
+                    await client.is_enabled("missing", RequestContext.new())
+                assert await client.is_enabled_or_default("missing", RequestContext.new(), default=True)
+        
+        asyncio.run(run())
+    
+    def test_concurrent_misses_share_one_request(self):
+        """Test that concurrent evaluations of the same key are coalesced."""
+        server = FakeServer(delay=0.05)
+        
+        async def run():
+            async with make_client(server) as client:
+                context = RequestContext.new().with_user_id("user1")
+                results = await asyncio.gather(*(client.evaluate("new_ui", context) for _ in range(10)))
+                return results, client.singleflight_stats()
+        
+        results, stats = asyncio.run(run())
+        assert results == [("A", True, True)] * 10
+        assert len(server.requests) == 1
+        assert (stats.calls, stats.coalesced) == (1, 9)
+    
+    def test_retries_server_errors(self):
+        """Test that 5xx responses are retried and the last error is converted."""
+        server = FakeServer()
+        server.statuses = [503, 500]
+        
+        async def run():
+            async with make_client(server) as client:
+                assert await client.evaluate("new_ui", RequestContext.new()) == ("A", True, True)
+                server.statuses = [500] * 3
+                with pytest.raises(InternalServerError):
+                    await client.evaluate("other", RequestContext.new())
+        
+        asyncio.run(run())
+        assert len(server.requests) == 6
+    
+    def test_deadline(self):
+        """Test that a slow server is abandoned at the deadline."""
+        server = FakeServer(delay=1.0)
+        
+        async def run():
+            async with make_client(server) as client:
+                started = time.monotonic()
+                with pytest.raises(TogglrError):
+                    await client.evaluate("new_ui", RequestContext.new(), deadline=0.05)
+                return time.monotonic() - started
+        
+        assert asyncio.run(run()) < 0.5
+    
+    def test_track_report_and_health(self):
+        """Test the analytics and health endpoints."""
+        server = FakeServer()
+        
+        async def run():
+            async with make_client(server) as client:
+                await client.track_event("new_ui", TrackEvent.new("A", "success").with_reward(1.0))
+                await client.report_error("new_ui", "timeout", "took too long")
+                health = await client.get_feature_health("new_ui")
+                assert await client.is_feature_healthy("new_ui")
+                assert await client.health_check()
+                with pytest.raises(TogglrError):
+                    await client.track_event("missing", TrackEvent.new("A", "success"))
+                return health
+        
+        health = asyncio.run(run())
+        assert health.environment_key == "prod"
+        paths = [request.url.path for request in server.requests[:2]]
+        assert paths == ["/sdk/v1/features/new_ui/track", "/sdk/v1/features/new_ui/report-error"]
+        body = json.loads(server.requests[0].content)
+        assert (body["variant_key"], body["event_type"], body["reward"]) == ("A", "success", 1.0)
+    
+    def test_shares_cache_backend_with_sync_client(self):
+        """Test that a sync and an async client can use one cache backend."""
+        from togglr import Client
+        from togglr.cache import LRUCache
+        
+        shared = LRUCache(max_size=10, ttl_seconds=60)
+        config = ClientConfig.default("test-api-key").with_cache().with_cache_backend(shared)
+        sync_client = Client(config)
+        context = RequestContext.new().with_user_id("user1")
+        shared.set(sync_client._get_cache_key("new_ui", context), "B", True, True)
+        server = FakeServer()
+        
+        async def run():
+            async with make_client(server, config) as client:
+                return await client.evaluate("new_ui", context)
+        
+        assert asyncio.run(run()) == ("B", True, True)
+        assert server.requests == []
+    
+    def test_evaluate_many(self):
+        """Test that cache hits are served and misses are fetched concurrently."""
+        server = FakeServer(delay=0.05)
+        
+        async def run():
+            async with make_client(server) as client:
+                context = RequestContext.new().with_user_id("user1")
+                client._cache.set(client._get_cache_key("cached", context), "B", False, True)
+                started = time.monotonic()
+                results = await client.evaluate_many(["cached"] + [f"f{i}" for i in range(20)], context)
+                return results, time.monotonic() - started
+        
+        results, elapsed = asyncio.run(run())
+        assert results["cached"] == ("B", False, True)
+        assert results["f7"] == ("A", True, True)
+        assert len(results) == 21
+        assert len(server.requests) == 20
+        assert elapsed < 0.5
+    
+    def test_empty_evaluation_is_not_retried(self):
+        """Test that an empty evaluate response raises TogglrError without retries."""
+        server = FakeServer()
+        
+        async def run():
+            async with make_client(server) as client:
+                with pytest.raises(TogglrError, match="empty evaluation response"):
+                    await client.evaluate("empty", RequestContext.new())
+        
+        asyncio.run(run())
+        assert len(server.requests) == 1
+    
+    def test_rejects_background_event_settings(self):
+        """Test that event settings only Client supports are rejected instead of ignored."""
+        configs = [
+            ClientConfig.default("test-api-key").with_event_queue(),
+            ClientConfig.default("test-api-key").with_event_spool("/tmp/togglr-spool"),
+            ClientConfig.default("test-api-key").with_event_aggregation(lambda summary: None),
+            ClientConfig.default("test-api-key").with_impressions(),
+        ]
+        for config in configs:
+            with pytest.raises(ValueError, match="AsyncClient does not support"):
+                AsyncClient(config)
@@ -0,0 +1,354 @@
+"""Tests for the evaluation cache."""
+
+import threading
+import time
+import zlib
+
+import pytest
+
+from togglr.cache import LRUCache, ShardedLRUCache
+
+
+class FakeClock:
+    """Manually advanced clock for deterministic expiry tests."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+    
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class TestLRUCache:
+    """Test cases for the LRUCache class."""
+    
+    def test_set_and_get(self):
+        """Test storing and retrieving an entry."""
+        cache = LRUCache(max_size=10, ttl_seconds=60)
+        cache.set("feature:abc", "A", True, True)
+        
+        entry, hit = cache.get("feature:abc")
+        assert hit is True
+        assert entry.value == "A"
+        assert entry.enabled is True
+        assert entry.found is True
+    
+    def test_entries_are_compact(self):
+        """Test that entries have no __dict__ and share equal values."""
+        cache = LRUCache(max_size=10, ttl_seconds=60)
+        cache.set("a", "".join(["vari", "ant"]), True, True)
+        cache.set("b", "".join(["var", "iant"]), True, True)
+        
+        first, second = cache.get("a")[0], cache.get("b")[0]
+        assert not hasattr(first, "__dict__")
+        assert first.value is second.value
+        assert first.deadline - first.stored_at == pytest.approx(60)
+        assert first.expires_at == pytest.approx(time.time() + 60, abs=1)
+    
+    def test_miss(self):
+        """Test lookup of an unknown key."""
+        cache = LRUCache(max_size=10, ttl_seconds=60)
+        entry, hit = cache.get("missing")
+        assert entry is None
+        assert hit is False
+    
+    def test_evicts_least_recently_used(self):
+        """Test that the cache does not grow past max_size."""
+        cache = LRUCache(max_size=2, ttl_seconds=60)
+        cache.set("a", "A", True, True)
+        cache.set("b", "B", True, True)
+        cache.get("a")
+        cache.set("c", "C", True, True)
+        
+        assert cache.size() == 2
+        assert cache.get("a")[1] is True
+        assert cache.get("b")[1] is False
+    
+    def test_expired_entry_is_a_miss(self):
+        """Test that entries past their TTL are not returned."""
+        clock = FakeClock()
+        cache = LRUCache(max_size=10, ttl_seconds=5, clock=clock)
+        cache.set("a", "A", True, True)
+        clock.advance(5)
+        assert cache.get("a")[1] is True
+        clock.advance(0.001)
+        
+        assert cache.get("a") == (None, False)
+        assert cache.get_stale("a") == (None, False)
+    
+    def test_per_entry_ttl(self):
+        """Test that entries expire according to their own TTL."""
+        clock = FakeClock()
+        cache = LRUCache(max_size=10, ttl_seconds=60, clock=clock)
+        cache.set("short", "A", True, True, ttl=1)
+        cache.set("long", "B", True, True)
+        clock.advance(2)
+        
+        assert cache.get("short") == (None, False)
+        entry, hit = cache.get("long")
+        assert hit is True
+        assert entry.value == "B"
+    
+    def test_get_stale_within_window(self):
+        """Test that expired entries are served as stale within the window."""
+        clock = FakeClock()
+        cache = LRUCache(max_size=10, ttl_seconds=1, stale_seconds=60, clock=clock)
+        cache.set("a", "A", True, True)
+        
+        entry, stale = cache.get_stale("a")
+        assert entry.value == "A"
+        assert stale is False
+        
+        clock.advance(2)
+        assert cache.get("a") == (None, False)
+        entry, stale = cache.get_stale("a")
+        assert entry.value == "A"
+        assert stale is True
+        
+        clock.advance(60)
+        assert cache.get_stale("a") == (None, False)
+    
+    def test_stats(self):
+        """Test hit, miss, eviction and expiration counters."""
+        clock = FakeClock()
+        cache = LRUCache(max_size=2, ttl_seconds=60, clock=clock)
+        cache.set("a", "A", True, True)
+        clock.advance(3)
+        cache.get("a")
+        cache.get("missing")
+        cache.set("b", "B", True, True)
+        cache.set("c", "C", True, True)
+        cache.set("short", "S", True, True, ttl=1)
+        clock.advance(2)
+        cache.get_stale("short")
+        
+        stats = cache.stats()
+        assert stats.hits == 1
+        assert stats.misses == 2
+        assert stats.evictions == 2
+        assert stats.expirations == 1
+        assert stats.size == 1
+        assert stats.max_size == 2
+        assert stats.hit_ratio == pytest.approx(1 / 3)
+        assert stats.average_entry_age == 3.0
+
+
+class TestTinyLFUPolicy:
+    """Test cases for the tinylfu cache policy."""
+    
+    def test_set_and_get(self):
+        """Test storing and retrieving an entry."""
+        cache = LRUCache(max_size=10, ttl_seconds=60, policy="tinylfu")
+        cache.set("feature:abc", "A", True, True)
+        
+        entry, hit = cache.get("feature:abc")
+        assert hit is True
+        assert entry.value == "A"
+    
+    def test_hot_keys_survive_one_off_scan(self):
+        """Test that a stream of one-off keys does not flush frequently used ones."""
+        cache = LRUCache(max_size=100, ttl_seconds=60, policy="tinylfu")
+        hot = [f"hot:{i}" for i in range(50)]
+        for _ in range(5):
+            for key in hot:
+                if not cache.get(key)[1]:
+                    cache.set(key, key, True, True)
+        
+        for i in range(1000):
+            cache.set(f"scan:{i}", "x", True, True)
+        
+        assert cache.size() <= 100
+        # Plain LRU would keep none of them; the sketch is approximate, so
+        # allow a hash collision to cost a key or two
+        assert sum(cache.get(key)[1] for key in hot) >= 45
+        assert cache.stats().evictions > 0
+    
+    def test_expired_entry_is_a_miss(self):
+        """Test that entries past their TTL are not returned."""
+        clock = FakeClock()
+        cache = LRUCache(max_size=10, ttl_seconds=1, policy="tinylfu", clock=clock)
+        cache.set("a", "A", True, True)
+        clock.advance(2)
+        
+        assert cache.get("a")[1] is False
+        assert cache.size() == 0
+    
+    def test_unknown_policy(self):
+        """Test that an unknown policy is rejected."""
+        with pytest.raises(ValueError):
+            LRUCache(max_size=10, ttl_seconds=60, policy="fifo")
+
+
+class TestByteBudget:
+    """Test cases for caches bounded by memory instead of entry count."""
+    
+    @pytest.mark.parametrize("policy", ["lru", "tinylfu"])
+    def test_stays_within_budget(self, policy):
+        """Test that large values are evicted to stay under max_bytes."""
+        cache = LRUCache(max_size=10, ttl_seconds=60, policy=policy, max_bytes=64 * 1024)
+        payload = "x" * 4096
+        for i in range(100):
+            cache.set(f"feature:{i}", payload + str(i), True, True)
+        
+        assert cache.size_bytes() <= 64 * 1024
+        assert 10 < cache.size() < 16
+        stats = cache.stats()
+        assert stats.bytes == cache.size_bytes()
+        assert stats.max_bytes == 64 * 1024
+        assert stats.evictions > 0
+    
+    @pytest.mark.parametrize("policy", ["lru", "tinylfu"])
+    def test_value_larger_than_budget_is_not_cached(self, policy):
+        """Test that a value that can never fit is skipped, replacing an older entry."""
+        cache = LRUCache(max_size=10, ttl_seconds=60, policy=policy, max_bytes=4096)
+        cache.set("a", "small", True, True)
+        cache.set("a", "x" * 8192, True, True)
+        
+        assert cache.get("a")[1] is False
+        assert cache.size_bytes() == 0
+    
+    def test_size_tracks_replacements(self):
+        """Test that replacing a value updates the byte count."""
+        cache = LRUCache(max_size=10, ttl_seconds=60, max_bytes=64 * 1024)
+        cache.set("a", "x" * 1000, True, True)
+        before = cache.size_bytes()
+        cache.set("a", "x" * 2000, True, True)
+        
+        assert cache.size_bytes() == before + 1000
+    
+    def test_sharded_budget_is_split(self):
+        """Test that the budget is divided between shards."""
+        cache = ShardedLRUCache(max_size=10, ttl_seconds=60, shards=4, max_bytes=64 * 1024)
+        for i in range(200):
+            cache.set(f"feature:{i}", "x" * 1024, True, True)
+        
+        assert cache.size_bytes() <= 64 * 1024
+        assert cache.stats().max_bytes == 64 * 1024
+
+
+class TestShardedLRUCache:
+    """Test cases for the ShardedLRUCache class."""
+    
+    def test_set_and_get(self):
+        """Test storing and retrieving entries across shards."""
+        # Each shard holds 50 entries, so no split of 50 keys evicts any
+        cache = ShardedLRUCache(max_size=400, ttl_seconds=60, shards=8)
+        for i in range(50):
+            cache.set(f"feature:{i}", str(i), True, True)
+        
+        for i in range(50):
+            entry, hit = cache.get(f"feature:{i}")
+            assert hit is True
+            assert entry.value == str(i)
+        assert cache.size() == 50
+        
+        cache.clear()
+        assert cache.size() == 0
+    
+    def test_capacity_is_split_between_shards(self):
+        """Test that the total capacity covers max_size."""
+        cache = ShardedLRUCache(max_size=100, ttl_seconds=60, shards=8)
+        assert cache.shard_count() == 8
+        assert cache.max_size() >= 100
+    
+    def test_stays_within_capacity(self):
+        """Test that a full cache holds at most its capacity and evicts the rest."""
+        cache = ShardedLRUCache(max_size=100, ttl_seconds=60, shards=8)
+        for i in range(1000):
+            cache.set(f"feature:{i}", str(i), True, True)
+        
+        assert cache.size() <= cache.max_size()
+        assert cache.size() + cache.stats().evictions == 1000
+    
+    def test_shard_choice_is_stable(self):
+        """Test that keys are split by crc32, independent of the hash seed."""
+        cache = ShardedLRUCache(max_size=100, ttl_seconds=60, shards=8)
+        for key in ("feature:1", "new_ui:abc", ""):
+            assert cache._shard(key) is cache._shards[zlib.crc32(key.encode()) % 8]
+    
+    def test_set_many_then_get(self):
+        """Test that batch writes land in the shards single reads use."""
+        cache = ShardedLRUCache(max_size=400, ttl_seconds=60, shards=8)
+        cache.set_many([(f"feature:{i}", str(i), True, True, None) for i in range(50)])
+        
+        for i in range(50):
+            entry, hit = cache.get(f"feature:{i}")
+            assert hit is True
+            assert entry.value == str(i)
+        assert cache.size() == 50
+    
+    def test_set_then_get_many(self):
+        """Test that batch reads look in the shards single writes use."""
+        cache = ShardedLRUCache(max_size=400, ttl_seconds=60, shards=8)
+        for i in range(50):
+            cache.set(f"feature:{i}", str(i), True, True)
+        
+        found = cache.get_many([f"feature:{i}" for i in range(50)])
+        assert {key: entry.value for key, (entry, _) in found.items()} == {
+            f"feature:{i}": str(i) for i in range(50)
+        }
+    
+    def test_set_many_then_get_many(self):
+        """Test that batch writes and batch reads agree on shards."""
+        cache = ShardedLRUCache(max_size=400, ttl_seconds=60, shards=8)
+        cache.set_many([(f"feature:{i}", str(i), True, True, None) for i in range(50)])
+        cache.set("feature:0", "updated", True, True)
+        
+        found = cache.get_many([f"feature:{i}" for i in range(50)] + ["missing"])
+        assert len(found) == 50
+        assert found["feature:0"][0].value == "updated"
+        assert cache.size() == 50
+    
+    def test_stats_are_merged(self):
+        """Test that shard counters are summed."""
+        cache = ShardedLRUCache(max_size=100, ttl_seconds=60, shards=4)
+        for i in range(10):
+            cache.set(f"feature:{i}", str(i), True, True)
+            cache.get(f"feature:{i}")
+            cache.get(f"other:{i}")
+        
+        stats = cache.stats()
+        assert stats.hits == 10
+        assert stats.misses == 10
+        assert stats.size == 10
+        assert stats.max_size == 100
+    
+    def test_invalid_shard_count(self):
+        """Test that at least one shard is required."""
+        with pytest.raises(ValueError):
+            ShardedLRUCache(max_size=10, ttl_seconds=60, shards=0)
+    
+    @pytest.mark.parametrize("cache_factory", [
+        lambda: LRUCache(max_size=256, ttl_seconds=60),
+        lambda: ShardedLRUCache(max_size=256, ttl_seconds=60, shards=16),
+        lambda: LRUCache(max_size=256, ttl_seconds=60, policy="tinylfu"),
+    ])
+    def test_concurrent_access(self, cache_factory):
+        """Stress the cache from many threads at once."""
+        cache = cache_factory()
+        errors = []
+        start = threading.Barrier(32)
+        
+        def worker(worker_id):
+            try:
+                start.wait()
+                for i in range(2000):
+                    key = f"feature:{(worker_id * 7 + i) % 512}"
+                    cache.set(key, key, True, True)
+                    entry, hit = cache.get(key)
+                    if hit and entry.value != key:
+                        errors.append(f"{key} returned {entry.value}")
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(repr(e))
+        
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(32)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert errors == []
+        assert cache.size() <= cache.max_size()
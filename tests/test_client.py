@@ -1,9 +1,15 @@
 """Tests for the main client functionality."""
 
+import threading
+import time
+
 import pytest
 from unittest.mock import Mock, patch
 
-from togglr import Client, ClientConfig, RequestContext
+from togglr import Client, ClientConfig, RequestContext, TrackEvent
+from togglr.cache import LRUCache
+from togglr_client.exceptions import ApiException
+from togglr_client.models.evaluate_response import EvaluateResponse
 from togglr.errors import TogglrError, FeatureNotFoundError
 
 
@@ -216,6 +222,95 @@ class TestClient:
         assert mock_config.assert_hostname is False
         assert mock_config.tls_server_name == "api.example.com"
     
+    @patch('togglr.client.Configuration')
+    @patch('togglr.client.ApiClient')
+    @patch('togglr.client.DefaultApi')
+    def test_client_transport_limits(self, mock_api_class, mock_api_client_class, mock_config_class):
+        """Test that the pool size and timeouts reach the generated client."""
+        mock_config = Mock()
+        mock_config_class.return_value = mock_config
+        mock_api = Mock()
+        mock_api_class.return_value = mock_api
+        mock_api.sdk_v1_features_feature_key_evaluate_post.return_value = EvaluateResponse(
+            feature_key="test_feature", enabled=True, value="A"
+        )
+        
+        config = ClientConfig.default("test-api-key").with_timeout(0.5).with_max_connections(20)
+        client = Client(config)
+        client.evaluate("test_feature", RequestContext.new())
+        client.health_check()
+        
+        assert mock_config.connection_pool_maxsize == 20
+        kwargs = mock_api.sdk_v1_features_feature_key_evaluate_post.call_args.kwargs
+        assert kwargs["_request_timeout"] == 0.5
+        assert mock_api.sdk_v1_health_get.call_args.kwargs["_request_timeout"] == 0.5
+        
+        config = ClientConfig.default("test-api-key").with_timeout(0.5).with_connect_timeout(0.1)
+        client = Client(config)
+        client.evaluate("test_feature", RequestContext.new())
+        kwargs = mock_api.sdk_v1_features_feature_key_evaluate_post.call_args.kwargs
+        assert kwargs["_request_timeout"] == (0.1, 0.5)
+    
+    @patch('togglr.client.DefaultApi')
+    def test_deadline_caps_retries(self, mock_api_class):
+        """Test that retries stop at the deadline and attempts get the remaining time."""
+        mock_api = Mock()
+        mock_api_class.return_value = mock_api
+        timeouts = []
+        
+        def evaluate(**kwargs):
+            timeouts.append(kwargs["_request_timeout"])
+            time.sleep(min(0.02, kwargs["_request_timeout"]))
+            raise ApiException(status=503)
+        
+        mock_api.sdk_v1_features_feature_key_evaluate_post.side_effect = evaluate
+        config = ClientConfig.default("test-api-key").with_timeout(0.5) \
+            .with_retries(10).with_backoff(base_delay=0.01, factor=1.0)
+        client = Client(config)
+        
+        started = time.monotonic()
+        with pytest.raises(TogglrError):
+            client.evaluate("test_feature", RequestContext.new(), deadline=0.1)
+        elapsed = time.monotonic() - started
+        
+        assert elapsed < 0.15
+        assert 1 < len(timeouts) < 11
+        assert timeouts[0] <= 0.1
+        assert timeouts == sorted(timeouts, reverse=True)
+    
+    @patch('togglr.client.DefaultApi')
+    def test_deadline_from_config(self, mock_api_class):
+        """Test that config.deadline applies when no deadline is passed."""
+        mock_api = Mock()
+        mock_api_class.return_value = mock_api
+        
+        config = ClientConfig.default("test-api-key").with_timeout(0.5).with_deadline(0.2)
+        client = Client(config)
+        client.track_event("test_feature", TrackEvent.new("A", "success"))
+        
+        kwargs = mock_api.track_feature_event.call_args.kwargs
+        assert 0 < kwargs["_request_timeout"] <= 0.2
+        
+        client.track_event("test_feature", TrackEvent.new("A", "success"), deadline=1.0)
+        assert mock_api.track_feature_event.call_args.kwargs["_request_timeout"] == 0.5
+    
+    @patch('togglr.client.DefaultApi')
+    def test_no_retry_without_time_for_it(self, mock_api_class):
+        """Test that a retry whose backoff would overrun the deadline is skipped."""
+        mock_api = Mock()
+        mock_api_class.return_value = mock_api
+        mock_api.get_feature_health.side_effect = ApiException(status=500)
+        
+        config = ClientConfig.default("test-api-key").with_backoff(base_delay=1.0)
+        client = Client(config)
+        
+        started = time.monotonic()
+        with pytest.raises(TogglrError):
+            client.get_feature_health("test_feature", deadline=0.2)
+        
+        assert time.monotonic() - started < 0.2
+        assert mock_api.get_feature_health.call_count == 1
+    
     @patch('togglr.client.Configuration')
     @patch('togglr.client.ApiClient')
     @patch('togglr.client.DefaultApi')
@@ -262,4 +357,385 @@ class TestClient:
         assert mock_config.key_file == "/path/to/key.pem"
         assert mock_config.ca_cert_data == "-----BEGIN CERTIFICATE-----\nMII...\n-----END CERTIFICATE-----"
         assert mock_config.assert_hostname is False
-        assert mock_config.tls_server_name == "api.example.com"
\ No newline at end of file
+        assert mock_config.tls_server_name == "api.example.com"
+    
+    @patch('togglr.client.DefaultApi')
+    def test_evaluate_uses_cache(self, mock_api_class):
+        """Test that repeated evaluations are served from the cache."""
+        mock_api = Mock()
+        mock_api_class.return_value = mock_api
+        mock_api.sdk_v1_features_feature_key_evaluate_post.return_value = EvaluateResponse(
+            feature_key="test_feature", enabled=True, value="A"
+        )
+        
+        config = ClientConfig.default("test-api-key").with_cache(enabled=True, max_size=10, ttl_seconds=60)
+        client = Client(config)
+        
+        context = RequestContext.new().with_user_id("user123")
+        assert client.evaluate("test_feature", context) == ("A", True, True)
+        assert client.evaluate("test_feature", context) == ("A", True, True)
+        
+        other = RequestContext.new().with_user_id("user456")
+        assert client.evaluate("test_feature", other) == ("A", True, True)
+        
+        assert mock_api.sdk_v1_features_feature_key_evaluate_post.call_count == 2
+    
+    @patch('togglr.client.DefaultApi')
+    def test_evaluate_serves_stale_and_refreshes(self, mock_api_class):
+        """Test stale-while-revalidate caching."""
+        mock_api = Mock()
+        mock_api_class.return_value = mock_api
+        mock_api.sdk_v1_features_feature_key_evaluate_post.return_value = EvaluateResponse(
+            feature_key="test_feature", enabled=True, value="A"
+        )
+        
+        config = ClientConfig.default("test-api-key") \
+            .with_cache(enabled=True, max_size=10, ttl_seconds=0.05) \
+            .with_stale_while_revalidate(stale_seconds=60)
+        client = Client(config)
+        context = RequestContext.new().with_user_id("user123")
+        
+        assert client.evaluate("test_feature", context) == ("A", True, True)
+        time.sleep(0.1)
+        
+        mock_api.sdk_v1_features_feature_key_evaluate_post.return_value = EvaluateResponse(
+            feature_key="test_feature", enabled=False, value="B"
+        )
+        # Expired entry is returned immediately while the refresh runs
+        assert client.evaluate("test_feature", context) == ("A", True, True)
+        
+        client._refresher.close(wait=True)
+        assert client.evaluate("test_feature", context) == ("B", False, True)
+        assert mock_api.sdk_v1_features_feature_key_evaluate_post.call_count == 2
+        client.close()
+    
+    @patch('togglr.client.DefaultApi')
+    def test_ttl_jitter(self, mock_api_class):
+        """Test that entries stored together get different TTLs within the jitter range."""
+        mock_api = Mock()
+        mock_api_class.return_value = mock_api
+        mock_api.sdk_v1_features_feature_key_evaluate_post.return_value = EvaluateResponse(
+            feature_key="test_feature", enabled=True, value="A"
+        )
+        
+        config = ClientConfig.default("test-api-key") \
+            .with_cache(enabled=True, max_size=100, ttl_seconds=10) \
+            .with_ttl_jitter(0.2)
+        client = Client(config)
+        for i in range(20):
+            client.evaluate("test_feature", RequestContext.new().with_user_id(f"user{i}"))
+        
+        ttls = [entry.deadline - entry.stored_at for _, entry, _ in client._cache.items()]
+        assert len(ttls) == 20
+        assert all(8.0 <= ttl <= 10.0 for ttl in ttls)
+        assert len(set(ttls)) > 1
+        client.close()
+    
+    @patch('togglr.client.DefaultApi')
+    def test_early_refresh(self, mock_api_class):
+        """Test that live entries are refreshed in the background when a refresh is due."""
+        mock_api = Mock()
+        mock_api_class.return_value = mock_api
+        mock_api.sdk_v1_features_feature_key_evaluate_post.return_value = EvaluateResponse(
+            feature_key="test_feature", enabled=True, value="A"
+        )
+        
+        config = ClientConfig.default("test-api-key") \
+            .with_cache(enabled=True, max_size=10, ttl_seconds=60) \
+            .with_early_refresh(beta=1.0)
+        client = Client(config)
+        context = RequestContext.new().with_user_id("user123")
+        client.evaluate("test_feature", context)
+        
+        # Remote evaluations are far faster than the TTL: no early refresh
+        client._fetch_latency = 0.001
+        assert client.evaluate("test_feature", context) == ("A", True, True)
+        assert client._refresher.pending() == 0
+        
+        # Evaluations as slow as the TTL: the entry is refreshed while still served
+        client._fetch_latency = 1e9
+        mock_api.sdk_v1_features_feature_key_evaluate_post.return_value = EvaluateResponse(
+            feature_key="test_feature", enabled=False, value="B"
+        )
+        assert client.evaluate("test_feature", context) == ("A", True, True)
+        client._refresher.close(wait=True)
+        assert mock_api.sdk_v1_features_feature_key_evaluate_post.call_count == 2
+        assert client._cache.get(client._get_cache_key("test_feature", context))[0].value == "B"
+        client.close()
+    
+    @patch('togglr.client.random.random', return_value=0.5)
+    @patch('togglr.client.DefaultApi')
+    def test_early_refresh_uses_cache_clock(self, mock_api_class, _random):
+        """Test that the early refresh decision reads the cache's injected clock."""
+        now = [1000.0]
+        cache = LRUCache(max_size=10, ttl_seconds=60, clock=lambda: now[0])
+        config = ClientConfig.default("test-api-key").with_cache().with_cache_backend(cache).with_early_refresh(beta=1.0)
+        client = Client(config)
+        client._fetch_latency = 0.01
+        cache.set("key", "A", True, True)
+        entry = cache.get("key")[0]
+        
+        assert client._should_refresh_early(entry) is False
+        now[0] += 59.999
+        assert client._should_refresh_early(entry) is True
+        client.close()
+    
+    @patch('togglr.client.DefaultApi')
+    def test_custom_cache_backend(self, mock_api_class):
+        """Test that a custom backend object is used in place of the built-in cache."""
+        mock_api = Mock()
+        mock_api_class.return_value = mock_api
+        mock_api.sdk_v1_features_feature_key_evaluate_post.return_value = EvaluateResponse(
+            feature_key="test_feature", enabled=True, value="A"
+        )
+        backend = LRUCache(max_size=10, ttl_seconds=60)
+        
+        config = ClientConfig.default("test-api-key") \
+            .with_cache(enabled=True) \
+            .with_cache_backend(backend)
+        client = Client(config)
+        context = RequestContext.new().with_user_id("user123")
+        client.evaluate("test_feature", context)
+        
+        assert client._cache is backend
+        assert backend.get(client._get_cache_key("test_feature", context))[0].value == "A"
+        client.close()
+    
+    @patch('togglr.client.DefaultApi')
+    def test_concurrent_evaluations_are_coalesced(self, mock_api_class):
+        """Test that identical in-flight evaluations share one request."""
+        mock_api = Mock()
+        mock_api_class.return_value = mock_api
+        release = threading.Event()
+        
+        def slow_evaluate(**kwargs):
+            release.wait(5)
+            return EvaluateResponse(feature_key="test_feature", enabled=True, value="A")
+        
+        mock_api.sdk_v1_features_feature_key_evaluate_post.side_effect = slow_evaluate
+        client = Client(ClientConfig.default("test-api-key"))
+        context = RequestContext.new().with_user_id("user123")
+        
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(client.evaluate("test_feature", context)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        while client.singleflight_stats().coalesced < 4:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+        
+        assert results == [("A", True, True)] * 5
+        assert mock_api.sdk_v1_features_feature_key_evaluate_post.call_count == 1
+        assert client.singleflight_stats().calls == 1
+    
+    @patch('togglr.client.DefaultApi')
+    def test_negative_cache(self, mock_api_class):
+        """Test that not-found features are cached per key, apart from real entries."""
+        mock_api = Mock()
+        mock_api_class.return_value = mock_api
+        mock_api.sdk_v1_features_feature_key_evaluate_post.side_effect = ApiException(status=404)
+        
+        config = ClientConfig.default("test-api-key") \
+            .with_cache(enabled=True, max_size=10, ttl_seconds=60) \
+            .with_negative_cache(ttl_seconds=30, max_size=5)
+        client = Client(config)
+        
+        first = RequestContext.new().with_user_id("user123")
+        second = RequestContext.new().with_user_id("user456")
+        assert client.evaluate("missing_feature", first) == ("", False, False)
+        assert client.evaluate("missing_feature", second) == ("", False, False)
+        
+        assert mock_api.sdk_v1_features_feature_key_evaluate_post.call_count == 1
+        assert client._cache.size() == 0
+        assert client._negative_cache.size() == 1
+    
+    @patch('togglr.client.DefaultApi')
+    def test_cache_stats(self, mock_api_class):
+        """Test cache statistics and pushing them to the metrics object."""
+        mock_api = Mock()
+        mock_api_class.return_value = mock_api
+        mock_api.sdk_v1_features_feature_key_evaluate_post.return_value = EvaluateResponse(
+            feature_key="test_feature", enabled=True, value="A"
+        )
+        metrics = Mock()
+        
+        config = ClientConfig.default("test-api-key") \
+            .with_cache(enabled=True, max_size=10, ttl_seconds=60) \
+            .with_metrics(metrics)
+        config.cache.stats_interval_seconds = 60
+        client = Client(config)
+        context = RequestContext.new().with_user_id("user123")
+        
+        for _ in range(3):
+            client.evaluate("test_feature", context)
+        
+        stats = client.cache_stats()
+        assert stats.hits == 2
+        assert stats.misses == 1
+        assert stats.size == 1
+        assert stats.coalesced == 0
+        
+        client._stats_reporter.report()
+        metrics.record_cache_stats.assert_called_once()
+        assert metrics.record_cache_stats.call_args[0][0].hits == 2
+        client.close()
+    
+    @patch('togglr.client.DefaultApi')
+    def test_warm(self, mock_api_class):
+        """Test prewarming the cache with a per-pair report."""
+        mock_api = Mock()
+        mock_api_class.return_value = mock_api
+        
+        def evaluate(feature_key, request_body, **kwargs):
+            if feature_key == "broken_feature":
+                raise ApiException(status=400)
+            return EvaluateResponse(feature_key=feature_key, enabled=True, value="A")
+        
+        mock_api.sdk_v1_features_feature_key_evaluate_post.side_effect = evaluate
+        config = ClientConfig.default("test-api-key").with_cache(enabled=True, max_size=10, ttl_seconds=60)
+        client = Client(config)
+        
+        pairs = [
+            ("feature_a", RequestContext.new().with_user_id("user1")),
+            ("broken_feature", RequestContext.new().with_user_id("user1")),
+            ("feature_b", RequestContext.new().with_user_id("user2")),
+        ]
+        report = client.warm(pairs, concurrency=4)
+        
+        assert [result.feature_key for result in report] == ["feature_a", "broken_feature", "feature_b"]
+        assert [result.ok for result in report] == [True, False, True]
+        assert report[0].value == "A"
+        assert isinstance(report[1].error, TogglrError)
+        assert client._cache.size() == 2
+        
+        calls = mock_api.sdk_v1_features_feature_key_evaluate_post.call_count
+        client.evaluate("feature_a", pairs[0][1])
+        assert mock_api.sdk_v1_features_feature_key_evaluate_post.call_count == calls
+    
+    @patch('togglr.client.DefaultApi')
+    def test_evaluate_many(self, mock_api_class):
+        """Test that hits come from the cache and misses are fetched concurrently."""
+        mock_api = Mock()
+        mock_api_class.return_value = mock_api
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+        
+        def evaluate(feature_key, request_body, **kwargs):
+            with lock:
+                in_flight.append(feature_key)
+                peak.append(len(in_flight))
+            time.sleep(0.05)
+            with lock:
+                in_flight.remove(feature_key)
+            if feature_key == "missing":
+                raise ApiException(status=404)
+            return EvaluateResponse(feature_key=feature_key, enabled=True, value="A")
+        
+        mock_api.sdk_v1_features_feature_key_evaluate_post.side_effect = evaluate
+        config = ClientConfig.default("test-api-key").with_cache(enabled=True, max_size=100, ttl_seconds=60)
+        client = Client(config)
+        context = RequestContext.new().with_user_id("user1")
+        client._cache.set(client._get_cache_key("cached", context), "B", False, True)
+        
+        keys = ["cached"] + [f"feature_{i}" for i in range(10)] + ["missing", "cached"]
+        started = time.monotonic()
+        results = client.evaluate_many(keys, context)
+        elapsed = time.monotonic() - started
+        
+        assert list(results) == ["cached"] + [f"feature_{i}" for i in range(10)] + ["missing"]
+        assert results["cached"] == ("B", False, True)
+        assert results["feature_3"] == ("A", True, True)
+        assert results["missing"] == ("", False, False)
+        assert mock_api.sdk_v1_features_feature_key_evaluate_post.call_count == 11
+        assert max(peak) > 1
+        assert elapsed < 0.05 * 11
+        
+        # Everything is cached now
+        client.evaluate_many(keys, context)
+        assert mock_api.sdk_v1_features_feature_key_evaluate_post.call_count == 11
+        client.close()
+    
+    @patch('togglr.client.DefaultApi')
+    def test_evaluate_many_raises_after_all_finish(self, mock_api_class):
+        """Test that a failed evaluation is raised and the others are still cached."""
+        mock_api = Mock()
+        mock_api_class.return_value = mock_api
+        
+        def evaluate(feature_key, request_body, **kwargs):
+            if feature_key == "broken":
+                raise ApiException(status=401)
+            return EvaluateResponse(feature_key=feature_key, enabled=True, value="A")
+        
+        mock_api.sdk_v1_features_feature_key_evaluate_post.side_effect = evaluate
+        config = ClientConfig.default("test-api-key").with_cache(enabled=True, max_size=100, ttl_seconds=60)
+        client = Client(config)
+        
+        with pytest.raises(TogglrError):
+            client.evaluate_many(["a", "broken", "b"], RequestContext.new())
+        assert client._cache.size() == 2
+        client.close()
+    
+    @patch('togglr.client.DefaultApi')
+    def test_evaluate_batch(self, mock_api_class):
+        """Test streaming, bounded concurrency and deduplication of a batch."""
+        mock_api = Mock()
+        mock_api_class.return_value = mock_api
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+        
+        def evaluate(feature_key, request_body, **kwargs):
+            with lock:
+                in_flight.append(1)
+                peak.append(len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.pop()
+            if request_body.get("user.id") == "bad":
+                raise ApiException(status=400)
+            return EvaluateResponse(feature_key=feature_key, enabled=True, value=request_body["user.id"])
+        
+        mock_api.sdk_v1_features_feature_key_evaluate_post.side_effect = evaluate
+        config = ClientConfig.default("test-api-key").with_cache(enabled=True, max_size=100, ttl_seconds=60)
+        client = Client(config)
+        
+        users = [f"user{i % 20}" for i in range(60)] + ["bad"]
+        contexts = (RequestContext.new().with_user_id(user) for user in users)
+        results = list(client.evaluate_batch("feature", contexts, concurrency=4))
+        
+        assert [result.value for result in results[:-1]] == users[:-1]
+        assert all(result.ok for result in results[:-1])
+        assert isinstance(results[-1].error, TogglrError)
+        assert mock_api.sdk_v1_features_feature_key_evaluate_post.call_count == 21
+        assert max(peak) <= 4
+        client.close()
+    
+    @patch('togglr.client.DefaultApi')
+    def test_evaluate_batch_is_lazy(self, mock_api_class):
+        """Test that contexts are consumed as results are taken."""
+        mock_api = Mock()
+        mock_api_class.return_value = mock_api
+        mock_api.sdk_v1_features_feature_key_evaluate_post.return_value = EvaluateResponse(
+            feature_key="feature", enabled=True, value="A"
+        )
+        client = Client(ClientConfig.default("test-api-key"))
+        consumed = []
+        
+        def contexts():
+            for i in range(1000):
+                consumed.append(i)
+                yield RequestContext.new().with_user_id(f"user{i}")
+        
+        batch = client.evaluate_batch("feature", contexts(), concurrency=2)
+        first = next(batch)
+        batch.close()
+        
+        assert first.value == "A"
+        assert len(consumed) < 20
+        client.close()
@@ -54,6 +54,18 @@ class TestCacheConfig:
         assert config.enabled is True
         assert config.max_size == 500
         assert config.ttl_seconds == 30.0
+    
+    def test_ttl_for(self):
+        """Test per-feature TTL overrides."""
+        config = CacheConfig(
+            ttl_seconds=30.0,
+            ttl_overrides={"kill_checkout": 1.0, "kill_*": 2.0, "config_*": 300.0, "config_ui_*": 60.0},
+        )
+        assert config.ttl_for("new_ui") == 30.0
+        assert config.ttl_for("kill_checkout") == 1.0
+        assert config.ttl_for("kill_search") == 2.0
+        assert config.ttl_for("config_limits") == 300.0
+        assert config.ttl_for("config_ui_theme") == 60.0
 
 
 class TestClientConfig:
@@ -88,6 +100,20 @@ class TestClientConfig:
         config = ClientConfig.default("test-api-key").with_retries(5)
         assert config.retries == 5
     
+    def test_with_deadline(self):
+        """Test setting the default per-call deadline."""
+        assert ClientConfig.default("test-api-key").deadline is None
+        config = ClientConfig.default("test-api-key").with_deadline(0.05)
+        assert config.deadline == 0.05
+    
+    def test_with_event_spool(self):
+        """Test that the event spool and event queue settings combine."""
+        config = ClientConfig.default("test-api-key").with_event_spool("/tmp/spool", replay_rate=10).with_event_queue(batch_size=5)
+        assert config.events.spool_path == "/tmp/spool"
+        assert config.events.spool_replay_rate == 10
+        assert config.events.enabled is True
+        assert config.events.batch_size == 5
+    
     def test_with_cache(self):
         """Test setting cache configuration."""
         config = ClientConfig.default("test-api-key").with_cache(enabled=True, max_size=1000, ttl_seconds=60)
@@ -96,6 +122,14 @@ class TestClientConfig:
         assert config.cache.max_size == 1000
         assert config.cache.ttl_seconds == 60
     
+    def test_with_ttl_override(self):
+        """Test setting per-feature TTL overrides."""
+        config = ClientConfig.default("test-api-key") \
+            .with_cache(enabled=True, ttl_seconds=60) \
+            .with_ttl_override("kill_*", 1.0)
+        assert config.cache.ttl_overrides == {"kill_*": 1.0}
+        assert config.cache.ttl_for("kill_switch") == 1.0
+    
     def test_with_backoff(self):
         """Test setting backoff configuration."""
         config = ClientConfig.default("test-api-key").with_backoff(base_delay=0.5, max_delay=10.0, factor=1.5)
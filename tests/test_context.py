@@ -117,3 +117,29 @@ class TestRequestContext:
         assert "RequestContext" in repr_str
         assert "user.id" in repr_str
         assert "user123" in repr_str
+    
+    def test_fingerprint_is_order_independent(self):
+        """Test that the fingerprint only depends on the contents."""
+        first = RequestContext.new().with_user_id("user123").with_country("US")
+        second = RequestContext.new().with_country("US").with_user_id("user123")
+        assert first.fingerprint() == second.fingerprint()
+        assert first.fingerprint() != RequestContext.new().fingerprint()
+    
+    def test_fingerprint_is_memoized(self):
+        """Test that the fingerprint is computed once."""
+        context = RequestContext.new().with_user_id("user123")
+        fingerprint = context.fingerprint()
+        assert context._fingerprint == fingerprint
+        assert context.fingerprint() is fingerprint
+    
+    def test_fingerprint_invalidated_on_change(self):
+        """Test that modifying the context changes the fingerprint."""
+        context = RequestContext.new().with_user_id("user123")
+        before = context.fingerprint()
+        
+        context.with_country("US")
+        after_with = context.fingerprint()
+        assert after_with != before
+        
+        context.set("custom", "value")
+        assert context.fingerprint() != after_with
@@ -0,0 +1,132 @@
+"""Tests for background delivery of track events."""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+from togglr import Client, ClientConfig, TrackEvent
+from togglr.events import EventQueue
+
+
+class Recorder:
+    """Collects sent events, optionally blocking or failing."""
+    
+    def __init__(self, fail_for=(), delay=0.0):
+        self.sent = []
+        self.fail_for = set(fail_for)
+        self.delay = delay
+        self.lock = threading.Lock()
+    
+    def __call__(self, feature_key, event):
+        if self.delay:
+            time.sleep(self.delay)
+        if feature_key in self.fail_for:
+            raise RuntimeError("server unavailable")
+        with self.lock:
+            self.sent.append((feature_key, event))
+
+
+class TestEventQueue:
+    """Test cases for the EventQueue class."""
+    
+    def test_flush_on_batch_size(self):
+        """Test that a full batch is sent without waiting for the interval."""
+        recorder = Recorder()
+        queue = EventQueue(recorder, batch_size=5, flush_interval_seconds=60)
+        for i in range(5):
+            assert queue.put("feature", TrackEvent.new(f"v{i}", "success"))
+        
+        for _ in range(100):
+            if len(recorder.sent) == 5:
+                break
+            time.sleep(0.01)
+        assert len(recorder.sent) == 5
+        queue.close()
+    
+    def test_flush_on_interval(self):
+        """Test that a partial batch is sent after the flush interval."""
+        recorder = Recorder()
+        queue = EventQueue(recorder, batch_size=100, flush_interval_seconds=0.05)
+        queue.put("feature", TrackEvent.new("A", "success"))
+        time.sleep(0.3)
+        
+        assert len(recorder.sent) == 1
+        queue.close()
+    
+    def test_flush_waits_for_delivery(self):
+        """Test that flush() returns once queued events are sent."""
+        recorder = Recorder(fail_for={"broken"})
+        queue = EventQueue(recorder, batch_size=100, flush_interval_seconds=60, workers=4)
+        for i in range(20):
+            queue.put("feature" if i % 5 else "broken", TrackEvent.new("A", "success"))
+        
+        assert queue.flush(timeout=5) is True
+        stats = queue.stats()
+        assert (stats.queued, stats.sent, stats.failed, stats.dropped) == (0, 16, 4, 0)
+        queue.close()
+    
+    def test_flush_timeout(self):
+        """Test that flush() gives up after its timeout."""
+        queue = EventQueue(Recorder(delay=0.5), flush_interval_seconds=60, workers=1)
+        queue.put("feature", TrackEvent.new("A", "success"))
+        
+        assert queue.flush(timeout=0.05) is False
+        assert queue.close() is True
+    
+    def test_full_queue_drops(self):
+        """Test that events beyond max_size are dropped instead of blocking."""
+        queue = EventQueue(Recorder(), max_size=3, batch_size=100, flush_interval_seconds=60)
+        results = [queue.put("feature", TrackEvent.new("A", "success")) for _ in range(5)]
+        
+        assert results == [True, True, True, False, False]
+        assert queue.stats().dropped == 2
+        queue.close()
+        assert queue.put("feature", TrackEvent.new("A", "success")) is False
+    
+    def test_close_drains(self):
+        """Test that close() sends everything still queued."""
+        recorder = Recorder()
+        queue = EventQueue(recorder, batch_size=100, flush_interval_seconds=60)
+        for _ in range(10):
+            queue.put("feature", TrackEvent.new("A", "success"))
+        
+        assert queue.close() is True
+        assert len(recorder.sent) == 10
+    
+    def test_events_are_snapshots(self):
+        """Test that later changes to an event do not affect the queued copy."""
+        recorder = Recorder()
+        queue = EventQueue(recorder, flush_interval_seconds=60)
+        event = TrackEvent.new("A", "success").with_context("user.id", "user1")
+        queue.put("feature", event)
+        event.with_context("user.id", "user2")
+        queue.close()
+        
+        sent = recorder.sent[0][1]
+        assert sent.context.to_dict() == {"user.id": "user1"}
+        assert sent.created_at is not None
+
+
+class TestClientEventQueue:
+    """Test cases for track_event() with the event queue enabled."""
+    
+    @patch('togglr.client.DefaultApi')
+    def test_track_event_is_queued(self, mock_api_class):
+        """Test that track_event() returns at once and close() delivers the events."""
+        mock_api = Mock()
+        mock_api_class.return_value = mock_api
+        mock_api.track_feature_event.side_effect = lambda **kwargs: time.sleep(0.05)
+        
+        config = ClientConfig.default("test-api-key").with_event_queue(batch_size=50, flush_interval_seconds=60)
+        client = Client(config)
+        started = time.monotonic()
+        for _ in range(10):
+            client.track_event("feature", TrackEvent.new("A", "success"))
+        assert time.monotonic() - started < 0.05
+        assert mock_api.track_feature_event.call_count == 0
+        
+        assert client.flush(timeout=5) is True
+        assert client.event_stats().sent == 10
+        client.track_event("feature", TrackEvent.new("A", "success"))
+        client.close()
+        assert mock_api.track_feature_event.call_count == 11
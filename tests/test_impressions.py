@@ -0,0 +1,127 @@
+"""Tests for impressions recorded from evaluations."""
+
+import time
+from unittest.mock import Mock, patch
+
+from togglr import Client, ClientConfig, RequestContext
+from togglr.impressions import SAMPLE_RATE_CONTEXT_KEY, ImpressionRecorder
+from togglr_client.models.evaluate_response import EvaluateResponse
+
+
+class TestImpressionRecorder:
+    """Test cases for the ImpressionRecorder class."""
+    
+    def test_records_impression(self):
+        """Test that an impression carries the value as variant key and the context."""
+        queued = []
+        recorder = ImpressionRecorder(lambda k, e: queued.append((k, e)))
+        context = RequestContext.new().with_user_id("user1").with_country("RU")
+        
+        assert recorder.record("new_ui", context, "B", True) is True
+        feature_key, event = queued[0]
+        assert feature_key == "new_ui"
+        assert (event.variant_key, event.event_type.value, event.reward) == ("B", "success", 0.0)
+        assert event.context.to_dict() == context.to_dict()
+    
+    def test_skips_not_found(self):
+        """Test that features that were not found or have no value are not recorded."""
+        queued = []
+        recorder = ImpressionRecorder(lambda k, e: queued.append(e))
+        assert recorder.record("missing", RequestContext.new(), "", False) is False
+        assert recorder.record("off", RequestContext.new(), "", True) is False
+        assert queued == []
+    
+    def test_dedup_per_user_feature_and_value(self):
+        """Test that repeats within the window are skipped."""
+        queued = []
+        recorder = ImpressionRecorder(lambda k, e: queued.append(e), dedup_window_seconds=0.1)
+        user1 = RequestContext.new().with_user_id("user1")
+        
+        assert recorder.record("new_ui", user1, "A", True)
+        assert not recorder.record("new_ui", RequestContext.new().with_user_id("user1").with_os("ios"), "A", True)
+        assert recorder.record("new_ui", user1, "B", True)
+        assert recorder.record("other", user1, "A", True)
+        assert recorder.record("new_ui", RequestContext.new().with_user_id("user2"), "A", True)
+        time.sleep(0.15)
+        assert recorder.record("new_ui", user1, "A", True)
+        
+        stats = recorder.stats()
+        assert (stats.recorded, stats.deduplicated) == (5, 1)
+    
+    def test_sampling(self):
+        """Test that sampled impressions are marked with the sample rate."""
+        queued = []
+        draws = iter([0.05, 0.5, 0.2])
+        recorder = ImpressionRecorder(
+            lambda k, e: queued.append(e), sample_rate=0.25, dedup_window_seconds=0, rand=lambda: next(draws)
+        )
+        for _ in range(3):
+            recorder.record("new_ui", RequestContext.new().with_user_id("user1"), "A", True)
+        
+        assert len(queued) == 2
+        assert queued[0].context.get(SAMPLE_RATE_CONTEXT_KEY) == 0.25
+        assert recorder.stats().sampled_out == 1
+
+
+class TestClientImpressions:
+    """Test cases for evaluate() with impressions enabled."""
+    
+    @patch('togglr.client.DefaultApi')
+    def test_evaluate_queues_impressions(self, mock_api_class):
+        """Test that evaluations record impressions that are sent in the background."""
+        mock_api = Mock()
+        mock_api_class.return_value = mock_api
+        mock_api.sdk_v1_features_feature_key_evaluate_post.return_value = EvaluateResponse(
+            feature_key="new_ui", enabled=True, value="A"
+        )
+        mock_api.track_feature_event.side_effect = lambda **kwargs: time.sleep(0.05)
+        
+        config = (
+            ClientConfig.default("test-api-key")
+            .with_cache(enabled=True, max_size=100, ttl_seconds=60)
+            .with_impressions()
+        )
+        client = Client(config)
+        started = time.monotonic()
+        for i in range(20):
+            client.evaluate("new_ui", RequestContext.new().with_user_id(f"user{i % 5}"))
+        client.evaluate_many(["new_ui"], RequestContext.new().with_user_id("user9"))
+        assert time.monotonic() - started < 0.05
+        assert mock_api.track_feature_event.call_count == 0
+        
+        assert client.flush(timeout=5) is True
+        assert mock_api.track_feature_event.call_count == 6
+        request = mock_api.track_feature_event.call_args_list[0].kwargs["track_request"]
+        assert (request["variant_key"], request["context"]) == ("A", {"user.id": "user0"})
+        stats = client.impression_stats()
+        assert (stats.recorded, stats.deduplicated) == (6, 15)
+        assert client.event_stats().sent == 6
+        client.close()
+    
+    @patch('togglr.client.DefaultApi')
+    def test_impressions_bypass_aggregation(self, mock_api_class):
+        """Test that each exposure is sent as its own event with event aggregation enabled."""
+        mock_api = Mock()
+        mock_api_class.return_value = mock_api
+        mock_api.sdk_v1_features_feature_key_evaluate_post.return_value = EvaluateResponse(
+            feature_key="new_ui", enabled=True, value="A"
+        )
+        
+        summaries = []
+        config = (
+            ClientConfig.default("test-api-key")
+            .with_event_aggregation(summaries.append, window_seconds=60)
+            .with_impressions(dedup_window_seconds=0)
+        )
+        client = Client(config)
+        for i in range(10):
+            client.evaluate("new_ui", RequestContext.new().with_user_id(f"user{i % 2}"))
+        
+        assert client.flush(timeout=5) is True
+        assert summaries == []
+        assert mock_api.track_feature_event.call_count == 10
+        requests = [call.kwargs["track_request"] for call in mock_api.track_feature_event.call_args_list]
+        assert all((r["variant_key"], r["reward"]) == ("A", 0.0) for r in requests)
+        assert client.impression_stats().recorded == 10
+        assert client.event_stats().aggregated == 0
+        client.close()
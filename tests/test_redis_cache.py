@@ -0,0 +1,257 @@
+"""Tests for the Redis-compatible cache backend and the tiered cache."""
+
+import fnmatch
+import socketserver
+import threading
+import time
+
+import pytest
+
+from togglr import Client, ClientConfig, RequestContext
+from togglr.cache import LRUCache, TieredCache
+from togglr.redis_cache import RedisCache
+
+
+class _RESPHandler(socketserver.StreamRequestHandler):
+    """Serves the subset of the RESP protocol used by RedisCache."""
+    
+    def handle(self):
+        while True:
+            command = self._read_command()
+            if command is None:
+                return
+            self.server.commands.append(command[0].upper())
+            self.wfile.write(self._dispatch(command))
+    
+    def _read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        args = []
+        for _ in range(int(line[1:])):
+            length = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+    
+    def _dispatch(self, command):
+        name, args = command[0].upper(), command[1:]
+        store = self.server.store
+        now = time.time()
+        for key in [k for k, (_, expires) in store.items() if expires is not None and expires <= now]:
+            del store[key]
+        
+        if self.server.garbage is not None:
+            return self.server.garbage
+        if name in (b"PING", b"SELECT"):
+            return b"+OK\r\n"
+        if name == b"SET":
+            expires = now + int(args[3]) / 1000 if len(args) > 3 and args[2].upper() == b"PX" else None
+            store[args[0]] = (args[1], expires)
+            return b"+OK\r\n"
+        if name == b"MGET":
+            reply = [b"*%d\r\n" % len(args)]
+            for key in args:
+                value = store.get(key)
+                reply.append(b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value[0]), value[0]))
+            return b"".join(reply)
+        if name == b"DEL":
+            return b":%d\r\n" % sum(store.pop(key, None) is not None for key in args)
+        if name == b"SCAN":
+            pattern = args[args.index(b"MATCH") + 1].decode()
+            keys = [key for key in store if fnmatch.fnmatchcase(key.decode(), pattern)]
+            return b"*2\r\n$1\r\n0\r\n*%d\r\n" % len(keys) + b"".join(
+                b"$%d\r\n%s\r\n" % (len(key), key) for key in keys
+            )
+        return b"-ERR unknown command\r\n"
+
+
+class _RESPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _RESPHandler)
+        self.store = {}
+        self.commands = []
+        self.garbage = None  # raw reply to send instead of answering
+
+
+@pytest.fixture
+def server():
+    server = _RESPServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server):
+    host, port = server.server_address
+    return f"redis://{host}:{port}/0"
+
+
+class TestRedisCache:
+    """Test cases for the RedisCache class."""
+    
+    def test_set_and_get(self, server):
+        """Test storing and retrieving an entry."""
+        cache = RedisCache(_url(server), ttl_seconds=60, key_prefix="test:")
+        cache.set("feature:abc", "A", True, True)
+        
+        entry, hit = cache.get("feature:abc")
+        assert hit is True
+        assert (entry.value, entry.enabled, entry.found) == ("A", True, True)
+        assert cache.get("feature:missing") == (None, False)
+        assert list(server.store) == [b"test:feature:abc"]
+        cache.close()
+    
+    def test_get_many_and_set_many_use_one_round_trip(self, server):
+        """Test that batches are sent as one MGET and pipelined SETs."""
+        cache = RedisCache(_url(server), ttl_seconds=60)
+        cache.set_many([("a", "A", True, True, None), ("b", "B", False, True, 5.0)])
+        found = cache.get_many(["a", "b", "c"])
+        
+        assert {key: entry.value for key, (entry, _) in found.items()} == {"a": "A", "b": "B"}
+        assert server.commands == [b"SET", b"SET", b"MGET"]
+        stats = cache.stats()
+        assert (stats.hits, stats.misses) == (2, 1)
+        cache.close()
+    
+    def test_stale_window(self, server):
+        """Test that expired entries are served as stale and then dropped by the server."""
+        cache = RedisCache(_url(server), ttl_seconds=0.05, stale_seconds=0.2)
+        cache.set("a", "A", True, True)
+        time.sleep(0.1)
+        
+        assert cache.get("a") == (None, False)
+        entry, stale = cache.get_stale("a")
+        assert entry.value == "A"
+        assert stale is True
+        
+        time.sleep(0.2)
+        assert cache.get_stale("a") == (None, False)
+        cache.close()
+    
+    def test_items_and_clear_stay_within_prefix(self, server):
+        """Test snapshots and clearing only touch this cache's keys."""
+        server.store[b"other:key"] = (b"x", None)
+        cache = RedisCache(_url(server), ttl_seconds=60, key_prefix="mine:")
+        cache.set("a", "A", True, True)
+        
+        assert [key for key, _, _ in cache.items()] == ["a"]
+        assert cache.size() == 1
+        cache.clear()
+        assert list(server.store) == [b"other:key"]
+        cache.close()
+    
+    def test_unreachable_server_is_a_miss(self):
+        """Test that server failures are counted instead of raised."""
+        cache = RedisCache("redis://127.0.0.1:1/0", ttl_seconds=60)
+        cache.set("a", "A", True, True)
+        
+        assert cache.get("a") == (None, False)
+        assert cache.stats().errors == 2
+    
+    def test_garbage_reply_is_a_miss(self, server):
+        """Test that malformed replies and foreign values are counted instead of raised."""
+        cache = RedisCache(_url(server), ttl_seconds=60, key_prefix="test:")
+        server.store[b"test:foreign"] = (b"x", None)
+        assert cache.get("foreign") == (None, False)
+        
+        server.garbage = b":not-a-number\r\n"
+        assert cache.get("a") == (None, False)
+        server.garbage = b"$3\r\nabc\r\n"
+        assert cache.get_many(["a", "b"]) == {}
+        server.garbage = None
+        cache.set("a", "A", True, True)
+        assert cache.get("a")[0].value == "A"
+        assert cache.stats().errors == 3
+        cache.close()
+    
+    def test_malformed_scan_reply(self, server):
+        """Test that SCAN replies of the wrong shape are counted instead of raised."""
+        cache = RedisCache(_url(server), ttl_seconds=60)
+        cache.set("a", "A", True, True)
+        
+        server.garbage = b":5\r\n"
+        assert cache.size() == 0
+        server.garbage = b"*1\r\n$1\r\n0\r\n"
+        cache.clear()
+        server.garbage = b"*2\r\n:0\r\n*0\r\n"
+        assert cache.items() == []
+        assert cache.stats().errors == 3
+        assert cache._pool == []
+        
+        server.garbage = None
+        assert cache.size() == 1
+        cache.close()
+    
+    def test_invalid_url(self):
+        """Test that unsupported URL schemes are rejected up front."""
+        with pytest.raises(ValueError):
+            RedisCache("http://localhost", ttl_seconds=60)
+
+
+class TestTieredCache:
+    """Test cases for the TieredCache class."""
+    
+    def test_l2_hits_are_promoted(self, server):
+        """Test that L1 misses are served from L2 and copied into L1."""
+        l2 = RedisCache(_url(server), ttl_seconds=60)
+        l2.set("a", "A", True, True)
+        cache = TieredCache(LRUCache(max_size=10, ttl_seconds=60), l2)
+        
+        entry, hit = cache.get("a")
+        assert hit is True
+        assert entry.value == "A"
+        server.commands.clear()
+        
+        assert cache.get("a")[0].value == "A"
+        assert server.commands == []
+        assert cache.stats().hits == 2
+        cache.close()
+    
+    def test_stale_l1_and_l2_hit_counted_once(self):
+        """Test that a lookup served by L2 after a stale L1 entry counts one hit."""
+        now = [1000.0]
+        l1 = LRUCache(max_size=10, ttl_seconds=10, stale_seconds=60, clock=lambda: now[0])
+        l2 = LRUCache(max_size=10, ttl_seconds=60)
+        cache = TieredCache(l1, l2)
+        l1.set("a", "old", True, True)
+        l1.set("b", "old", True, True)
+        l2.set("a", "new", True, True)
+        now[0] += 20
+        
+        entry, stale = cache.get_stale("a")
+        assert (entry.value, stale) == ("new", False)
+        assert cache.get_stale("b")[0].value == "old"
+        assert cache.get_many(["b"])["b"][1] is True
+        
+        stats = cache.stats()
+        assert (stats.hits, stats.stale_hits, stats.misses) == (3, 2, 0)
+    
+    def test_writes_go_to_both_levels(self, server):
+        """Test that set() stores in L1 and L2."""
+        l1 = LRUCache(max_size=10, ttl_seconds=60)
+        l2 = RedisCache(_url(server), ttl_seconds=60)
+        cache = TieredCache(l1, l2)
+        cache.set_many([("a", "A", True, True, None)])
+        
+        assert l1.get("a")[1] is True
+        assert l2.get("a")[1] is True
+        cache.close()
+    
+    def test_client_shares_results_through_redis(self, server):
+        """Test that two clients with a shared L2 reuse each other's evaluations."""
+        context = RequestContext.new().with_user_id("user1")
+        config = ClientConfig.default("key").with_cache(enabled=True, ttl_seconds=60) \
+            .with_redis_cache(_url(server), l1_max_size=100)
+        first = Client(config)
+        first._cache.set(first._get_cache_key("feature", context), "A", True, True)
+        
+        second = Client(config)
+        assert isinstance(second._cache, TieredCache)
+        assert second.evaluate("feature", context) == ("A", True, True)
+        first.close()
+        second.close()
@@ -0,0 +1,115 @@
+"""Tests for the shared-memory evaluation cache."""
+
+import multiprocessing
+import sys
+import time
+
+import pytest
+
+from togglr import Client, ClientConfig
+from togglr.shm_cache import SharedMemoryCache
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="requires POSIX")
+
+
+def _write_from_child(path):
+    cache = SharedMemoryCache(path, max_size=64, ttl_seconds=60)
+    cache.set("feature:child", "from-child", True, True)
+    cache.close()
+
+
+class TestSharedMemoryCache:
+    """Test cases for the SharedMemoryCache class."""
+    
+    def test_set_and_get(self, tmp_path):
+        """Test storing and retrieving an entry."""
+        cache = SharedMemoryCache(str(tmp_path / "cache"), max_size=64, ttl_seconds=60)
+        cache.set("feature:abc", "A", True, True)
+        
+        entry, hit = cache.get("feature:abc")
+        assert hit is True
+        assert (entry.value, entry.enabled, entry.found) == ("A", True, True)
+        assert cache.get("feature:missing") == (None, False)
+        assert cache.size() == 1
+        assert cache.max_size() == 64
+        
+        cache.clear()
+        assert cache.size() == 0
+        cache.close()
+    
+    def test_entries_are_shared_between_instances(self, tmp_path):
+        """Test that two mappings of the same file see the same entries."""
+        path = str(tmp_path / "cache")
+        first = SharedMemoryCache(path, max_size=64, ttl_seconds=60)
+        second = SharedMemoryCache(path, max_size=64, ttl_seconds=60)
+        
+        first.set("feature:abc", "A", False, True)
+        entry, hit = second.get("feature:abc")
+        assert hit is True
+        assert entry.value == "A"
+        assert entry.enabled is False
+        
+        first.close()
+        second.close()
+    
+    def test_entries_are_shared_between_processes(self, tmp_path):
+        """Test that entries written by another process are visible."""
+        path = str(tmp_path / "cache")
+        cache = SharedMemoryCache(path, max_size=64, ttl_seconds=60)
+        
+        process = multiprocessing.get_context("spawn").Process(target=_write_from_child, args=(path,))
+        process.start()
+        process.join(30)
+        assert process.exitcode == 0
+        
+        entry, hit = cache.get("feature:child")
+        assert hit is True
+        assert entry.value == "from-child"
+        cache.close()
+    
+    def test_capacity_is_bounded(self, tmp_path):
+        """Test that the cache never holds more than max_size entries."""
+        cache = SharedMemoryCache(str(tmp_path / "cache"), max_size=16, ttl_seconds=60, ways=4)
+        for i in range(200):
+            cache.set(f"feature:{i}", str(i), True, True)
+        
+        assert cache.size() <= 16
+        entry, hit = cache.get("feature:199")
+        assert hit is True
+        assert entry.value == "199"
+        cache.close()
+    
+    def test_oversized_values_are_not_cached(self, tmp_path):
+        """Test that values larger than a slot are skipped."""
+        cache = SharedMemoryCache(str(tmp_path / "cache"), max_size=8, ttl_seconds=60, slot_size=64)
+        cache.set("feature:big", "x" * 100, True, True)
+        assert cache.get("feature:big") == (None, False)
+        cache.close()
+    
+    def test_stale_window(self, tmp_path):
+        """Test that expired entries are served as stale within the window."""
+        cache = SharedMemoryCache(str(tmp_path / "cache"), max_size=8, ttl_seconds=0.05, stale_seconds=60)
+        cache.set("feature:abc", "A", True, True)
+        time.sleep(0.1)
+        
+        assert cache.get("feature:abc") == (None, False)
+        entry, stale = cache.get_stale("feature:abc")
+        assert entry.value == "A"
+        assert stale is True
+        cache.close()
+    
+    def test_layout_mismatch(self, tmp_path):
+        """Test that an existing region with another geometry is rejected."""
+        path = str(tmp_path / "cache")
+        SharedMemoryCache(path, max_size=64, ttl_seconds=60).close()
+        with pytest.raises(ValueError):
+            SharedMemoryCache(path, max_size=128, ttl_seconds=60)
+    
+    def test_client_backend(self, tmp_path):
+        """Test selecting the shared-memory backend from the configuration."""
+        config = ClientConfig.default("test-api-key") \
+            .with_cache(enabled=True, max_size=64, ttl_seconds=60) \
+            .with_shared_memory_cache(path=str(tmp_path / "cache"))
+        client = Client(config)
+        assert isinstance(client._cache, SharedMemoryCache)
+        client.close()
@@ -0,0 +1,79 @@
+"""Tests for coalescing of concurrent calls."""
+
+import threading
+import time
+
+from togglr.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test cases for the SingleFlight class."""
+    
+    def _run_concurrently(self, group, fn, callers=8):
+        """Call group.do from several threads while fn is blocked."""
+        results = []
+        errors = []
+        
+        def caller():
+            try:
+                results.append(group.do("key", fn))
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=caller) for _ in range(callers)]
+        for thread in threads:
+            thread.start()
+        return threads, results, errors
+    
+    def test_concurrent_calls_are_coalesced(self):
+        """Test that one call serves all concurrent callers."""
+        group = SingleFlight()
+        release = threading.Event()
+        calls = []
+        
+        def fn():
+            calls.append(1)
+            release.wait(5)
+            return "result"
+        
+        threads, results, errors = self._run_concurrently(group, fn)
+        while group.stats().calls + group.stats().coalesced < 8:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+        
+        assert errors == []
+        assert len(calls) == 1
+        assert sorted(shared for _, shared in results) == [False] + [True] * 7
+        assert all(result == "result" for result, _ in results)
+        assert group.stats().coalesced == 7
+        assert group.in_flight() == 0
+    
+    def test_exception_is_shared(self):
+        """Test that waiters receive the leader's exception."""
+        group = SingleFlight()
+        release = threading.Event()
+        
+        def fn():
+            release.wait(5)
+            raise ValueError("boom")
+        
+        threads, results, errors = self._run_concurrently(group, fn, callers=4)
+        while group.stats().calls + group.stats().coalesced < 4:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+        
+        assert results == []
+        assert len(errors) == 4
+        assert all(isinstance(e, ValueError) for e in errors)
+    
+    def test_sequential_calls_are_not_coalesced(self):
+        """Test that a finished call is not reused."""
+        group = SingleFlight()
+        assert group.do("key", lambda: 1) == (1, False)
+        assert group.do("key", lambda: 2) == (2, False)
+        assert group.stats().calls == 2
+        assert group.stats().coalesced == 0
@@ -0,0 +1,70 @@
+"""Tests for cache snapshots."""
+
+import time
+
+import pytest
+
+from togglr import Client, ClientConfig, RequestContext
+from togglr.cache import LRUCache
+from togglr.snapshot import load_snapshot, save_snapshot
+
+
+class TestSnapshot:
+    """Test cases for saving and loading cache snapshots."""
+    
+    def test_round_trip(self, tmp_path):
+        """Test that entries survive a save and load."""
+        path = str(tmp_path / "cache.snap")
+        source = LRUCache(max_size=10, ttl_seconds=60)
+        source.set("feature:a", "A", True, True)
+        source.set("feature:b", "", False, False)
+        
+        assert save_snapshot(source, path) == 2
+        
+        target = LRUCache(max_size=10, ttl_seconds=60)
+        assert load_snapshot(target, path) == 2
+        
+        entry, hit = target.get("feature:a")
+        assert hit is True
+        assert (entry.value, entry.enabled, entry.found) == ("A", True, True)
+        entry, hit = target.get("feature:b")
+        assert hit is True
+        assert (entry.value, entry.enabled, entry.found) == ("", False, False)
+    
+    def test_remaining_ttl_is_kept(self, tmp_path):
+        """Test that restored entries expire when the originals would have."""
+        path = str(tmp_path / "cache.snap")
+        source = LRUCache(max_size=10, ttl_seconds=0.2)
+        source.set("feature:a", "A", True, True)
+        save_snapshot(source, path)
+        
+        target = LRUCache(max_size=10, ttl_seconds=60)
+        load_snapshot(target, path)
+        assert target.get("feature:a")[1] is True
+        
+        time.sleep(0.3)
+        assert target.get("feature:a") == (None, False)
+        assert load_snapshot(LRUCache(max_size=10, ttl_seconds=60), path) == 0
+    
+    def test_invalid_file(self, tmp_path):
+        """Test that a file that is not a snapshot is rejected."""
+        path = tmp_path / "cache.snap"
+        path.write_bytes(b"not a snapshot")
+        with pytest.raises(ValueError):
+            load_snapshot(LRUCache(max_size=10, ttl_seconds=60), str(path))
+    
+    def test_client_warm_start(self, tmp_path):
+        """Test that a client saves its cache on close and the next one loads it."""
+        path = str(tmp_path / "cache.snap")
+        config = ClientConfig.default("test-api-key") \
+            .with_cache(enabled=True, max_size=10, ttl_seconds=60) \
+            .with_cache_snapshot(path)
+        context = RequestContext.new().with_user_id("user123")
+        
+        client = Client(config)
+        client._cache.set(client._get_cache_key("test_feature", context), "A", True, True)
+        client.close()
+        
+        restarted = Client(config)
+        assert restarted.evaluate("test_feature", context) == ("A", True, True)
+        restarted.close()
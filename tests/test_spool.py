@@ -0,0 +1,242 @@
+"""Tests for the disk spool of track events."""
+
+import os
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from togglr import Client, ClientConfig, TrackEvent
+from togglr.errors import InternalServerError, NotFoundError, TogglrError
+from togglr.spool import EventSpool, SpoolReplayer
+from togglr_client.exceptions import ApiException
+
+
+def replay_all(spool):
+    """Read and commit every pending record, returning (feature_key, event) pairs."""
+    records = spool.peek(1000)
+    for record in records:
+        spool.commit(record)
+    return [(r.feature_key, r.event) for r in records if r.event is not None and not r.expired]
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+class TestEventSpool:
+    """Test cases for the EventSpool class."""
+    
+    def test_round_trip(self, tmp_path):
+        """Test that spooled events read back in order with their fields."""
+        spool = EventSpool(str(tmp_path))
+        event = TrackEvent.new("A", "success").with_reward(2.5).with_context("user.id", "user1")
+        event.with_dedup_key("d1")
+        spool.append("feature", event)
+        spool.append("other", TrackEvent.new("B", "failure"))
+        
+        replayed = replay_all(spool)
+        assert [key for key, _ in replayed] == ["feature", "other"]
+        first = replayed[0][1]
+        assert first.to_dict() == event.to_dict()
+        assert spool.peek(10) == []
+        spool.close()
+    
+    def test_survives_restart(self, tmp_path):
+        """Test that unreplayed events and the replay position persist across processes."""
+        spool = EventSpool(str(tmp_path), segment_bytes=300)
+        for i in range(10):
+            spool.append("feature", TrackEvent.new(f"v{i}", "success"))
+        for record in spool.peek(4):
+            spool.commit(record)
+        spool.close()
+        
+        reopened = EventSpool(str(tmp_path), segment_bytes=300)
+        assert [event.variant_key for _, event in replay_all(reopened)] == [f"v{i}" for i in range(4, 10)]
+        reopened.close()
+    
+    def test_segments_are_deleted_after_replay(self, tmp_path):
+        """Test that fully replayed segments are removed from disk."""
+        spool = EventSpool(str(tmp_path), segment_bytes=300)
+        for i in range(10):
+            spool.append("feature", TrackEvent.new(f"v{i}", "success"))
+        assert len([n for n in os.listdir(tmp_path) if n.endswith(".log")]) > 2
+        
+        replay_all(spool)
+        assert len([n for n in os.listdir(tmp_path) if n.endswith(".log")]) == 1
+        assert spool.pending_bytes() == 0
+        spool.close()
+    
+    def test_byte_cap_drops_oldest(self, tmp_path):
+        """Test that the oldest segments are dropped to stay within max_bytes."""
+        spool = EventSpool(str(tmp_path), max_bytes=1000, segment_bytes=300)
+        for i in range(30):
+            spool.append("feature", TrackEvent.new(f"v{i}", "success"))
+        
+        stats = spool.stats()
+        assert stats.bytes <= 1000
+        assert stats.dropped > 0
+        replayed = [event.variant_key for _, event in replay_all(spool)]
+        assert replayed[-1] == "v29"
+        assert len(replayed) + stats.dropped == 30
+        spool.close()
+    
+    def test_expired_events_are_skipped(self, tmp_path):
+        """Test that events older than max_age_seconds are not replayed."""
+        now = [1000.0]
+        spool = EventSpool(str(tmp_path), max_age_seconds=60, clock=lambda: now[0])
+        spool.append("feature", TrackEvent.new("old", "success"))
+        now[0] += 100
+        spool.append("feature", TrackEvent.new("new", "success"))
+        
+        assert [event.variant_key for _, event in replay_all(spool)] == ["new"]
+        assert spool.stats().expired == 1
+        spool.close()
+    
+    def test_torn_and_corrupt_lines(self, tmp_path):
+        """Test that a corrupt record is skipped and a torn last record is left alone."""
+        spool = EventSpool(str(tmp_path))
+        spool.append("feature", TrackEvent.new("A", "success"))
+        spool.close()
+        segment = os.path.join(tmp_path, sorted(n for n in os.listdir(tmp_path) if n.endswith(".log"))[0])
+        with open(segment, "ab") as f:
+            f.write(b"not json\n{\"t\": 1")
+        
+        reopened = EventSpool(str(tmp_path))
+        assert [event.variant_key for _, event in replay_all(reopened)] == ["A"]
+        assert reopened.stats().dropped == 1
+        reopened.close()
+
+
+class TestSpoolReplayer:
+    """Test cases for the SpoolReplayer class."""
+    
+    def test_replays_after_recovery(self, tmp_path):
+        """Test that replay pauses on transient errors and resumes in order."""
+        spool = EventSpool(str(tmp_path))
+        for i in range(5):
+            spool.append("feature", TrackEvent.new(f"v{i}", "success"))
+        sent = []
+        down = threading.Event()
+        down.set()
+        
+        def send(feature_key, event):
+            if down.is_set():
+                raise InternalServerError()
+            sent.append(event.variant_key)
+        
+        replayer = SpoolReplayer(
+            spool, send, lambda e: e.status_code >= 500, rate_per_second=1000, retry_interval_seconds=0.05
+        )
+        replayer.start()
+        time.sleep(0.1)
+        assert sent == []
+        down.clear()
+        assert wait_for(lambda: len(sent) == 5)
+        replayer.stop()
+        
+        assert sent == [f"v{i}" for i in range(5)]
+        assert spool.stats().replayed == 5
+        spool.close()
+    
+    def test_drops_rejected_events(self, tmp_path):
+        """Test that events the server rejects are dropped instead of blocking replay."""
+        spool = EventSpool(str(tmp_path))
+        spool.append("missing", TrackEvent.new("A", "success"))
+        spool.append("feature", TrackEvent.new("B", "success"))
+        sent = []
+        
+        def send(feature_key, event):
+            if feature_key == "missing":
+                raise NotFoundError()
+            sent.append(feature_key)
+        
+        replayer = SpoolReplayer(spool, send, lambda e: False, rate_per_second=1000)
+        replayer.start()
+        assert wait_for(lambda: sent == ["feature"])
+        replayer.stop()
+        assert spool.stats().dropped == 1
+        spool.close()
+
+
+class TestClientEventSpool:
+    """Test cases for track_event() with the event spool enabled."""
+    
+    @patch('togglr.client.DefaultApi')
+    def test_transient_failures_are_spooled(self, mock_api_class, tmp_path):
+        """Test that 5xx failures are spooled and 404s are still raised."""
+        mock_api = Mock()
+        mock_api_class.return_value = mock_api
+        mock_api.track_feature_event.side_effect = ApiException(status=503)
+        
+        config = (
+            ClientConfig.default("test-api-key")
+            .with_backoff(base_delay=0.001)
+            .with_event_spool(str(tmp_path))
+        )
+        config.events.spool_retry_interval_seconds = 60
+        client = Client(config)
+        client.track_event("feature", TrackEvent.new("A", "success"))
+        assert client.spool_stats().spooled == 1
+        
+        # Attempts that timed out may have been accepted; the replay must be deduplicable
+        sent_keys = {c.kwargs["track_request"]["dedup_key"] for c in mock_api.track_feature_event.call_args_list}
+        spooled = client._spool.peek(10)[0].event
+        assert sent_keys == {spooled.dedup_key}
+        
+        mock_api.track_feature_event.side_effect = ApiException(status=404)
+        with pytest.raises(NotFoundError):
+            client.track_event("feature", TrackEvent.new("A", "success"))
+        client.close()
+    
+    @patch('togglr.client.DefaultApi')
+    def test_queue_failures_are_spooled_and_replayed(self, mock_api_class, tmp_path):
+        """Test that events the queue fails to send are replayed by a later client."""
+        mock_api = Mock()
+        mock_api_class.return_value = mock_api
+        mock_api.track_feature_event.side_effect = ApiException(status=500)
+        
+        config = (
+            ClientConfig.default("test-api-key")
+            .with_backoff(base_delay=0.001)
+            .with_event_queue(flush_interval_seconds=60)
+            .with_event_spool(str(tmp_path), replay_rate=1000)
+        )
+        config.events.spool_retry_interval_seconds = 60
+        client = Client(config)
+        for i in range(3):
+            client.track_event("feature", TrackEvent.new(f"v{i}", "success"))
+        assert client.flush(timeout=5) is True
+        assert client.event_stats().spooled == 3
+        client.close()
+        
+        mock_api.track_feature_event.side_effect = None
+        mock_api.track_feature_event.reset_mock()
+        client = Client(config)
+        assert wait_for(lambda: client.spool_stats().replayed == 3)
+        client.close()
+        variants = [c.kwargs["track_request"]["variant_key"] for c in mock_api.track_feature_event.call_args_list]
+        # Queue workers fail concurrently, so spool order is not queue order
+        assert sorted(variants) == ["v0", "v1", "v2"]
+
+
+class TestRetryClassification:
+    """Test cases for retrying errors raised by the SDK itself."""
+    
+    @patch('togglr.client.DefaultApi')
+    def test_not_found_is_not_retried(self, mock_api_class):
+        """Test that a 404 from track_event is raised at once as NotFoundError."""
+        mock_api = Mock()
+        mock_api_class.return_value = mock_api
+        mock_api.track_feature_event.side_effect = ApiException(status=404)
+        client = Client(ClientConfig.default("test-api-key").with_backoff(base_delay=0.001))
+        
+        with pytest.raises(NotFoundError):
+            client.track_event("missing", TrackEvent.new("A", "success"))
+        assert mock_api.track_feature_event.call_count == 1
+        assert client._is_transient_error(TogglrError("Event tracking failed: deadline exceeded"))
+        client.close()
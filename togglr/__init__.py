@@ -1,7 +1,14 @@
 """Togglr Python SDK for feature flag management."""
 
-from .client import Client, ClientConfig
+from .client import Client, ClientConfig, EvaluationResult, WarmResult
+from .async_client import AsyncClient
+from .config import BackoffConfig, CacheConfig, EventsConfig
+from .cache import CacheBackend, CacheStats
 from .context import RequestContext
+from .aggregation import EventSummary
+from .events import EventQueueStats
+from .impressions import ImpressionStats
+from .spool import SpoolStats
 from .track_event import TrackEvent, EventType
 
 def new_client(api_key: str, **kwargs) -> Client:
@@ -38,7 +45,19 @@ from togglr_client.models.feature_health import FeatureHealth
 
 __all__ = [
     "Client",
+    "AsyncClient",
     "ClientConfig", 
+    "EvaluationResult",
+    "WarmResult",
+    "BackoffConfig",
+    "CacheConfig",
+    "EventsConfig",
+    "EventQueueStats",
+    "EventSummary",
+    "SpoolStats",
+    "ImpressionStats",
+    "CacheBackend",
+    "CacheStats",
     "RequestContext",
     "TrackEvent",
     "EventType",
@@ -0,0 +1,171 @@
+"""Client-side aggregation of track events into summaries."""
+
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from .events import snapshot_event
+from .track_event import EventType, TrackEvent
+
+GroupKey = Tuple[str, str, str, Tuple[Hashable, ...]]
+
+
+@dataclass
+class EventSummary:
+    """Totals of the track events of one group over one window."""
+    
+    feature_key: str
+    variant_key: str
+    event_type: EventType
+    count: int
+    reward: float  # sum of the rewards, missing rewards counting as 0
+    first_created_at: datetime
+    context: Dict[str, Any] = field(default_factory=dict)  # values of the grouping context keys
+
+
+class _Group:
+    """Running totals of one group of events."""
+    
+    __slots__ = ("feature_key", "first", "count", "reward")
+    
+    def __init__(self, feature_key: str, first: TrackEvent):
+        self.feature_key = feature_key
+        self.first = first
+        self.count = 0
+        self.reward = 0.0
+
+
+class EventAggregator:
+    """Sums track events over a time window and emits one summary per group.
+    
+    Events are grouped by (feature_key, variant_key, event_type) and the
+    values of context_keys. Every window_seconds each group is passed to
+    emit as an EventSummary. Events with a dedup_key, and events that would
+    start a group beyond max_groups, are not aggregated.
+    """
+    
+    def __init__(
+        self,
+        emit: Callable[[EventSummary], None],
+        window_seconds: float = 1.0,
+        context_keys: Iterable[str] = (),
+        max_groups: int = 10000,
+        logger: Optional[Callable[[str, Any], None]] = None,
+    ):
+        """Initialize the aggregator and start its thread.
+        
+        Args:
+            emit: Callable receiving each summary
+            window_seconds: Time events are collected before their summaries are emitted
+            context_keys: Context keys whose values split groups
+            max_groups: Maximum number of groups collected per window
+            logger: Optional logger for failures of emit
+        """
+        self._emit = emit
+        self._window = window_seconds
+        self._context_keys = tuple(context_keys)
+        self._max_groups = max_groups
+        self._logger = logger
+        self._groups: Dict[GroupKey, _Group] = {}
+        self._cond = threading.Condition()
+        self._emit_lock = threading.Lock()
+        self._aggregated = 0  # events folded into summaries
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="togglr-event-aggregator", daemon=True)
+        self._thread.start()
+    
+    def add(self, feature_key: str, event: TrackEvent) -> bool:
+        """Add an event to its group.
+        
+        Args:
+            feature_key: The feature key the event is for
+            event: The track event
+        
+        Returns:
+            True if the event was aggregated, False if the caller should send it
+        """
+        if event.dedup_key is not None:
+            return False
+        context = event.context.to_dict()
+        key = (
+            feature_key,
+            event.variant_key,
+            event.event_type.value,
+            tuple(context.get(k) for k in self._context_keys),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return False
+        
+        with self._cond:
+            if self._closed:
+                return False
+            group = self._groups.get(key)
+            if group is None:
+                if len(self._groups) >= self._max_groups:
+                    return False
+                group = _Group(feature_key, snapshot_event(event))
+                self._groups[key] = group
+            group.count += 1
+            group.reward += event.reward or 0.0
+            self._aggregated += 1
+        return True
+    
+    def flush(self) -> None:
+        """Emit the summaries collected so far."""
+        self._emit_groups(self._take())
+    
+    def aggregated(self) -> int:
+        """Get the number of events aggregated so far."""
+        with self._cond:
+            return self._aggregated
+    
+    def close(self) -> None:
+        """Stop aggregating and emit the remaining summaries."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        self.flush()
+    
+    def _run(self) -> None:
+        """Emit summaries every window until closed."""
+        while True:
+            with self._cond:
+                self._cond.wait(self._window)
+                if self._closed:
+                    return
+            self.flush()
+    
+    def _take(self) -> List[Tuple[GroupKey, _Group]]:
+        """Remove and return the collected groups."""
+        with self._cond:
+            groups = list(self._groups.items())
+            self._groups = {}
+        return groups
+    
+    def _emit_groups(self, groups: List[Tuple[GroupKey, _Group]]) -> None:
+        """Emit a summary for each group, in the order the groups started."""
+        with self._emit_lock:
+            for key, group in groups:
+                try:
+                    self._emit(self._summary(key, group))
+                except Exception as e:
+                    if self._logger:
+                        self._logger(f"Failed to emit event summary for {group.feature_key}: {e}")
+    
+    def _summary(self, key: GroupKey, group: _Group) -> EventSummary:
+        """Build the summary of a group."""
+        first = group.first
+        assert first.created_at is not None  # stamped by snapshot_event()
+        return EventSummary(
+            feature_key=group.feature_key,
+            variant_key=first.variant_key,
+            event_type=first.event_type,
+            count=group.count,
+            reward=group.reward,
+            first_created_at=first.created_at,
+            context={k: v for k, v in zip(self._context_keys, key[3]) if v is not None},
+        )
@@ -0,0 +1,523 @@
+"""Asyncio client implementation for togglr-sdk-python."""
+
+import asyncio
+import ssl
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple, TypeVar, Union
+
+import httpx
+
+from togglr_client.exceptions import ApiException
+from togglr_client.models.evaluate_response import EvaluateResponse
+from togglr_client.models.feature_error_report import FeatureErrorReport
+from togglr_client.models.feature_health import FeatureHealth
+
+from .client import _BaseClient
+from .config import ClientConfig
+from .context import RequestContext
+from .singleflight import SingleFlightStats
+from .track_event import TrackEvent
+from .version import __version__
+from .errors import TogglrError, NotFoundError, FeatureNotFoundError
+
+T = TypeVar("T")
+
+
+class AsyncClient(_BaseClient):
+    """Togglr SDK client for asyncio applications.
+    
+    Has the same surface as Client, with coroutines in place of the remote
+    calls. Requests go through one httpx.AsyncClient connection pool, backoff
+    uses asyncio.sleep, and evaluations are cached with the same cache layer
+    and configuration as Client. Cache backends are called inline: the
+    in-memory and shared-memory backends never block, while a Redis backend
+    blocks for at most its timeout.
+    """
+    
+    def __init__(self, config: ClientConfig, transport: Optional[httpx.AsyncBaseTransport] = None):
+        """Initialize the client with configuration.
+        
+        Args:
+            config: Client configuration
+            transport: Optional httpx transport, e.g. for tests
+        
+        Raises:
+            ValueError: If background event delivery is configured, which
+                only Client supports
+        """
+        unsupported = [
+            name for name, enabled in (
+                ("event queue", config.events.enabled),
+                ("event spool", config.events.spool_path is not None),
+                ("event aggregation", bool(config.events.aggregate_sink and config.events.aggregate_window_seconds)),
+                ("impressions", config.events.impressions),
+            ) if enabled
+        ]
+        if unsupported:
+            raise ValueError(f"AsyncClient does not support the {', '.join(unsupported)}; use Client")
+        super().__init__(config)
+        
+        self._http = httpx.AsyncClient(
+            base_url=config.base_url,
+            headers={
+                "Authorization": config.api_key,
+                "User-Agent": f"togglr-sdk-python/{__version__}",
+            },
+            timeout=self._httpx_timeout(self._request_timeout),
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_connections,
+            ),
+            verify=self._ssl_context(config),
+            transport=transport,
+        )
+        self._extensions: Dict[str, Any] = {}
+        if config.tls_server_name:
+            self._extensions["sni_hostname"] = config.tls_server_name
+        
+        # Concurrent misses for the same key share one request
+        self._inflight: Dict[str, "asyncio.Future[Tuple[str, bool, bool]]"] = {}
+        self._inflight_stats = SingleFlightStats()
+        
+        # Background refreshes by cache key
+        self._refreshing: Dict[str, "asyncio.Future[Any]"] = {}
+        
+        self._start_cache_tasks()
+    
+    @staticmethod
+    def _ssl_context(config: ClientConfig) -> Union[bool, ssl.SSLContext]:
+        """Build the TLS settings for httpx from the configuration."""
+        if config.insecure:
+            return False
+        if not (config.ssl_ca_cert or config.ca_cert_data or config.cert_file or config.assert_hostname is False):
+            return True
+        context = ssl.create_default_context(cafile=config.ssl_ca_cert, cadata=config.ca_cert_data)
+        if config.cert_file:
+            context.load_cert_chain(config.cert_file, config.key_file)
+        if config.assert_hostname is False:
+            context.check_hostname = False
+        return context
+    
+    @staticmethod
+    def _httpx_timeout(timeout: Union[float, Tuple[float, float]]) -> httpx.Timeout:
+        """Convert a request timeout, total or (connect, read), to httpx."""
+        if isinstance(timeout, tuple):
+            return httpx.Timeout(timeout[1], connect=timeout[0])
+        return httpx.Timeout(timeout)
+    
+    async def close(self) -> None:
+        """Close the client and clean up resources."""
+        for task in list(self._refreshing.values()):
+            task.cancel()
+        await self._http.aclose()
+        self._close_cache()
+    
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+    
+    def singleflight_stats(self) -> SingleFlightStats:
+        """Get counters for evaluation requests shared between concurrent callers.
+        
+        Returns:
+            SingleFlightStats with the number of requests sent and the
+            number of callers that waited on another caller's request
+        """
+        return SingleFlightStats(
+            calls=self._inflight_stats.calls,
+            coalesced=self._inflight_stats.coalesced,
+        )
+    
+    async def health_check(self) -> bool:
+        """Perform a health check on the API.
+        
+        Returns:
+            True if healthy, False otherwise
+        """
+        try:
+            response = await self._request("GET", "/sdk/v1/health", self._request_timeout)
+            return bool(response.json().get("status") == "ok")
+        except Exception:
+            return False
+    
+    async def evaluate(
+        self, 
+        feature_key: str, 
+        context: RequestContext, 
+        deadline: Optional[float] = None
+    ) -> Tuple[str, bool, bool]:
+        """Evaluate a feature flag.
+        
+        Args:
+            feature_key: The feature key to evaluate
+            context: Request context
+            deadline: Total seconds to spend, including retries and backoff;
+                defaults to config.deadline
+        
+        Returns:
+            Tuple of (value, enabled, found)
+        
+        Raises:
+            TogglrError: If evaluation fails or runs out of time
+        """
+        deadline_at = self._deadline_at(deadline)
+        cache_key = self._get_cache_key(feature_key, context)
+        result, refresh = self._cached_evaluation(feature_key, cache_key)
+        if refresh:
+            self._refresh_in_background(feature_key, context, cache_key)
+        if result is not None:
+            return result
+        
+        return await self._fetch_evaluation(feature_key, context, cache_key, deadline_at)
+    
+    async def evaluate_many(
+        self, 
+        feature_keys: Iterable[str], 
+        context: RequestContext, 
+        deadline: Optional[float] = None
+    ) -> Dict[str, Tuple[str, bool, bool]]:
+        """Evaluate several feature flags for the same context.
+        
+        Cached results are looked up together and returned without waiting;
+        the misses are evaluated concurrently on the event loop.
+        
+        Args:
+            feature_keys: The feature keys to evaluate
+            context: Request context
+            deadline: Total seconds to spend, defaults to config.deadline
+        
+        Returns:
+            Mapping of each feature key to (value, enabled, found), in input order
+        
+        Raises:
+            TogglrError: If any evaluation fails, after all of them have finished
+        """
+        deadline_at = self._deadline_at(deadline)
+        feature_keys = list(dict.fromkeys(feature_keys))
+        results, misses = self._cached_evaluations(feature_keys, context)
+        
+        fetched = await asyncio.gather(
+            *(
+                self._fetch_evaluation(feature_key, context, cache_key, deadline_at)
+                for feature_key, cache_key in misses.items()
+            ),
+            return_exceptions=True,
+        )
+        for feature_key, result in zip(misses, fetched):
+            if isinstance(result, BaseException):
+                raise result
+            results[feature_key] = result
+        
+        return {feature_key: results[feature_key] for feature_key in feature_keys}
+    
+    async def is_enabled(
+        self, 
+        feature_key: str, 
+        context: RequestContext, 
+        deadline: Optional[float] = None
+    ) -> bool:
+        """Check if a feature is enabled.
+        
+        Args:
+            feature_key: The feature key to check
+            context: Request context
+            deadline: Total seconds to spend, defaults to config.deadline
+        
+        Returns:
+            True if enabled, False otherwise
+        
+        Raises:
+            TogglrError: If evaluation fails
+            FeatureNotFoundError: If feature is not found
+        """
+        value, enabled, found = await self.evaluate(feature_key, context, deadline)
+        if not found:
+            raise FeatureNotFoundError(f"Feature '{feature_key}' not found")
+        return enabled
+    
+    async def is_enabled_or_default(
+        self, 
+        feature_key: str, 
+        context: RequestContext, 
+        default: bool = False, 
+        deadline: Optional[float] = None
+    ) -> bool:
+        """Check if a feature is enabled, returning default on error.
+        
+        Args:
+            feature_key: The feature key to check
+            context: Request context
+            default: Default value to return on error
+            deadline: Total seconds to spend, defaults to config.deadline
+        
+        Returns:
+            True if enabled, default value on error
+        """
+        try:
+            return await self.is_enabled(feature_key, context, deadline)
+        except Exception as e:
+            if self.config.logger:
+                self.config.logger(f"Evaluation failed, using default: {e}")
+            return default
+    
+    async def report_error(
+        self, 
+        feature_key: str, 
+        error_type: str, 
+        error_message: str, 
+        context: Optional[Dict[str, Any]] = None, 
+        deadline: Optional[float] = None
+    ) -> None:
+        """Report a feature execution error for auto-disable functionality.
+        
+        Args:
+            feature_key: The feature key to report error for
+            error_type: Type of error (e.g., 'timeout', 'validation', 'service_unavailable')
+            error_message: Human-readable error message
+            context: Optional context data for the error
+            deadline: Total seconds to spend, defaults to config.deadline
+        
+        Raises:
+            TogglrError: If error reporting fails
+        """
+        body = FeatureErrorReport(
+            error_type=error_type,
+            error_message=error_message,
+            context=context
+        ).to_dict()
+        
+        async def attempt(timeout: Union[float, Tuple[float, float]]) -> None:
+            await self._request(
+                "POST", f"/sdk/v1/features/{feature_key}/report-error", timeout, body, not_found=True
+            )
+        
+        await self._call_with_retries(attempt, "Error reporting", self._deadline_at(deadline))
+    
+    async def get_feature_health(self, feature_key: str, deadline: Optional[float] = None) -> FeatureHealth:
+        """Get the health status of a feature.
+        
+        Args:
+            feature_key: The feature key to get health for
+            deadline: Total seconds to spend, defaults to config.deadline
+        
+        Returns:
+            FeatureHealth object with health information
+        
+        Raises:
+            TogglrError: If health retrieval fails
+        """
+        async def attempt(timeout: Union[float, Tuple[float, float]]) -> FeatureHealth:
+            response = await self._request(
+                "GET", f"/sdk/v1/features/{feature_key}/health", timeout, not_found=True
+            )
+            health = FeatureHealth.from_dict(response.json())
+            if health is None:
+                raise TogglrError("Unexpected empty health response")
+            return health
+        
+        return await self._call_with_retries(attempt, "Health retrieval", self._deadline_at(deadline))
+    
+    async def is_feature_healthy(self, feature_key: str, deadline: Optional[float] = None) -> bool:
+        """Check if a feature is healthy (enabled and not auto-disabled).
+        
+        Args:
+            feature_key: The feature key to check
+            deadline: Total seconds to spend, defaults to config.deadline
+        
+        Returns:
+            True if feature is healthy, False otherwise
+        
+        Raises:
+            TogglrError: If health check fails
+        """
+        health = await self.get_feature_health(feature_key, deadline)
+        return health.enabled and not health.auto_disabled
+    
+    async def track_event(self, feature_key: str, event: TrackEvent, deadline: Optional[float] = None) -> None:
+        """Track an event for analytics.
+        
+        The event is always sent inline; background delivery settings in
+        config.events are only supported by Client.
+        
+        Args:
+            feature_key: The feature key to track an event for
+            event: The track event to send
+            deadline: Total seconds to spend, defaults to config.deadline
+        
+        Raises:
+            TogglrError: If tracking fails
+        """
+        body = event.to_dict()
+        
+        async def attempt(timeout: Union[float, Tuple[float, float]]) -> None:
+            await self._request(
+                "POST", f"/sdk/v1/features/{feature_key}/track", timeout, body, not_found=True
+            )
+        
+        await self._call_with_retries(attempt, "Event tracking", self._deadline_at(deadline))
+    
+    async def _fetch_evaluation(
+        self, 
+        feature_key: str, 
+        context: RequestContext, 
+        cache_key: str, 
+        deadline_at: Optional[float] = None
+    ) -> Tuple[str, bool, bool]:
+        """Evaluate feature over the network, sharing in-flight requests for the same key."""
+        call = self._inflight.get(cache_key)
+        if call is None:
+            call = asyncio.ensure_future(self._evaluate_remote(feature_key, context, cache_key, deadline_at))
+            self._inflight[cache_key] = call
+            self._inflight_stats.calls += 1
+            call.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        else:
+            self._inflight_stats.coalesced += 1
+        
+        # Shielded so a cancelled caller does not cancel the request for the others
+        if deadline_at is None:
+            return await asyncio.shield(call)
+        try:
+            return await asyncio.wait_for(asyncio.shield(call), max(0.0, deadline_at - time.monotonic()))
+        except asyncio.TimeoutError:
+            raise TogglrError("Evaluation failed: deadline exceeded")
+    
+    async def _evaluate_remote(
+        self, 
+        feature_key: str, 
+        context: RequestContext, 
+        cache_key: str, 
+        deadline_at: Optional[float] = None
+    ) -> Tuple[str, bool, bool]:
+        """Evaluate feature over the network with retries and cache the result."""
+        body = context.to_dict()
+        
+        async def attempt(timeout: Union[float, Tuple[float, float]]) -> Tuple[str, bool, bool]:
+            started = time.monotonic()
+            response = await self._request(
+                "POST", f"/sdk/v1/features/{feature_key}/evaluate", timeout, body
+            )
+            self._record_fetch_latency(time.monotonic() - started)
+            
+            if response.status_code == 404:
+                value, enabled, found = "", False, False  # Feature not found, not an error
+            else:
+                result = EvaluateResponse.from_dict(response.json())
+                if result is None:
+                    raise TogglrError("Unexpected empty evaluation response")
+                value, enabled, found = result.value, result.enabled, True
+            
+            # Cache result if successful
+            self._store_evaluation(feature_key, cache_key, value, enabled, found)
+            
+            return value, enabled, found
+        
+        return await self._call_with_retries(attempt, "Evaluation", deadline_at)
+    
+    async def _call_with_retries(
+        self, 
+        attempt: Callable[[Union[float, Tuple[float, float]]], Awaitable[T]], 
+        action: str, 
+        deadline_at: Optional[float] = None
+    ) -> T:
+        """Run a request with retries and asyncio.sleep backoff, within an optional deadline.
+        
+        Args:
+            attempt: Performs one request, given the timeout to use
+            action: Name of the operation for error messages
+            deadline_at: Monotonic time by which to give up, None for no limit
+        
+        Returns:
+            The result of the first successful attempt
+        
+        Raises:
+            TogglrError: If every attempt failed or the deadline ran out
+        """
+        last_error: Optional[Exception] = None
+        
+        for attempt_number in range(self.config.retries + 1):
+            if attempt_number > 0:
+                delay = self._retry_delay(attempt_number, deadline_at)
+                if delay is None:
+                    break
+                await asyncio.sleep(delay)
+            
+            timeout = self._attempt_timeout(deadline_at)
+            if timeout is None:
+                break
+            
+            try:
+                if deadline_at is None:
+                    return await attempt(timeout)
+                # httpx timeouts apply per phase, this bounds the whole attempt
+                return await asyncio.wait_for(attempt(timeout), deadline_at - time.monotonic())
+            
+            except asyncio.TimeoutError:
+                last_error = TogglrError("deadline exceeded")
+            except Exception as e:
+                last_error = e
+                if not self._should_retry(e):
+                    break
+        
+        raise self._retry_error(action, last_error)
+    
+    async def _request(
+        self, 
+        method: str, 
+        path: str, 
+        timeout: Union[float, Tuple[float, float]], 
+        body: Optional[Dict[str, Any]] = None, 
+        not_found: bool = False
+    ) -> httpx.Response:
+        """Send one request, raising ApiException for error statuses.
+        
+        Args:
+            method: HTTP method
+            path: Request path
+            timeout: Request timeout, total or (connect, read)
+            body: Optional JSON body
+            not_found: Raise NotFoundError for 404 instead of returning the response
+        """
+        response = await self._http.request(
+            method,
+            path,
+            json=body,
+            timeout=self._httpx_timeout(timeout),
+            extensions=self._extensions,
+        )
+        if response.status_code == 404:
+            if not_found:
+                raise NotFoundError("Feature not found")
+            return response
+        if response.status_code >= 400:
+            raise ApiException(status=response.status_code, reason=response.reason_phrase, body=response.text)
+        return response
+    
+    def _refresh_in_background(
+        self, 
+        feature_key: str, 
+        context: RequestContext, 
+        cache_key: str
+    ) -> None:
+        """Schedule a refresh of a stale cache entry on the running event loop."""
+        if not self._refresh_enabled or cache_key in self._refreshing:
+            return
+        # Snapshot the context, the caller may keep modifying it
+        snapshot = RequestContext(context.to_dict())
+        task = asyncio.ensure_future(
+            self._fetch_evaluation(feature_key, snapshot, cache_key, self._deadline_at(None))
+        )
+        self._refreshing[cache_key] = task
+        task.add_done_callback(lambda done: self._refresh_done(cache_key, done))
+    
+    def _refresh_done(self, cache_key: str, task: "asyncio.Future[Any]") -> None:
+        """Forget a finished background refresh and log its failure, if any."""
+        self._refreshing.pop(cache_key, None)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None and self.config.logger:
+            self.config.logger(f"Background refresh of {cache_key} failed: {error}")
@@ -1,37 +1,277 @@
 """Caching implementation for togglr-sdk-python."""
 
+import sys
+import threading
 import time
-from typing import Any, Optional, Tuple
-from dataclasses import dataclass, field
-from cachetools import TTLCache
+import zlib
+from typing import Any, Callable, Dict, Iterable, List, Optional, Protocol, Sequence, Tuple
+from dataclasses import dataclass
+from cachetools import LRUCache as _LRUCache
+
+from .tinylfu import WTinyLFUCache
+
+POLICIES = ("lru", "tinylfu")
+
+# (key, value, enabled, found, ttl) as accepted by CacheBackend.set_many()
+CacheItem = Tuple[str, str, bool, bool, Optional[float]]
 
 
-@dataclass
 class CacheEntry:
-    """A cache entry containing evaluation result."""
+    """A cache entry containing evaluation result.
+    
+    Entries are kept small since a cache may hold millions of them: no
+    instance __dict__, values interned so entries sharing a variant share
+    one string, and times kept on the monotonic clock.
+    """
+    
+    __slots__ = ("value", "enabled", "found", "stored_at", "deadline")
+    
+    def __init__(
+        self,
+        value: str,
+        enabled: bool,
+        found: bool,
+        stored_at: Optional[float] = None,
+        deadline: float = float("inf"),
+    ):
+        """Initialize the entry.
+        
+        Args:
+            value: Feature value
+            enabled: Whether feature is enabled
+            found: Whether feature was found
+            stored_at: Monotonic time the entry was stored, defaults to now
+            deadline: Monotonic time the entry expires
+        """
+        self.value = sys.intern(value)
+        self.enabled = enabled
+        self.found = found
+        self.stored_at = time.monotonic() if stored_at is None else stored_at
+        self.deadline = deadline
     
-    value: str
-    enabled: bool
-    found: bool
-    timestamp: float = field(default_factory=time.time)
+    @property
+    def expires_at(self) -> float:
+        """Get the expiry as a wall-clock (time.time()) timestamp."""
+        return self.deadline + wall_clock_offset()
     
-    def is_expired(self, ttl: float) -> bool:
-        """Check if the entry is expired."""
-        return time.time() - self.timestamp > ttl
+    def is_expired(self, grace: float = 0.0, now: Optional[float] = None) -> bool:
+        """Check if the entry is expired, optionally allowing a grace period.
+        
+        Args:
+            grace: Seconds past the deadline the entry still counts as live
+            now: Current time on the cache's clock, defaults to time.monotonic()
+        """
+        return (time.monotonic() if now is None else now) > self.deadline + grace
+    
+    def __repr__(self) -> str:
+        return (
+            f"CacheEntry(value={self.value!r}, enabled={self.enabled}, found={self.found}, "
+            f"stored_at={self.stored_at}, deadline={self.deadline})"
+        )
+
+
+def wall_clock_offset() -> float:
+    """Get the difference between the wall clock and the monotonic clock.
+    
+    Entries use monotonic deadlines; expiry times that leave the process
+    (snapshots, the shared-memory cache) are converted to wall-clock time
+    by adding this offset.
+    """
+    return time.time() - time.monotonic()
+
+
+# Per-entry memory not covered by the value string: the entry object and
+# its two floats, a typical "feature_key:fingerprint" key and the cache's
+# own bookkeeping (hash table slot, recency links, expiry links).
+_ENTRY_OVERHEAD = (
+    sys.getsizeof(CacheEntry("", False, False))
+    + 2 * sys.getsizeof(0.0)
+    + sys.getsizeof("f" * 48)
+    + 200
+)
+
+
+def entry_size(entry: CacheEntry) -> int:
+    """Estimate the memory held by a cache entry, in bytes."""
+    return _ENTRY_OVERHEAD + sys.getsizeof(entry.value)
+
+
+@dataclass
+class CacheStats:
+    """Cumulative cache counters."""
+    
+    hits: int = 0
+    misses: int = 0
+    stale_hits: int = 0  # hits served past their TTL while being refreshed
+    expirations: int = 0
+    evictions: int = 0
+    coalesced: int = 0  # misses that waited for another caller's request
+    errors: int = 0  # backend operations that failed and were treated as misses
+    size: int = 0
+    max_size: int = 0
+    bytes: int = 0  # estimated memory held by the entries, byte-budgeted caches only
+    max_bytes: int = 0
+    average_entry_age: float = 0.0  # seconds, of entries when they were served
+    
+    @property
+    def hit_ratio(self) -> float:
+        """Get the fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+    
+    @classmethod
+    def merge(cls, stats: List["CacheStats"]) -> "CacheStats":
+        """Combine the stats of several caches."""
+        merged = cls()
+        age_total = 0.0
+        for item in stats:
+            merged.hits += item.hits
+            merged.misses += item.misses
+            merged.stale_hits += item.stale_hits
+            merged.expirations += item.expirations
+            merged.evictions += item.evictions
+            merged.coalesced += item.coalesced
+            merged.errors += item.errors
+            merged.size += item.size
+            merged.max_size += item.max_size
+            merged.bytes += item.bytes
+            merged.max_bytes += item.max_bytes
+            age_total += item.average_entry_age * item.hits
+        if merged.hits:
+            merged.average_entry_age = age_total / merged.hits
+        return merged
+
+
+class CacheBackend(Protocol):
+    """Storage the client keeps evaluation results in.
+    
+    LRUCache, ShardedLRUCache, SharedMemoryCache, RedisCache and TieredCache
+    implement it; any object with these methods can be passed as
+    CacheConfig.backend.
+    """
+    
+    def get(self, key: str) -> Tuple[Optional[CacheEntry], bool]:
+        """Get a live entry, returning (entry, hit)."""
+        ...
+    
+    def get_stale(self, key: str) -> Tuple[Optional[CacheEntry], bool]:
+        """Get an entry within the stale window, returning (entry, stale)."""
+        ...
+    
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Tuple[CacheEntry, bool]]:
+        """Get several entries like get_stale(), mapping each found key to (entry, stale)."""
+        ...
+    
+    def set(self, key: str, value: str, enabled: bool, found: bool, ttl: Optional[float] = None) -> None:
+        """Store an entry, with the cache TTL unless ttl is given."""
+        ...
+    
+    def set_many(self, items: Iterable[CacheItem]) -> None:
+        """Store several (key, value, enabled, found, ttl) entries."""
+        ...
+    
+    def restore(self, key: str, value: str, enabled: bool, found: bool, expires_at: float) -> None:
+        """Store an entry expiring at a wall-clock time."""
+        ...
+    
+    def items(self) -> List[Tuple[str, CacheEntry, float]]:
+        """Get (key, entry, wall-clock expiry) of all entries within the stale window."""
+        ...
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        ...
+    
+    def close(self) -> None:
+        """Release the resources held by the backend."""
+        ...
+    
+    def size(self) -> int:
+        """Get the number of entries."""
+        ...
+    
+    def max_size(self) -> int:
+        """Get the maximum number of entries, 0 if not bounded by count."""
+        ...
+    
+    def stats(self) -> CacheStats:
+        """Get cumulative counters."""
+        ...
+
+
+class _CountingLRUCache(_LRUCache):
+    """cachetools LRUCache that counts evictions."""
+    
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.evictions = 0
+    
+    def popitem(self) -> Tuple[Any, Any]:
+        item = super().popitem()
+        self.evictions += 1
+        return item
 
 
 class LRUCache:
-    """LRU cache with TTL for feature evaluation results."""
+    """Thread-safe LRU cache with TTL for feature evaluation results.
+    
+    Every entry records its own expiry time, so entries stored with a
+    different TTL than the cache default coexist in one cache.
     
-    def __init__(self, max_size: int, ttl_seconds: float):
+    With max_bytes set, the cache is bounded by the estimated memory of its
+    entries (see entry_size()) instead of their number.
+    
+    Expiry is checked once per lookup against the entry's deadline on a
+    monotonic clock, which tests can replace. Expired entries are dropped
+    when they are looked up or evicted.
+    """
+    
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        stale_seconds: float = 0.0,
+        policy: str = "lru",
+        max_bytes: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         """Initialize the cache.
         
         Args:
-            max_size: Maximum number of entries
-            ttl_seconds: Time to live in seconds
+            max_size: Maximum number of entries, ignored when max_bytes is set
+            ttl_seconds: Default time to live in seconds
+            stale_seconds: How long expired entries are kept for get_stale()
+            policy: Eviction policy, "lru" or "tinylfu" (frequency-aware admission)
+            max_bytes: Optional memory budget for the entries, in bytes
+            clock: Monotonic clock for entry deadlines
+            
+        Raises:
+            ValueError: If the policy is unknown
         """
-        self._cache = TTLCache(maxsize=max_size, ttl=ttl_seconds)
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown cache policy: {policy}")
+        cache_class = WTinyLFUCache if policy == "tinylfu" else _CountingLRUCache
+        self._cache = cache_class(
+            maxsize=max_size if max_bytes is None else max_bytes,
+            getsizeof=None if max_bytes is None else entry_size,
+        )
+        self._max_bytes = max_bytes
+        self._clock = clock
         self._ttl = ttl_seconds
+        self._stale = stale_seconds
+        # Both policies reorder their internal links even on reads, so every
+        # access has to go through the lock.
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stale_hits = 0
+        self._expirations = 0
+        self._age_total = 0.0
+    
+    @property
+    def clock(self) -> Callable[[], float]:
+        """Get the monotonic clock entry deadlines are measured on."""
+        return self._clock
     
     def get(self, key: str) -> Tuple[Optional[CacheEntry], bool]:
         """Get an entry from the cache.
@@ -42,18 +282,281 @@ class LRUCache:
         Returns:
             Tuple of (entry, hit) where hit indicates if the key was found
         """
+        now = self._clock()
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self._misses += 1
+                return None, False
+            
+            if now > entry.deadline:
+                if now > entry.deadline + self._stale:
+                    del self._cache[key]
+                    self._expirations += 1
+                self._misses += 1
+                return None, False
+            
+            self._hits += 1
+            self._age_total += now - entry.stored_at
+        
+        return entry, True
+    
+    def get_stale(self, key: str) -> Tuple[Optional[CacheEntry], bool]:
+        """Get an entry from the cache, including expired ones in the stale window.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Tuple of (entry, stale) where entry is None on a miss and stale
+            indicates the entry is past its TTL and should be refreshed
+        """
+        now = self._clock()
+        with self._lock:
+            return self._lookup(key, now)
+    
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Tuple[CacheEntry, bool]]:
+        """Get several entries, including expired ones in the stale window.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Mapping of each key found to (entry, stale)
+        """
+        now = self._clock()
+        found = {}
+        with self._lock:
+            for key in keys:
+                entry, stale = self._lookup(key, now)
+                if entry is not None:
+                    found[key] = (entry, stale)
+        return found
+    
+    def _lookup(self, key: str, now: float) -> Tuple[Optional[CacheEntry], bool]:
+        """Look up an entry within the stale window; the lock must be held."""
         entry = self._cache.get(key)
         if entry is None:
+            self._misses += 1
             return None, False
         
-        # Check if expired manually (TTLCache handles this, but we do it for safety)
-        if entry.is_expired(self._ttl):
-            self._cache.pop(key, None)
+        if now > entry.deadline + self._stale:
+            del self._cache[key]
+            self._expirations += 1
+            self._misses += 1
             return None, False
         
-        return entry, True
+        stale = now > entry.deadline
+        self._hits += 1
+        if stale:
+            self._stale_hits += 1
+        self._age_total += now - entry.stored_at
+        return entry, stale
+    
+    def set(
+        self, 
+        key: str, 
+        value: str, 
+        enabled: bool, 
+        found: bool, 
+        ttl: Optional[float] = None
+    ) -> None:
+        """Set an entry in the cache.
+        
+        Args:
+            key: Cache key
+            value: Feature value
+            enabled: Whether feature is enabled
+            found: Whether feature was found
+            ttl: Time to live for this entry, defaults to the cache TTL
+        """
+        now = self._clock()
+        deadline = now + (self._ttl if ttl is None else ttl)
+        entry = CacheEntry(value, enabled, found, now, deadline)
+        self._store(key, entry)
+    
+    def set_many(self, items: Iterable[CacheItem]) -> None:
+        """Set several entries under one lock acquisition.
+        
+        Args:
+            items: (key, value, enabled, found, ttl) tuples, ttl may be None
+        """
+        now = self._clock()
+        entries = [
+            (key, CacheEntry(value, enabled, found, now, now + (self._ttl if ttl is None else ttl)))
+            for key, value, enabled, found, ttl in items
+        ]
+        with self._lock:
+            for key, entry in entries:
+                self._insert(key, entry)
+    
+    def restore(self, key: str, value: str, enabled: bool, found: bool, expires_at: float) -> None:
+        """Insert an entry that expires at a given wall-clock time.
+        
+        Args:
+            key: Cache key
+            value: Feature value
+            enabled: Whether feature is enabled
+            found: Whether feature was found
+            expires_at: Wall-clock time (time.time()) when the entry expires
+        """
+        now = self._clock()
+        entry = CacheEntry(value, enabled, found, now, expires_at - time.time() + now)
+        self._store(key, entry)
+    
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        """Insert an entry."""
+        with self._lock:
+            self._insert(key, entry)
+    
+    def _insert(self, key: str, entry: CacheEntry) -> None:
+        """Insert an entry, skipping values larger than the whole byte budget; the lock must be held."""
+        try:
+            self._cache[key] = entry
+        except ValueError:
+            # Too large to ever fit; drop any older entry for the key too
+            self._cache.pop(key, None)
+    
+    def items(self) -> List[Tuple[str, CacheEntry, float]]:
+        """Get all entries that have not left the stale window.
+        
+        Returns:
+            List of (key, entry, expires_at) with wall-clock expiry times
+        """
+        with self._lock:
+            entries = list(self._cache.items())
+        now = self._clock()
+        offset = time.time() - now
+        return [
+            (key, entry, entry.deadline + offset)
+            for key, entry in entries
+            if now <= entry.deadline + self._stale
+        ]
+    
+    def clear(self) -> None:
+        """Clear all entries from the cache."""
+        with self._lock:
+            self._cache.clear()
+    
+    def close(self) -> None:
+        """Release the cache, dropping its entries."""
+        self.clear()
+    
+    def size(self) -> int:
+        """Get the current cache size."""
+        with self._lock:
+            return len(self._cache)
+    
+    def max_size(self) -> int:
+        """Get the maximum cache size, 0 if the cache is bounded by bytes."""
+        return int(self._cache.maxsize) if self._max_bytes is None else 0
+    
+    def size_bytes(self) -> int:
+        """Get the estimated memory held by the entries, 0 if the cache has no byte budget."""
+        if self._max_bytes is None:
+            return 0
+        with self._lock:
+            return int(self._cache.currsize)
+    
+    def stats(self) -> CacheStats:
+        """Get cumulative cache counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                stale_hits=self._stale_hits,
+                expirations=self._expirations,
+                evictions=self._cache.evictions,
+                size=len(self._cache),
+                max_size=0 if self._max_bytes is not None else int(self._cache.maxsize),
+                bytes=int(self._cache.currsize) if self._max_bytes is not None else 0,
+                max_bytes=self._max_bytes or 0,
+                average_entry_age=self._age_total / self._hits if self._hits else 0.0,
+            )
+
+
+class ShardedLRUCache:
+    """LRU cache with TTL split into independently locked shards.
+    
+    Keys are distributed over the shards by hash, so threads looking up
+    different keys rarely contend for the same lock. Each shard holds an
+    equal part of the total capacity and evicts on its own.
+    """
     
-    def set(self, key: str, value: str, enabled: bool, found: bool) -> None:
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        shards: int = 16,
+        stale_seconds: float = 0.0,
+        policy: str = "lru",
+        max_bytes: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the cache.
+        
+        Args:
+            max_size: Maximum number of entries across all shards
+            ttl_seconds: Time to live in seconds
+            shards: Number of shards
+            stale_seconds: How long expired entries are kept for get_stale()
+            policy: Eviction policy of every shard, "lru" or "tinylfu"
+            max_bytes: Optional memory budget across all shards, in bytes
+            clock: Monotonic clock for entry deadlines
+        """
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        shard_size = max(1, -(-max_size // shards))
+        shard_bytes = None if max_bytes is None else max_bytes // shards
+        self._shards: List[LRUCache] = [
+            LRUCache(shard_size, ttl_seconds, stale_seconds, policy, shard_bytes, clock)
+            for _ in range(shards)
+        ]
+        self.clock = clock
+    
+    def _index(self, key: str) -> int:
+        """Get the index of the shard responsible for a key.
+        
+        crc32 rather than hash() so the split does not depend on
+        PYTHONHASHSEED and is the same in every process.
+        """
+        return zlib.crc32(key.encode()) % len(self._shards)
+    
+    def _shard(self, key: str) -> LRUCache:
+        """Get the shard responsible for a key."""
+        return self._shards[self._index(key)]
+    
+    def get(self, key: str) -> Tuple[Optional[CacheEntry], bool]:
+        """Get an entry from the cache.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Tuple of (entry, hit) where hit indicates if the key was found
+        """
+        return self._shard(key).get(key)
+    
+    def get_stale(self, key: str) -> Tuple[Optional[CacheEntry], bool]:
+        """Get an entry from the cache, including expired ones in the stale window.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Tuple of (entry, stale) where entry is None on a miss and stale
+            indicates the entry is past its TTL and should be refreshed
+        """
+        return self._shard(key).get_stale(key)
+    
+    def set(
+        self, 
+        key: str, 
+        value: str, 
+        enabled: bool, 
+        found: bool, 
+        ttl: Optional[float] = None
+    ) -> None:
         """Set an entry in the cache.
         
         Args:
@@ -61,18 +564,269 @@ class LRUCache:
             value: Feature value
             enabled: Whether feature is enabled
             found: Whether feature was found
+            ttl: Time to live for this entry, defaults to the cache TTL
         """
-        entry = CacheEntry(value=value, enabled=enabled, found=found)
-        self._cache[key] = entry
+        self._shard(key).set(key, value, enabled, found, ttl)
+    
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Tuple[CacheEntry, bool]]:
+        """Get several entries, including expired ones in the stale window.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Mapping of each key found to (entry, stale)
+        """
+        found: Dict[str, Tuple[CacheEntry, bool]] = {}
+        for shard, shard_keys in self._group(keys).items():
+            found.update(self._shards[shard].get_many(shard_keys))
+        return found
+    
+    def set_many(self, items: Iterable[CacheItem]) -> None:
+        """Set several entries, taking each shard's lock once.
+        
+        Args:
+            items: (key, value, enabled, found, ttl) tuples, ttl may be None
+        """
+        by_shard: Dict[int, List[CacheItem]] = {}
+        for item in items:
+            by_shard.setdefault(self._index(item[0]), []).append(item)
+        for shard, shard_items in by_shard.items():
+            self._shards[shard].set_many(shard_items)
+    
+    def _group(self, keys: Sequence[str]) -> Dict[int, List[str]]:
+        """Group keys by the index of their shard."""
+        groups: Dict[int, List[str]] = {}
+        for key in keys:
+            groups.setdefault(self._index(key), []).append(key)
+        return groups
+    
+    def restore(self, key: str, value: str, enabled: bool, found: bool, expires_at: float) -> None:
+        """Insert an entry that expires at a given wall-clock time.
+        
+        Args:
+            key: Cache key
+            value: Feature value
+            enabled: Whether feature is enabled
+            found: Whether feature was found
+            expires_at: Wall-clock time (time.time()) when the entry expires
+        """
+        self._shard(key).restore(key, value, enabled, found, expires_at)
+    
+    def items(self) -> List[Tuple[str, CacheEntry, float]]:
+        """Get all entries that have not left the stale window.
+        
+        Returns:
+            List of (key, entry, expires_at) with wall-clock expiry times
+        """
+        return [item for shard in self._shards for item in shard.items()]
     
     def clear(self) -> None:
         """Clear all entries from the cache."""
-        self._cache.clear()
+        for shard in self._shards:
+            shard.clear()
+    
+    def close(self) -> None:
+        """Release the cache, dropping its entries."""
+        self.clear()
     
     def size(self) -> int:
         """Get the current cache size."""
-        return len(self._cache)
+        return sum(shard.size() for shard in self._shards)
     
     def max_size(self) -> int:
         """Get the maximum cache size."""
-        return self._cache.maxsize
+        return sum(shard.max_size() for shard in self._shards)
+    
+    def size_bytes(self) -> int:
+        """Get the estimated memory held by the entries, 0 if the cache has no byte budget."""
+        return sum(shard.size_bytes() for shard in self._shards)
+    
+    def stats(self) -> CacheStats:
+        """Get cumulative cache counters summed over all shards."""
+        return CacheStats.merge([shard.stats() for shard in self._shards])
+    
+    def shard_count(self) -> int:
+        """Get the number of shards."""
+        return len(self._shards)
+
+
+class TieredCache:
+    """Two-level cache: a small in-process L1 in front of a shared L2.
+    
+    Lookups are served from L1 when possible; L2 hits are copied into L1
+    with the L2 entry's expiry, so L1 never serves an entry longer than L2
+    would. Writes go to both levels.
+    """
+    
+    def __init__(self, l1: LRUCache, l2: CacheBackend):
+        """Initialize the cache.
+        
+        Args:
+            l1: In-process cache
+            l2: Shared backend, e.g. SharedMemoryCache or RedisCache
+        """
+        self.l1 = l1
+        self.l2 = l2
+        # Lookups where L1 had a stale entry and L2 was asked as well, counted
+        # by whether L2 answered, so stats() can count each lookup once
+        self._lock = threading.Lock()
+        self._stale_l1_then_hit = 0
+        self._stale_l1_then_miss = 0
+    
+    def get(self, key: str) -> Tuple[Optional[CacheEntry], bool]:
+        """Get an entry from the cache.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Tuple of (entry, hit) where hit indicates if the key was found
+        """
+        entry, hit = self.l1.get(key)
+        if hit:
+            return entry, True
+        entry, hit = self.l2.get(key)
+        if hit and entry is not None:
+            self._promote(key, entry)
+        return entry, hit
+    
+    def get_stale(self, key: str) -> Tuple[Optional[CacheEntry], bool]:
+        """Get an entry from the cache, including expired ones in the stale window.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Tuple of (entry, stale) where entry is None on a miss and stale
+            indicates the entry is past its TTL and should be refreshed
+        """
+        entry, stale = self.l1.get_stale(key)
+        if entry is not None and not stale:
+            return entry, False
+        # Another process may already have refreshed a stale L1 entry
+        shared, shared_stale = self.l2.get_stale(key)
+        if entry is not None:
+            self._count_stale_l1(hits=int(shared is not None), misses=int(shared is None))
+        if shared is None:
+            return entry, stale
+        self._promote(key, shared)
+        return shared, shared_stale
+    
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Tuple[CacheEntry, bool]]:
+        """Get several entries, asking L2 only for the keys L1 has no live entry for.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Mapping of each key found to (entry, stale)
+        """
+        found = self.l1.get_many(keys)
+        missing = [key for key in keys if key not in found or found[key][1]]
+        if missing:
+            shared = self.l2.get_many(missing)
+            stale_l1 = [key for key in missing if key in found]
+            if stale_l1:
+                hits = sum(1 for key in stale_l1 if key in shared)
+                self._count_stale_l1(hits=hits, misses=len(stale_l1) - hits)
+            for key, (entry, _) in shared.items():
+                self._promote(key, entry)
+            found.update(shared)
+        return found
+    
+    def _count_stale_l1(self, hits: int, misses: int) -> None:
+        """Record L2 outcomes of lookups that L1 already counted as stale hits."""
+        with self._lock:
+            self._stale_l1_then_hit += hits
+            self._stale_l1_then_miss += misses
+    
+    def _promote(self, key: str, entry: CacheEntry) -> None:
+        """Copy an L2 entry into L1."""
+        self.l1.restore(key, entry.value, entry.enabled, entry.found, entry.expires_at)
+    
+    def set(
+        self, 
+        key: str, 
+        value: str, 
+        enabled: bool, 
+        found: bool, 
+        ttl: Optional[float] = None
+    ) -> None:
+        """Set an entry in both levels.
+        
+        Args:
+            key: Cache key
+            value: Feature value
+            enabled: Whether feature is enabled
+            found: Whether feature was found
+            ttl: Time to live for this entry, defaults to the cache TTL
+        """
+        self.l2.set(key, value, enabled, found, ttl)
+        self.l1.set(key, value, enabled, found, ttl)
+    
+    def set_many(self, items: Iterable[CacheItem]) -> None:
+        """Set several entries in both levels.
+        
+        Args:
+            items: (key, value, enabled, found, ttl) tuples, ttl may be None
+        """
+        items = list(items)
+        self.l2.set_many(items)
+        self.l1.set_many(items)
+    
+    def restore(self, key: str, value: str, enabled: bool, found: bool, expires_at: float) -> None:
+        """Insert an entry that expires at a given wall-clock time into both levels.
+        
+        Args:
+            key: Cache key
+            value: Feature value
+            enabled: Whether feature is enabled
+            found: Whether feature was found
+            expires_at: Wall-clock time (time.time()) when the entry expires
+        """
+        self.l2.restore(key, value, enabled, found, expires_at)
+        self.l1.restore(key, value, enabled, found, expires_at)
+    
+    def items(self) -> List[Tuple[str, CacheEntry, float]]:
+        """Get the L1 entries that have not left the stale window.
+        
+        Returns:
+            List of (key, entry, expires_at) with wall-clock expiry times
+        """
+        return self.l1.items()
+    
+    def clear(self) -> None:
+        """Clear both levels."""
+        self.l1.clear()
+        self.l2.clear()
+    
+    def close(self) -> None:
+        """Release both levels."""
+        self.l1.close()
+        self.l2.close()
+    
+    def size(self) -> int:
+        """Get the number of entries in L2."""
+        return self.l2.size()
+    
+    def max_size(self) -> int:
+        """Get the maximum number of entries in L2."""
+        return self.l2.max_size()
+    
+    def stats(self) -> CacheStats:
+        """Get counters of both levels combined.
+        
+        Each lookup is counted once, at the level that served it: an L1 miss
+        that L2 answers counts as a hit, and a stale L1 entry counts only if
+        L2 had nothing newer.
+        """
+        l1, l2 = self.l1.stats(), self.l2.stats()
+        with self._lock:
+            then_hit, then_miss = self._stale_l1_then_hit, self._stale_l1_then_miss
+        merged = CacheStats.merge([l1, l2])
+        merged.hits -= then_hit
+        merged.stale_hits -= then_hit
+        merged.misses = l2.misses - then_miss
+        merged.size, merged.max_size = l2.size, l2.max_size
+        return merged
@@ -1,9 +1,15 @@
 """Main client implementation for togglr-sdk-python."""
 
-import hashlib
-import json
+import math
+import os
+import random
+import threading
 import time
-from typing import Any, Dict, Optional, Tuple, Union
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
 
 from togglr_client import ApiClient, Configuration
 from togglr_client.api.default_api import DefaultApi
@@ -12,9 +18,19 @@ from togglr_client.models.feature_error_report import FeatureErrorReport
 from togglr_client.models.feature_health import FeatureHealth
 from togglr_client.exceptions import ApiException
 
-from .cache import LRUCache
+from .aggregation import EventAggregator
+from .cache import CacheBackend, CacheEntry, CacheStats, LRUCache, ShardedLRUCache, TieredCache
 from .config import ClientConfig, CacheConfig
 from .context import RequestContext
+from .events import EventQueue, EventQueueStats, snapshot_event
+from .impressions import ImpressionRecorder, ImpressionStats
+from .metrics import CacheStatsReporter
+from .redis_cache import RedisCache, default_key_prefix
+from .refresh import BackgroundRefresher
+from .shm_cache import SharedMemoryCache, default_shared_memory_path
+from .singleflight import SingleFlight, SingleFlightStats
+from .snapshot import SnapshotScheduler, load_snapshot, save_snapshot
+from .spool import EventSpool, SpoolReplayer, SpoolStats
 from .track_event import TrackEvent
 from .errors import (
     TogglrError,
@@ -26,8 +42,417 @@ from .errors import (
     FeatureNotFoundError,
 )
 
+T = TypeVar("T")
 
-class Client:
+
+@dataclass
+class EvaluationResult:
+    """Outcome of evaluating one (feature_key, context) pair in warm() or evaluate_batch()."""
+    
+    feature_key: str
+    context: RequestContext
+    value: str = ""
+    enabled: bool = False
+    found: bool = False
+    error: Optional[Exception] = None
+    
+    @property
+    def ok(self) -> bool:
+        """Whether the evaluation succeeded."""
+        return self.error is None
+
+
+WarmResult = EvaluationResult
+
+
+class _BaseClient(ABC):
+    """Configuration, caching and retry policy shared by Client and AsyncClient."""
+    
+    def __init__(self, config: ClientConfig):
+        """Initialize the cache layer from the configuration.
+        
+        Args:
+            config: Client configuration
+        """
+        self.config = config
+        
+        # Passed to every request, the generated client has no default timeout
+        self._request_timeout: Union[float, Tuple[float, float]] = config.timeout
+        if config.connect_timeout is not None or config.read_timeout is not None:
+            self._request_timeout = (
+                config.timeout if config.connect_timeout is None else config.connect_timeout,
+                config.timeout if config.read_timeout is None else config.read_timeout,
+            )
+        
+        # Initialize cache if enabled
+        self._cache: Optional[CacheBackend] = None
+        if config.cache.enabled:
+            self._cache = self._build_cache(config)
+        
+        # Per-feature TTLs resolved from CacheConfig.ttl_overrides
+        self._feature_ttls: Dict[str, float] = {}
+        
+        # Not-found results get their own, separately sized cache so they
+        # cannot evict real entries
+        self._negative_cache: Optional[LRUCache] = None
+        if config.cache.enabled and config.cache.negative_ttl_seconds is not None:
+            self._negative_cache = LRUCache(
+                config.cache.negative_max_size,
+                config.cache.negative_ttl_seconds,
+            )
+        
+        # Stale entries, and entries picked for early refresh, are
+        # refreshed off the request path
+        self._refresh_enabled = bool(self._cache) and (
+            config.cache.stale_seconds > 0 or config.cache.early_refresh_beta > 0
+        )
+        self._fetch_latency = 0.0  # moving average of remote evaluations, seconds
+        self._snapshots: Optional[SnapshotScheduler] = None
+        self._stats_reporter: Optional[CacheStatsReporter] = None
+    
+    def _start_cache_tasks(self) -> None:
+        """Load the cache snapshot and start the snapshot and stats threads."""
+        config = self.config
+        
+        # Warm start from a previous snapshot
+        if self._cache and config.cache.snapshot_path:
+            self._load_snapshot(config.cache.snapshot_path)
+            if config.cache.snapshot_interval_seconds > 0:
+                self._snapshots = SnapshotScheduler(
+                    self._cache,
+                    config.cache.snapshot_path,
+                    config.cache.snapshot_interval_seconds,
+                    logger=config.logger,
+                )
+                self._snapshots.start()
+        
+        # Push cache stats to the metrics object, if requested
+        if self._cache and config.metrics is not None and config.cache.stats_interval_seconds > 0:
+            self._stats_reporter = CacheStatsReporter(
+                self.cache_stats,
+                config.metrics,
+                config.cache.stats_interval_seconds,
+                logger=config.logger,
+            )
+            self._stats_reporter.start()
+    
+    @staticmethod
+    def _build_cache(config: ClientConfig) -> CacheBackend:
+        """Create the cache backend selected by the configuration."""
+        cache_config = config.cache
+        backend = cache_config.backend
+        namespace = f"{config.base_url}|{config.api_key}"
+        shared: Optional[CacheBackend] = None
+        if not isinstance(backend, str):
+            shared = backend
+        elif backend in ("shared_memory", "redis"):
+            if cache_config.policy != "lru":
+                raise ValueError(f"The {backend} cache backend only supports the lru policy")
+            if cache_config.max_bytes is not None:
+                raise ValueError(f"The {backend} cache backend does not support max_bytes")
+            if backend == "shared_memory":
+                shared = SharedMemoryCache(
+                    cache_config.shared_memory_path or default_shared_memory_path(namespace),
+                    cache_config.max_size,
+                    cache_config.ttl_seconds,
+                    stale_seconds=cache_config.stale_seconds,
+                    slot_size=cache_config.shared_memory_slot_size,
+                )
+            else:
+                shared = RedisCache(
+                    cache_config.redis_url,
+                    cache_config.ttl_seconds,
+                    stale_seconds=cache_config.stale_seconds,
+                    key_prefix=default_key_prefix(namespace),
+                    timeout=config.timeout,
+                    logger=config.logger,
+                )
+        elif backend != "memory":
+            raise ValueError(f"Unknown cache backend: {backend}")
+        
+        if shared is not None:
+            if cache_config.l1_max_size <= 0:
+                return shared
+            return TieredCache(
+                LRUCache(cache_config.l1_max_size, cache_config.ttl_seconds, cache_config.stale_seconds),
+                shared,
+            )
+        if cache_config.shards > 1:
+            return ShardedLRUCache(
+                cache_config.max_size,
+                cache_config.ttl_seconds,
+                shards=cache_config.shards,
+                stale_seconds=cache_config.stale_seconds,
+                policy=cache_config.policy,
+                max_bytes=cache_config.max_bytes,
+            )
+        return LRUCache(
+            cache_config.max_size,
+            cache_config.ttl_seconds,
+            stale_seconds=cache_config.stale_seconds,
+            policy=cache_config.policy,
+            max_bytes=cache_config.max_bytes,
+        )
+    
+    def _close_cache(self) -> None:
+        """Stop the cache threads, save the snapshot and close the caches."""
+        if self._stats_reporter:
+            self._stats_reporter.stop()
+        if self._snapshots:
+            self._snapshots.stop()
+        if self._cache:
+            if self.config.cache.snapshot_path:
+                self._save_snapshot(self.config.cache.snapshot_path)
+            self._cache.close()
+        if self._negative_cache:
+            self._negative_cache.close()
+    
+    def _load_snapshot(self, path: str) -> None:
+        """Load cached evaluations saved by a previous process, if any."""
+        if not os.path.exists(path):
+            return
+        try:
+            load_snapshot(self._cache, path, stale_seconds=self.config.cache.stale_seconds)
+        except Exception as e:
+            if self.config.logger:
+                self.config.logger(f"Failed to load cache snapshot: {e}")
+    
+    def _save_snapshot(self, path: str) -> None:
+        """Save cached evaluations for the next process."""
+        try:
+            save_snapshot(self._cache, path)
+        except Exception as e:
+            if self.config.logger:
+                self.config.logger(f"Failed to save cache snapshot: {e}")
+    
+    def cache_stats(self) -> CacheStats:
+        """Get cumulative statistics of the evaluation cache.
+        
+        Returns:
+            CacheStats with hits, misses, expirations, evictions, coalesced
+            waits and the average age of served entries
+        """
+        stats = self._cache.stats() if self._cache else CacheStats()
+        if self._negative_cache:
+            # Not-found answers missed the main cache first
+            negative = self._negative_cache.stats()
+            stats.hits += negative.hits
+            stats.misses -= negative.hits
+        stats.coalesced = self.singleflight_stats().coalesced
+        return stats
+    
+    def _cached_evaluation(
+        self, 
+        feature_key: str, 
+        cache_key: str
+    ) -> Tuple[Optional[Tuple[str, bool, bool]], bool]:
+        """Look up an evaluation in the caches.
+        
+        Returns:
+            Tuple of (result, refresh) where result is None on a miss and
+            refresh tells whether the entry should be refreshed in the background
+        """
+        if self._cache:
+            entry, stale = self._cache.get_stale(cache_key)
+            if entry is not None:
+                refresh = stale or self._should_refresh_early(entry)
+                return (entry.value, entry.enabled, entry.found), refresh
+        
+        # Unknown features are answered for any context
+        if self._negative_cache:
+            _, hit = self._negative_cache.get(feature_key)
+            if hit:
+                return ("", False, False), False
+        
+        return None, False
+    
+    def _cached_evaluations(
+        self, 
+        feature_keys: List[str], 
+        context: RequestContext
+    ) -> Tuple[Dict[str, Tuple[str, bool, bool]], Dict[str, str]]:
+        """Look up several features for one context with a single cache round trip.
+        
+        Entries due for a refresh are refreshed in the background.
+        
+        Returns:
+            Tuple of (results, misses) mapping feature keys to cached results,
+            and feature keys that missed to their cache keys
+        """
+        fingerprint = context.fingerprint()
+        cache_keys = {feature_key: f"{feature_key}:{fingerprint}" for feature_key in feature_keys}
+        found = self._cache.get_many(list(cache_keys.values())) if self._cache else {}
+        
+        results: Dict[str, Tuple[str, bool, bool]] = {}
+        misses: Dict[str, str] = {}
+        for feature_key, cache_key in cache_keys.items():
+            if cache_key in found:
+                entry, stale = found[cache_key]
+                if stale or self._should_refresh_early(entry):
+                    self._refresh_in_background(feature_key, context, cache_key)
+                results[feature_key] = (entry.value, entry.enabled, entry.found)
+            elif self._negative_cache and self._negative_cache.get(feature_key)[1]:
+                # Unknown features are answered for any context
+                results[feature_key] = ("", False, False)
+            else:
+                misses[feature_key] = cache_key
+        return results, misses
+    
+    def _store_evaluation(
+        self, 
+        feature_key: str, 
+        cache_key: str, 
+        value: str, 
+        enabled: bool, 
+        found: bool
+    ) -> None:
+        """Cache the result of a remote evaluation."""
+        if not found and self._negative_cache:
+            self._negative_cache.set(feature_key, value, enabled, found)
+        elif self._cache:
+            self._cache.set(cache_key, value, enabled, found, ttl=self._ttl_for(feature_key))
+    
+    def _get_cache_key(self, feature_key: str, context: RequestContext) -> str:
+        """Generate cache key for feature and context."""
+        return f"{feature_key}:{context.fingerprint()}"
+    
+    def _ttl_for(self, feature_key: str) -> Optional[float]:
+        """Get the cache TTL for a new entry of a feature, None for the cache default."""
+        ttl: Optional[float] = None
+        if self.config.cache.ttl_overrides:
+            ttl = self._feature_ttls.get(feature_key)
+            if ttl is None:
+                ttl = self._feature_ttls[feature_key] = self.config.cache.ttl_for(feature_key)
+        
+        # Spread out the expiry of entries stored at the same moment
+        jitter = self.config.cache.ttl_jitter
+        if jitter > 0:
+            base = self.config.cache.ttl_seconds if ttl is None else ttl
+            ttl = base * (1.0 - jitter * random.random())
+        return ttl
+    
+    def _record_fetch_latency(self, seconds: float) -> None:
+        """Update the moving average of remote evaluation latency."""
+        if self._fetch_latency == 0.0:
+            self._fetch_latency = seconds
+        else:
+            self._fetch_latency += 0.2 * (seconds - self._fetch_latency)
+    
+    def _should_refresh_early(self, entry: CacheEntry) -> bool:
+        """Decide whether to refresh a live entry before it expires (XFetch).
+        
+        The closer the entry is to its deadline, and the longer a remote
+        evaluation takes, the more likely a refresh is, so entries stored
+        together are refreshed at different times.
+        """
+        beta = self.config.cache.early_refresh_beta
+        if beta <= 0 or self._fetch_latency == 0.0:
+            return False
+        # Entry deadlines are on the cache's clock, which tests can replace
+        now = getattr(self._cache, "clock", time.monotonic)()
+        remaining = entry.deadline - now
+        return -self._fetch_latency * beta * math.log(1.0 - random.random()) >= remaining
+    
+    def _deadline_at(self, deadline: Optional[float]) -> Optional[float]:
+        """Turn a per-call deadline in seconds, or the configured default, into a monotonic time."""
+        if deadline is None:
+            deadline = self.config.deadline
+        return None if deadline is None else time.monotonic() + deadline
+    
+    def _retry_delay(self, attempt_number: int, deadline_at: Optional[float]) -> Optional[float]:
+        """Get the backoff before a retry, None if the retry would not finish before the deadline."""
+        delay = self.config.backoff.calculate_delay(attempt_number)
+        if deadline_at is not None and time.monotonic() + delay + self._fetch_latency >= deadline_at:
+            return None
+        return delay
+    
+    def _attempt_timeout(self, deadline_at: Optional[float]) -> Optional[Union[float, Tuple[float, float]]]:
+        """Get the timeout for the next attempt, None if the deadline has passed."""
+        if deadline_at is None:
+            return self._request_timeout
+        remaining = deadline_at - time.monotonic()
+        if remaining <= 0:
+            return None
+        return self._timeout_within(remaining)
+    
+    def _retry_error(self, action: str, last_error: Optional[Exception]) -> TogglrError:
+        """Get the error to raise after the last attempt."""
+        if last_error is None:
+            return TogglrError(f"{action} failed: deadline exceeded")
+        
+        # Convert API exceptions to our error types
+        if isinstance(last_error, ApiException):
+            return self._convert_api_exception(last_error)
+        
+        # Keep errors the SDK raised for a status, such as NotFoundError
+        if isinstance(last_error, TogglrError) and last_error.status_code is not None:
+            return last_error
+        
+        return TogglrError(f"{action} failed: {last_error}")
+    
+    def _timeout_within(self, remaining: float) -> Union[float, Tuple[float, float]]:
+        """Get the request timeout capped to the remaining time budget."""
+        timeout = self._request_timeout
+        if isinstance(timeout, tuple):
+            # A single number bounds connect and read together
+            return timeout if sum(timeout) <= remaining else remaining
+        return min(timeout, remaining)
+    
+    def _should_retry(self, error: Exception) -> bool:
+        """Determine if an error should trigger a retry."""
+        if isinstance(error, ApiException):
+            # Don't retry on client errors (4xx)
+            if 400 <= error.status < 500:
+                return False
+            # Retry on server errors (5xx)
+            return error.status >= 500
+        
+        # Errors the SDK raised itself (4xx statuses, malformed responses)
+        # would fail the same way again
+        if isinstance(error, TogglrError):
+            return error.status_code is not None and error.status_code >= 500
+        
+        # Retry on network errors
+        return True
+    
+    def _is_transient_error(self, error: Exception) -> bool:
+        """Determine if a failed call may succeed later: rate limiting, server and network errors."""
+        if isinstance(error, TogglrError):
+            status = error.status_code
+        else:
+            status = getattr(error, "status", None)
+        return status is None or status == 429 or status >= 500
+    
+    @abstractmethod
+    def singleflight_stats(self) -> SingleFlightStats:
+        """Get counters for evaluation requests shared between concurrent callers."""
+    
+    @abstractmethod
+    def _refresh_in_background(
+        self, 
+        feature_key: str, 
+        context: RequestContext, 
+        cache_key: str
+    ) -> None:
+        """Schedule a refresh of a stale cache entry."""
+    
+    def _convert_api_exception(self, exc: ApiException) -> TogglrError:
+        """Convert API exception to our error type."""
+        if exc.status == 401:
+            return UnauthorizedError("Authentication required")
+        elif exc.status == 400:
+            return BadRequestError("Bad request")
+        elif exc.status == 404:
+            return NotFoundError("Resource not found")
+        elif exc.status == 429:
+            return TooManyRequestsError("Too many requests")
+        elif exc.status >= 500:
+            return InternalServerError("Internal server error")
+        else:
+            return TogglrError(f"API error: {exc.status}")
+
+
+class Client(_BaseClient):
     """Togglr SDK client for feature flag evaluation."""
     
     def __init__(self, config: ClientConfig):
@@ -36,7 +461,7 @@ class Client:
         Args:
             config: Client configuration
         """
-        self.config = config
+        super().__init__(config)
         
         # Create API client
         api_config = Configuration(
@@ -44,6 +469,7 @@ class Client:
             api_key={"ApiKeyAuth": config.api_key},
         )
         api_config.verify_ssl = not config.insecure
+        api_config.connection_pool_maxsize = config.max_connections
         
         # Configure TLS/SSL settings
         if config.ssl_ca_cert:
@@ -62,15 +488,120 @@ class Client:
         api_client = ApiClient(api_config)
         self._api_client = DefaultApi(api_client)
         
-        # Initialize cache if enabled
-        self._cache: Optional[LRUCache] = None
-        if config.cache.enabled:
-            self._cache = LRUCache(config.cache.max_size, config.cache.ttl_seconds)
+        # Concurrent misses for the same key share one request
+        self._inflight = SingleFlight()
+        
+        # Track events that fail during an outage are kept on disk, if requested
+        self._spool: Optional[EventSpool] = None
+        self._spool_replayer: Optional[SpoolReplayer] = None
+        if config.events.spool_path:
+            self._spool = EventSpool(
+                config.events.spool_path,
+                max_bytes=config.events.spool_max_bytes,
+                max_age_seconds=config.events.spool_max_age_seconds,
+                segment_bytes=config.events.spool_segment_bytes,
+                fsync_interval_seconds=config.events.spool_fsync_interval_seconds,
+            )
+            self._spool_replayer = SpoolReplayer(
+                self._spool,
+                lambda feature_key, event: self._track_event_with_retries(
+                    feature_key, event, self._deadline_at(None)
+                ),
+                self._is_transient_error,
+                rate_per_second=config.events.spool_replay_rate,
+                retry_interval_seconds=config.events.spool_retry_interval_seconds,
+                logger=config.logger,
+            )
+            self._spool_replayer.start()
+        
+        # Track events sent from a background queue, if requested
+        self._events: Optional[EventQueue] = None
+        if config.events.enabled:
+            self._events = EventQueue(
+                lambda feature_key, event: self._track_event_with_retries(
+                    feature_key, event, self._deadline_at(None)
+                ),
+                max_size=config.events.max_queue_size,
+                batch_size=config.events.batch_size,
+                flush_interval_seconds=config.events.flush_interval_seconds,
+                workers=config.events.workers,
+                logger=config.logger,
+                undeliverable=self._spool_event if self._spool else None,
+            )
+        
+        # Events summed per group and handed to the sink instead of the track API, if requested
+        self._aggregator: Optional[EventAggregator] = None
+        if config.events.aggregate_sink and config.events.aggregate_window_seconds:
+            self._aggregator = EventAggregator(
+                config.events.aggregate_sink,
+                window_seconds=config.events.aggregate_window_seconds,
+                context_keys=config.events.aggregate_context_keys,
+                max_groups=config.events.aggregate_max_groups,
+                logger=config.logger,
+            )
+        
+        # Impressions from evaluations, queued for the background thread
+        self._impressions: Optional[ImpressionRecorder] = None
+        self._impression_queue: Optional[EventQueue] = None
+        if config.events.impressions:
+            if self._events is None:
+                self._impression_queue = EventQueue(
+                    lambda feature_key, event: self._deliver_event(feature_key, event, self._deadline_at(None)),
+                    max_size=config.events.max_queue_size,
+                    batch_size=config.events.batch_size,
+                    flush_interval_seconds=config.events.flush_interval_seconds,
+                    workers=config.events.workers,
+                    logger=config.logger,
+                    undeliverable=self._spool_event if self._spool else None,
+                )
+            self._impressions = ImpressionRecorder(
+                self._queue_impression,
+                sample_rate=config.events.impression_sample_rate,
+                dedup_window_seconds=config.events.impression_dedup_seconds,
+                dedup_max_size=config.events.impression_dedup_max_size,
+            )
+        
+        # Worker threads for evaluate_many, created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        
+        self._refresher: Optional[BackgroundRefresher] = None
+        if self._refresh_enabled:
+            self._refresher = BackgroundRefresher(
+                max_workers=config.cache.refresh_workers,
+                logger=config.logger,
+            )
+        
+        self._start_cache_tasks()
     
     def close(self) -> None:
         """Close the client and clean up resources."""
-        if self._cache:
-            self._cache.clear()
+        if self._impression_queue:
+            self._impression_queue.close(self.config.events.close_timeout_seconds)
+        if self._aggregator:
+            self._aggregator.close()
+        if self._events:
+            self._events.close(self.config.events.close_timeout_seconds)
+        if self._spool_replayer:
+            self._spool_replayer.stop()
+        if self._spool:
+            self._spool.close()
+        if self._refresher:
+            self._refresher.close()
+        if self._executor:
+            self._executor.shutdown(wait=True)
+        self._close_cache()
+    
+    def _fan_out_executor(self) -> ThreadPoolExecutor:
+        """Get the worker pool for concurrent evaluations, sized to the connection pool."""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.config.max_connections,
+                        thread_name_prefix="togglr-eval",
+                    )
+        return self._executor
     
     def __enter__(self):
         """Context manager entry."""
@@ -80,6 +611,15 @@ class Client:
         """Context manager exit."""
         self.close()
     
+    def singleflight_stats(self) -> SingleFlightStats:
+        """Get counters for evaluation requests shared between concurrent callers.
+        
+        Returns:
+            SingleFlightStats with the number of requests sent and the
+            number of callers that waited on another caller's request
+        """
+        return self._inflight.stats()
+    
     def health_check(self) -> bool:
         """Perform a health check on the API.
         
@@ -87,7 +627,7 @@ class Client:
             True if healthy, False otherwise
         """
         try:
-            response = self._api_client.sdk_v1_health_get()
+            response = self._api_client.sdk_v1_health_get(_request_timeout=self._request_timeout)
             return response.status == "ok"
         except Exception:
             return False
@@ -95,28 +635,204 @@ class Client:
     def evaluate(
         self, 
         feature_key: str, 
-        context: RequestContext
+        context: RequestContext, 
+        deadline: Optional[float] = None
     ) -> Tuple[str, bool, bool]:
         """Evaluate a feature flag.
         
         Args:
             feature_key: The feature key to evaluate
             context: Request context
+            deadline: Total seconds to spend, including retries and backoff;
+                defaults to config.deadline
             
         Returns:
             Tuple of (value, enabled, found)
             
         Raises:
-            TogglrError: If evaluation fails
+            TogglrError: If evaluation fails or runs out of time
+        """
+        result = self._evaluate_with_retries(feature_key, context, self._deadline_at(deadline))
+        if self._impressions:
+            self._impressions.record(feature_key, context, result[0], result[2])
+        return result
+    
+    def evaluate_many(
+        self, 
+        feature_keys: Iterable[str], 
+        context: RequestContext, 
+        deadline: Optional[float] = None
+    ) -> Dict[str, Tuple[str, bool, bool]]:
+        """Evaluate several feature flags for the same context.
+        
+        Cached results are looked up together and returned without waiting;
+        the misses are evaluated concurrently over the connection pool, so
+        the call takes about as long as the slowest single evaluation.
+        
+        Args:
+            feature_keys: The feature keys to evaluate
+            context: Request context
+            deadline: Total seconds to spend, defaults to config.deadline
+            
+        Returns:
+            Mapping of each feature key to (value, enabled, found), in input order
+            
+        Raises:
+            TogglrError: If any evaluation fails, after all of them have finished
         """
-        return self._evaluate_with_retries(feature_key, context)
+        deadline_at = self._deadline_at(deadline)
+        feature_keys = list(dict.fromkeys(feature_keys))
+        results, misses = self._cached_evaluations(feature_keys, context)
+        
+        if len(misses) == 1:
+            (feature_key, cache_key), = misses.items()
+            results[feature_key] = self._fetch_evaluation(feature_key, context, cache_key, deadline_at)
+        elif misses:
+            executor = self._fan_out_executor()
+            futures = {
+                feature_key: executor.submit(self._fetch_evaluation, feature_key, context, cache_key, deadline_at)
+                for feature_key, cache_key in misses.items()
+            }
+            wait(futures.values())
+            for feature_key, future in futures.items():
+                results[feature_key] = future.result()
+        
+        if self._impressions:
+            for feature_key in feature_keys:
+                value, _, found = results[feature_key]
+                self._impressions.record(feature_key, context, value, found)
+        return {feature_key: results[feature_key] for feature_key in feature_keys}
     
-    def is_enabled(self, feature_key: str, context: RequestContext) -> bool:
+    def warm(
+        self, 
+        pairs: Iterable[Tuple[str, RequestContext]], 
+        concurrency: int = 8
+    ) -> List[WarmResult]:
+        """Prefetch evaluations into the cache, e.g. before reporting readiness.
+        
+        Every pair is evaluated over the network (bypassing cached entries)
+        on a bounded worker pool sharing the client's connection pool.
+        
+        Args:
+            pairs: (feature_key, context) pairs to evaluate
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            One WarmResult per pair, in input order
+        """
+        pairs = list(pairs)
+        if not pairs:
+            return []
+        
+        def warm_one(pair: Tuple[str, RequestContext]) -> WarmResult:
+            feature_key, context = pair
+            try:
+                value, enabled, found = self._fetch_evaluation(
+                    feature_key,
+                    context,
+                    self._get_cache_key(feature_key, context),
+                    self._deadline_at(None),
+                )
+                return WarmResult(feature_key, context, value, enabled, found)
+            except Exception as e:
+                return WarmResult(feature_key, context, error=e)
+        
+        workers = max(1, min(concurrency, self.config.max_connections, len(pairs)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="togglr-warm") as executor:
+            return list(executor.map(warm_one, pairs))
+    
+    def evaluate_batch(
+        self, 
+        feature_key: str, 
+        contexts: Iterable[RequestContext], 
+        concurrency: int = 8
+    ) -> Iterator[EvaluationResult]:
+        """Evaluate one feature for many contexts, e.g. for audience sizing or backfills.
+        
+        Results are yielded in input order as they become available, with at
+        most concurrency requests in flight, so contexts can be streamed from
+        any source without holding them all in memory. Contexts with the same
+        fingerprint share one request while in flight, and later repeats are
+        served from the cache when it is enabled.
+        
+        Args:
+            feature_key: The feature key to evaluate
+            contexts: Request contexts to evaluate the feature for
+            concurrency: Maximum number of requests in flight
+            
+        Yields:
+            One EvaluationResult per context, with the error if it failed
+        """
+        concurrency = max(1, min(concurrency, self.config.max_connections))
+        executor = self._fan_out_executor()
+        # Queued results in input order, as (context, cache_key, result or Future)
+        window: Deque[Tuple[RequestContext, str, Any]] = deque()
+        pending: Dict[str, Future] = {}
+        
+        try:
+            for context in contexts:
+                cache_key = self._get_cache_key(feature_key, context)
+                outcome: Any = pending.get(cache_key)
+                if outcome is None:
+                    outcome, refresh = self._cached_evaluation(feature_key, cache_key)
+                    if refresh:
+                        self._refresh_in_background(feature_key, context, cache_key)
+                if outcome is None:
+                    while len(pending) >= concurrency:
+                        yield self._batch_result(feature_key, window.popleft(), pending)
+                    outcome = pending[cache_key] = executor.submit(
+                        self._fetch_evaluation, feature_key, context, cache_key, self._deadline_at(None)
+                    )
+                
+                # Results wait behind the oldest request; bound how many
+                window.append((context, cache_key, outcome))
+                while window and (len(window) > 4 * concurrency or self._batch_ready(window[0])):
+                    yield self._batch_result(feature_key, window.popleft(), pending)
+            
+            while window:
+                yield self._batch_result(feature_key, window.popleft(), pending)
+        finally:
+            for future in pending.values():
+                future.cancel()
+    
+    @staticmethod
+    def _batch_ready(item: Tuple[RequestContext, str, Any]) -> bool:
+        """Whether a queued evaluate_batch() result can be yielded without waiting."""
+        outcome = item[2]
+        return not isinstance(outcome, Future) or outcome.done()
+    
+    def _batch_result(
+        self, 
+        feature_key: str, 
+        item: Tuple[RequestContext, str, Any], 
+        pending: Dict[str, Future]
+    ) -> EvaluationResult:
+        """Wait for a queued evaluate_batch() result."""
+        context, cache_key, outcome = item
+        if isinstance(outcome, Future):
+            if pending.get(cache_key) is outcome:
+                del pending[cache_key]
+            try:
+                outcome = outcome.result()
+            except Exception as e:
+                return EvaluationResult(feature_key, context, error=e)
+        value, enabled, found = outcome
+        if self._impressions:
+            self._impressions.record(feature_key, context, value, found)
+        return EvaluationResult(feature_key, context, value, enabled, found)
+    
+    def is_enabled(
+        self, 
+        feature_key: str, 
+        context: RequestContext, 
+        deadline: Optional[float] = None
+    ) -> bool:
         """Check if a feature is enabled.
         
         Args:
             feature_key: The feature key to check
             context: Request context
+            deadline: Total seconds to spend, defaults to config.deadline
             
         Returns:
             True if enabled, False otherwise
@@ -125,7 +841,7 @@ class Client:
             TogglrError: If evaluation fails
             FeatureNotFoundError: If feature is not found
         """
-        value, enabled, found = self.evaluate(feature_key, context)
+        value, enabled, found = self.evaluate(feature_key, context, deadline)
         if not found:
             raise FeatureNotFoundError(f"Feature '{feature_key}' not found")
         return enabled
@@ -134,7 +850,8 @@ class Client:
         self, 
         feature_key: str, 
         context: RequestContext, 
-        default: bool = False
+        default: bool = False, 
+        deadline: Optional[float] = None
     ) -> bool:
         """Check if a feature is enabled, returning default on error.
         
@@ -142,12 +859,13 @@ class Client:
             feature_key: The feature key to check
             context: Request context
             default: Default value to return on error
+            deadline: Total seconds to spend, defaults to config.deadline
             
         Returns:
             True if enabled, default value on error
         """
         try:
-            return self.is_enabled(feature_key, context)
+            return self.is_enabled(feature_key, context, deadline)
         except Exception as e:
             if self.config.logger:
                 self.config.logger(f"Evaluation failed, using default: {e}")
@@ -158,7 +876,8 @@ class Client:
         feature_key: str, 
         error_type: str, 
         error_message: str, 
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None, 
+        deadline: Optional[float] = None
     ) -> None:
         """Report a feature execution error for auto-disable functionality.
         
@@ -167,17 +886,21 @@ class Client:
             error_type: Type of error (e.g., 'timeout', 'validation', 'service_unavailable')
             error_message: Human-readable error message
             context: Optional context data for the error
+            deadline: Total seconds to spend, defaults to config.deadline
             
         Raises:
             TogglrError: If error reporting fails
         """
-        self._report_error_with_retries(feature_key, error_type, error_message, context)
+        self._report_error_with_retries(
+            feature_key, error_type, error_message, context, self._deadline_at(deadline)
+        )
     
-    def get_feature_health(self, feature_key: str) -> FeatureHealth:
+    def get_feature_health(self, feature_key: str, deadline: Optional[float] = None) -> FeatureHealth:
         """Get the health status of a feature.
         
         Args:
             feature_key: The feature key to get health for
+            deadline: Total seconds to spend, defaults to config.deadline
             
         Returns:
             FeatureHealth object with health information
@@ -185,13 +908,14 @@ class Client:
         Raises:
             TogglrError: If health retrieval fails
         """
-        return self._get_feature_health_with_retries(feature_key)
+        return self._get_feature_health_with_retries(feature_key, self._deadline_at(deadline))
     
-    def is_feature_healthy(self, feature_key: str) -> bool:
+    def is_feature_healthy(self, feature_key: str, deadline: Optional[float] = None) -> bool:
         """Check if a feature is healthy (enabled and not auto-disabled).
         
         Args:
             feature_key: The feature key to check
+            deadline: Total seconds to spend, defaults to config.deadline
             
         Returns:
             True if feature is healthy, False otherwise
@@ -199,73 +923,254 @@ class Client:
         Raises:
             TogglrError: If health check fails
         """
-        health = self.get_feature_health(feature_key)
+        health = self.get_feature_health(feature_key, deadline)
         return health.enabled and not health.auto_disabled
     
-    def track_event(self, feature_key: str, event: TrackEvent) -> None:
+    def track_event(self, feature_key: str, event: TrackEvent, deadline: Optional[float] = None) -> None:
         """Track an event for analytics.
         
+        With the event queue enabled (config.events) the event is queued and
+        sent in the background; delivery failures are logged and counted in
+        event_stats() instead of raised. With the event spool enabled, events
+        that fail with 429, 5xx or network errors are written to disk and
+        replayed once the server recovers instead of raised. With event
+        aggregation enabled, events are summed per group and passed to the
+        aggregation sink as one EventSummary per window; they are not sent
+        to the track API.
+        
         Args:
             feature_key: The feature key to track an event for
             event: The track event to send
+            deadline: Total seconds to spend, defaults to config.deadline;
+                not used for queued events
             
         Raises:
             TogglrError: If tracking fails
         """
-        self._track_event_with_retries(feature_key, event)
+        if self._aggregator and self._aggregator.add(feature_key, event):
+            return
+        self._deliver_event(feature_key, event, self._deadline_at(deadline))
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Send the queued track events and emit the aggregated summaries now and wait for them.
+        
+        Args:
+            timeout: Maximum seconds to wait, None to wait until done
+            
+        Returns:
+            True if every event queued before the call was sent or given up on
+        """
+        deadline_at = None if timeout is None else time.monotonic() + timeout
+        flushed = True
+        if self._impression_queue:
+            flushed = self._impression_queue.flush(timeout)
+        if self._aggregator:
+            self._aggregator.flush()
+        if self._events:
+            remaining = None if deadline_at is None else max(0.0, deadline_at - time.monotonic())
+            flushed = self._events.flush(remaining) and flushed
+        return flushed
+    
+    def event_stats(self) -> EventQueueStats:
+        """Get counters of the track event queue.
+        
+        Returns:
+            EventQueueStats with queued, sent, failed, dropped, spooled and
+            aggregated events
+        """
+        stats = self._events.stats() if self._events else EventQueueStats()
+        if self._impression_queue:
+            impressions = self._impression_queue.stats()
+            stats.queued += impressions.queued
+            stats.sent += impressions.sent
+            stats.failed += impressions.failed
+            stats.dropped += impressions.dropped
+            stats.spooled += impressions.spooled
+        if self._aggregator:
+            stats.aggregated = self._aggregator.aggregated()
+        return stats
+    
+    def impression_stats(self) -> ImpressionStats:
+        """Get counters of impressions recorded from evaluations.
+        
+        Returns:
+            ImpressionStats with recorded, deduplicated and sampled-out impressions
+        """
+        return self._impressions.stats() if self._impressions else ImpressionStats()
+    
+    def spool_stats(self) -> SpoolStats:
+        """Get counters of the track event spool.
+        
+        Returns:
+            SpoolStats with spooled, replayed, expired and dropped events
+        """
+        return self._spool.stats() if self._spool else SpoolStats()
+    
+    def _queue_impression(self, feature_key: str, event: TrackEvent) -> None:
+        """Hand an impression to a background queue, never sending or aggregating it."""
+        queue = self._events if self._events is not None else self._impression_queue
+        assert queue is not None  # impressions get their own queue when events are not queued
+        queue.put(feature_key, event)
+    
+    def _deliver_event(self, feature_key: str, event: TrackEvent, deadline_at: Optional[float]) -> None:
+        """Queue an event, or send it now and spool it if the server is unavailable."""
+        if self._events:
+            self._events.put(feature_key, event)
+            return
+        if self._spool:
+            # The spooled copy must carry the dedup_key of the attempts that
+            # may have reached the server
+            event = snapshot_event(event)
+        try:
+            self._track_event_with_retries(feature_key, event, deadline_at)
+        except TogglrError as e:
+            if not self._spool_event(feature_key, event, e):
+                raise
+    
+    def _spool_event(self, feature_key: str, event: TrackEvent, error: Exception) -> bool:
+        """Write an event that failed with a transient error to the spool.
+        
+        Returns:
+            True if the event was spooled
+        """
+        if self._spool is None or not self._is_transient_error(error):
+            return False
+        if not self._spool.append(feature_key, snapshot_event(event)):
+            return False
+        if self.config.logger:
+            self.config.logger(f"Spooled track event for {feature_key}: {error}")
+        return True
     
     def _evaluate_with_retries(
         self, 
         feature_key: str, 
-        context: RequestContext
+        context: RequestContext, 
+        deadline_at: Optional[float] = None
     ) -> Tuple[str, bool, bool]:
         """Evaluate feature with retry logic."""
         # Check cache first
-        if self._cache:
-            cache_key = self._get_cache_key(feature_key, context)
-            entry, hit = self._cache.get(cache_key)
-            if hit:
-                return entry.value, entry.enabled, entry.found
+        cache_key = self._get_cache_key(feature_key, context)
+        result, refresh = self._cached_evaluation(feature_key, cache_key)
+        if refresh:
+            self._refresh_in_background(feature_key, context, cache_key)
+        if result is not None:
+            return result
+        
+        return self._fetch_evaluation(feature_key, context, cache_key, deadline_at)
+    
+    def _fetch_evaluation(
+        self, 
+        feature_key: str, 
+        context: RequestContext, 
+        cache_key: str, 
+        deadline_at: Optional[float] = None
+    ) -> Tuple[str, bool, bool]:
+        """Evaluate feature over the network, sharing in-flight requests for the same key."""
+        wait = None if deadline_at is None else max(0.0, deadline_at - time.monotonic())
+        try:
+            result, _ = self._inflight.do(
+                cache_key,
+                lambda: self._evaluate_remote(feature_key, context, cache_key, deadline_at),
+                timeout=wait,
+            )
+        except TimeoutError:
+            # The shared request outlived this caller's deadline
+            raise TogglrError("Evaluation failed: deadline exceeded")
+        return result
+    
+    def _evaluate_remote(
+        self, 
+        feature_key: str, 
+        context: RequestContext, 
+        cache_key: str, 
+        deadline_at: Optional[float] = None
+    ) -> Tuple[str, bool, bool]:
+        """Evaluate feature over the network with retries and cache the result."""
+        def attempt(timeout: Union[float, Tuple[float, float]]) -> Tuple[str, bool, bool]:
+            started = time.monotonic()
+            value, enabled, found = self._evaluate_single(feature_key, context, timeout)
+            self._record_fetch_latency(time.monotonic() - started)
+            
+            # Cache result if successful
+            self._store_evaluation(feature_key, cache_key, value, enabled, found)
+            
+            return value, enabled, found
+        
+        return self._call_with_retries(attempt, "Evaluation", deadline_at)
+    
+    def _call_with_retries(
+        self, 
+        attempt: Callable[[Union[float, Tuple[float, float]]], T], 
+        action: str, 
+        deadline_at: Optional[float] = None
+    ) -> T:
+        """Run a request with retries and backoff, within an optional deadline.
+        
+        Each attempt's timeout is cut down to the time remaining, and a retry
+        is skipped when the backoff plus a typical round trip would not fit.
         
+        Args:
+            attempt: Performs one request, given the timeout to use
+            action: Name of the operation for error messages
+            deadline_at: Monotonic time by which to give up, None for no limit
+            
+        Returns:
+            The result of the first successful attempt
+            
+        Raises:
+            TogglrError: If every attempt failed or the deadline ran out
+        """
         last_error = None
         
-        for attempt in range(self.config.retries + 1):
-            if attempt > 0:
-                # Calculate backoff delay
-                delay = self.config.backoff.calculate_delay(attempt)
+        for attempt_number in range(self.config.retries + 1):
+            if attempt_number > 0:
+                delay = self._retry_delay(attempt_number, deadline_at)
+                if delay is None:
+                    break
                 time.sleep(delay)
             
+            timeout = self._attempt_timeout(deadline_at)
+            if timeout is None:
+                break
+            
             try:
-                value, enabled, found = self._evaluate_single(feature_key, context)
-                
-                # Cache result if successful
-                if self._cache:
-                    cache_key = self._get_cache_key(feature_key, context)
-                    self._cache.set(cache_key, value, enabled, found)
-                
-                return value, enabled, found
+                return attempt(timeout)
                 
             except Exception as e:
                 last_error = e
                 if not self._should_retry(e):
                     break
         
-        # Convert API exceptions to our error types
-        if isinstance(last_error, ApiException):
-            raise self._convert_api_exception(last_error)
-        
-        raise TogglrError(f"Evaluation failed: {last_error}")
+        raise self._retry_error(action, last_error)
+    
+    def _refresh_in_background(
+        self, 
+        feature_key: str, 
+        context: RequestContext, 
+        cache_key: str
+    ) -> None:
+        """Schedule a refresh of a stale cache entry."""
+        if self._refresher is None:
+            return
+        # Snapshot the context, the caller may keep modifying it
+        snapshot = RequestContext(context.to_dict())
+        self._refresher.submit(
+            cache_key,
+            lambda: self._fetch_evaluation(feature_key, snapshot, cache_key, self._deadline_at(None)),
+        )
     
     def _evaluate_single(
         self, 
         feature_key: str, 
-        context: RequestContext
+        context: RequestContext, 
+        timeout: Optional[Union[float, Tuple[float, float]]] = None
     ) -> Tuple[str, bool, bool]:
         """Perform a single evaluation request."""
         try:
             response = self._api_client.sdk_v1_features_feature_key_evaluate_post(
                 feature_key=feature_key,
-                request_body=context.to_dict()
+                request_body=context.to_dict(),
+                _request_timeout=self._request_timeout if timeout is None else timeout,
             )
             
             if isinstance(response, EvaluateResponse):
@@ -279,76 +1184,30 @@ class Client:
                 return "", False, False  # Feature not found, not an error
             raise e
     
-    def _get_cache_key(self, feature_key: str, context: RequestContext) -> str:
-        """Generate cache key for feature and context."""
-        context_str = json.dumps(context.to_dict(), sort_keys=True)
-        context_hash = hashlib.md5(context_str.encode()).hexdigest()
-        return f"{feature_key}:{context_hash}"
-    
-    def _should_retry(self, error: Exception) -> bool:
-        """Determine if an error should trigger a retry."""
-        if isinstance(error, ApiException):
-            # Don't retry on client errors (4xx)
-            if 400 <= error.status < 500:
-                return False
-            # Retry on server errors (5xx)
-            return error.status >= 500
-        
-        # Retry on network errors
-        return True
-    
-    def _convert_api_exception(self, exc: ApiException) -> TogglrError:
-        """Convert API exception to our error type."""
-        if exc.status == 401:
-            return UnauthorizedError("Authentication required")
-        elif exc.status == 400:
-            return BadRequestError("Bad request")
-        elif exc.status == 404:
-            return NotFoundError("Resource not found")
-        elif exc.status == 429:
-            return TooManyRequestsError("Too many requests")
-        elif exc.status >= 500:
-            return InternalServerError("Internal server error")
-        else:
-            return TogglrError(f"API error: {exc.status}")
-    
     def _report_error_with_retries(
         self, 
         feature_key: str, 
         error_type: str, 
         error_message: str, 
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None, 
+        deadline_at: Optional[float] = None
     ) -> None:
         """Report error with retry logic."""
-        last_error = None
-        
-        for attempt in range(self.config.retries + 1):
-            if attempt > 0:
-                # Calculate backoff delay
-                delay = self.config.backoff.calculate_delay(attempt)
-                time.sleep(delay)
-            
-            try:
-                self._report_error_single(feature_key, error_type, error_message, context)
-                return  # Success, exit retry loop
-                
-            except Exception as e:
-                last_error = e
-                if not self._should_retry(e):
-                    break
-        
-        # Convert API exceptions to our error types
-        if isinstance(last_error, ApiException):
-            raise self._convert_api_exception(last_error)
-        
-        raise TogglrError(f"Error reporting failed: {last_error}")
+        self._call_with_retries(
+            lambda timeout: self._report_error_single(
+                feature_key, error_type, error_message, context, timeout
+            ),
+            "Error reporting",
+            deadline_at,
+        )
     
     def _report_error_single(
         self, 
         feature_key: str, 
         error_type: str, 
         error_message: str, 
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None, 
+        timeout: Optional[Union[float, Tuple[float, float]]] = None
     ) -> None:
         """Perform a single error report request."""
         try:
@@ -362,7 +1221,8 @@ class Client:
             # Make API call
             response = self._api_client.report_feature_error(
                 feature_key=feature_key,
-                feature_error_report=error_report
+                feature_error_report=error_report,
+                _request_timeout=self._request_timeout if timeout is None else timeout,
             )
             
             # 202 response means success - error queued for processing
@@ -374,34 +1234,29 @@ class Client:
                 raise NotFoundError("Feature not found")
             raise e
     
-    def _get_feature_health_with_retries(self, feature_key: str) -> FeatureHealth:
+    def _get_feature_health_with_retries(
+        self, 
+        feature_key: str, 
+        deadline_at: Optional[float] = None
+    ) -> FeatureHealth:
         """Get feature health with retry logic."""
-        last_error = None
-        
-        for attempt in range(self.config.retries + 1):
-            if attempt > 0:
-                # Calculate backoff delay
-                delay = self.config.backoff.calculate_delay(attempt)
-                time.sleep(delay)
-            
-            try:
-                return self._get_feature_health_single(feature_key)
-                
-            except Exception as e:
-                last_error = e
-                if not self._should_retry(e):
-                    break
-        
-        # Convert API exceptions to our error types
-        if isinstance(last_error, ApiException):
-            raise self._convert_api_exception(last_error)
-        
-        raise TogglrError(f"Health retrieval failed: {last_error}")
+        return self._call_with_retries(
+            lambda timeout: self._get_feature_health_single(feature_key, timeout),
+            "Health retrieval",
+            deadline_at,
+        )
     
-    def _get_feature_health_single(self, feature_key: str) -> FeatureHealth:
+    def _get_feature_health_single(
+        self, 
+        feature_key: str, 
+        timeout: Optional[Union[float, Tuple[float, float]]] = None
+    ) -> FeatureHealth:
         """Perform a single health check request."""
         try:
-            response = self._api_client.get_feature_health(feature_key=feature_key)
+            response = self._api_client.get_feature_health(
+                feature_key=feature_key,
+                _request_timeout=self._request_timeout if timeout is None else timeout,
+            )
             
             if isinstance(response, FeatureHealth):
                 return response
@@ -414,32 +1269,25 @@ class Client:
                 raise NotFoundError("Feature not found")
             raise e
     
-    def _track_event_with_retries(self, feature_key: str, event: TrackEvent) -> None:
+    def _track_event_with_retries(
+        self, 
+        feature_key: str, 
+        event: TrackEvent, 
+        deadline_at: Optional[float] = None
+    ) -> None:
         """Track event with retry logic."""
-        last_error = None
-        
-        for attempt in range(self.config.retries + 1):
-            if attempt > 0:
-                # Calculate backoff delay
-                delay = self.config.backoff.calculate_delay(attempt)
-                time.sleep(delay)
-            
-            try:
-                self._track_event_single(feature_key, event)
-                return  # Success, exit retry loop
-                
-            except Exception as e:
-                last_error = e
-                if not self._should_retry(e):
-                    break
-        
-        # Convert API exceptions to our error types
-        if isinstance(last_error, ApiException):
-            raise self._convert_api_exception(last_error)
-        
-        raise TogglrError(f"Event tracking failed: {last_error}")
+        self._call_with_retries(
+            lambda timeout: self._track_event_single(feature_key, event, timeout),
+            "Event tracking",
+            deadline_at,
+        )
     
-    def _track_event_single(self, feature_key: str, event: TrackEvent) -> None:
+    def _track_event_single(
+        self, 
+        feature_key: str, 
+        event: TrackEvent, 
+        timeout: Optional[Union[float, Tuple[float, float]]] = None
+    ) -> None:
         """Perform a single track event request."""
         try:
             # Convert track event to API format
@@ -448,7 +1296,8 @@ class Client:
             # Make API call
             response = self._api_client.track_feature_event(
                 feature_key=feature_key,
-                track_request=track_request
+                track_request=track_request,
+                _request_timeout=self._request_timeout if timeout is None else timeout,
             )
             
             # Success - event queued for processing
@@ -1,7 +1,7 @@
 """Configuration classes for togglr-sdk-python."""
 
 import time
-from typing import Optional, Callable, Any, Union
+from typing import Optional, Callable, Any, Dict, List, Union
 from dataclasses import dataclass, field
 
 
@@ -31,6 +31,69 @@ class CacheConfig:
     enabled: bool = False
     max_size: int = 100
     ttl_seconds: float = 5.0
+    shards: int = 1  # >1 splits the cache into independently locked shards
+    policy: str = "lru"  # "lru" or "tinylfu" (frequency-aware admission for skewed traffic)
+    max_bytes: Optional[int] = None  # bound the cache by estimated memory instead of max_size
+    stale_seconds: float = 0.0  # serve expired entries this long while refreshing
+    refresh_workers: int = 2  # background threads refreshing stale entries
+    backend: Union[str, Any] = "memory"  # "memory", "shared_memory", "redis" or a CacheBackend
+    redis_url: str = "redis://localhost:6379/0"  # server for the "redis" backend
+    l1_max_size: int = 0  # >0 keeps an in-process LRU of this size in front of a shared backend
+    shared_memory_path: Optional[str] = None  # defaults to a per-API-key file in /dev/shm
+    shared_memory_slot_size: int = 256  # bytes per shared entry, larger values are not cached
+    snapshot_path: Optional[str] = None  # load on start, save on close
+    snapshot_interval_seconds: float = 0.0  # >0 also saves periodically
+    negative_ttl_seconds: Optional[float] = None  # cache not-found features separately for this long
+    negative_max_size: int = 100  # max number of not-found features cached
+    ttl_overrides: Dict[str, float] = field(default_factory=dict)  # feature key or "prefix*" -> TTL
+    ttl_jitter: float = 0.0  # shorten each entry's TTL by a random fraction up to this
+    early_refresh_beta: float = 0.0  # >0 refreshes entries probabilistically before expiry (XFetch)
+    stats_interval_seconds: float = 0.0  # >0 pushes cache stats to ClientConfig.metrics
+    
+    def ttl_for(self, feature_key: str) -> float:
+        """Get the TTL for a feature, applying the most specific override."""
+        ttl = self.ttl_overrides.get(feature_key)
+        if ttl is not None:
+            return ttl
+        
+        ttl, matched = self.ttl_seconds, -1
+        for pattern, pattern_ttl in self.ttl_overrides.items():
+            if pattern.endswith("*") and len(pattern) > matched and feature_key.startswith(pattern[:-1]):
+                ttl, matched = pattern_ttl, len(pattern)
+        return ttl
+
+
+@dataclass
+class EventsConfig:
+    """Configuration for background delivery of track events."""
+    
+    enabled: bool = False  # track_event() queues events instead of sending them on the caller's thread
+    max_queue_size: int = 10000  # events beyond this are dropped
+    batch_size: int = 100  # send once this many events are queued
+    flush_interval_seconds: float = 1.0  # send at least this often
+    workers: int = 4  # events sent concurrently
+    close_timeout_seconds: float = 5.0  # time Client.close() spends draining the queue
+    
+    # Disk spool for events that fail with 429, 5xx or network errors
+    spool_path: Optional[str] = None  # directory of the spool, None to disable
+    spool_max_bytes: int = 64 * 1024 * 1024  # oldest spooled events are dropped beyond this
+    spool_max_age_seconds: float = 24 * 3600.0  # spooled events older than this are not replayed
+    spool_segment_bytes: int = 1024 * 1024  # size of each spool file
+    spool_fsync_interval_seconds: float = 1.0  # maximum time spooled events wait for fsync
+    spool_replay_rate: float = 50.0  # events replayed per second once the server recovers
+    spool_retry_interval_seconds: float = 5.0  # pause between replay attempts during an outage
+    
+    # Aggregation of events into summaries, handed to aggregate_sink instead of the track API
+    aggregate_sink: Optional[Callable[[Any], None]] = None  # receives each EventSummary, None to disable
+    aggregate_window_seconds: Optional[float] = None  # summaries are emitted this often, None to disable
+    aggregate_context_keys: List[str] = field(default_factory=list)  # context keys that split groups
+    aggregate_max_groups: int = 10000  # events starting further groups are sent individually
+    
+    # Impressions recorded by evaluate() and sent in the background
+    impressions: bool = False  # record an impression for each evaluation
+    impression_sample_rate: float = 1.0  # fraction of impressions kept after dedup
+    impression_dedup_seconds: float = 60.0  # repeats per user, feature and value are skipped, 0 to keep all
+    impression_dedup_max_size: int = 100000  # (user, feature, value) keys remembered for dedup
 
 
 @dataclass
@@ -42,10 +105,14 @@ class ClientConfig:
     
     # Optional with defaults
     base_url: str = "http://localhost:8090"
-    timeout: float = 0.8  # 800ms
+    timeout: float = 0.8  # 800ms, total per request
+    connect_timeout: Optional[float] = None  # overrides timeout for connecting
+    read_timeout: Optional[float] = None  # overrides timeout for reading the response
     retries: int = 2
+    deadline: Optional[float] = None  # total seconds per call across retries and backoff
     backoff: BackoffConfig = field(default_factory=BackoffConfig)
     cache: CacheConfig = field(default_factory=CacheConfig)
+    events: EventsConfig = field(default_factory=EventsConfig)
     max_connections: int = 100
     insecure: bool = False
     
@@ -76,14 +143,157 @@ class ClientConfig:
         self.timeout = timeout
         return self
     
+    def with_connect_timeout(self, connect_timeout: float, read_timeout: Optional[float] = None) -> "ClientConfig":
+        """Set separate connect and read timeouts in seconds, each defaulting to timeout."""
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        return self
+    
+    def with_max_connections(self, max_connections: int) -> "ClientConfig":
+        """Set the size of the HTTP connection pool."""
+        self.max_connections = max_connections
+        return self
+    
     def with_retries(self, retries: int) -> "ClientConfig":
         """Set the number of retries."""
         self.retries = retries
         return self
     
-    def with_cache(self, enabled: bool = True, max_size: int = 100, ttl_seconds: float = 5.0) -> "ClientConfig":
+    def with_deadline(self, deadline: float) -> "ClientConfig":
+        """Set the default total time budget per call in seconds, including retries."""
+        self.deadline = deadline
+        return self
+    
+    def with_cache(
+        self,
+        enabled: bool = True,
+        max_size: int = 100,
+        ttl_seconds: float = 5.0,
+        shards: int = 1,
+        policy: str = "lru",
+    ) -> "ClientConfig":
         """Configure caching."""
-        self.cache = CacheConfig(enabled=enabled, max_size=max_size, ttl_seconds=ttl_seconds)
+        self.cache = CacheConfig(
+            enabled=enabled,
+            max_size=max_size,
+            ttl_seconds=ttl_seconds,
+            shards=shards,
+            policy=policy,
+        )
+        return self
+    
+    def with_cache_max_bytes(self, max_bytes: int) -> "ClientConfig":
+        """Bound the cache by the estimated memory of its entries instead of their number."""
+        self.cache.max_bytes = max_bytes
+        return self
+    
+    def with_stale_while_revalidate(self, stale_seconds: float, refresh_workers: int = 2) -> "ClientConfig":
+        """Serve expired cache entries for up to stale_seconds while refreshing them in the background."""
+        self.cache.stale_seconds = stale_seconds
+        self.cache.refresh_workers = refresh_workers
+        return self
+    
+    def with_shared_memory_cache(self, path: Optional[str] = None, slot_size: int = 256) -> "ClientConfig":
+        """Store cached evaluations in a memory-mapped region shared by all processes on the host."""
+        self.cache.backend = "shared_memory"
+        self.cache.shared_memory_path = path
+        self.cache.shared_memory_slot_size = slot_size
+        return self
+    
+    def with_redis_cache(self, url: str = "redis://localhost:6379/0", l1_max_size: int = 0) -> "ClientConfig":
+        """Store cached evaluations in a Redis-compatible server, optionally behind an in-process L1."""
+        self.cache.backend = "redis"
+        self.cache.redis_url = url
+        self.cache.l1_max_size = l1_max_size
+        return self
+    
+    def with_cache_backend(self, backend: Any, l1_max_size: int = 0) -> "ClientConfig":
+        """Store cached evaluations in a custom CacheBackend, optionally behind an in-process L1."""
+        self.cache.backend = backend
+        self.cache.l1_max_size = l1_max_size
+        return self
+    
+    def with_cache_snapshot(self, path: str, interval_seconds: float = 0.0) -> "ClientConfig":
+        """Persist the cache to path on close (and every interval_seconds) and load it on start."""
+        self.cache.snapshot_path = path
+        self.cache.snapshot_interval_seconds = interval_seconds
+        return self
+    
+    def with_ttl_override(self, feature_key: str, ttl_seconds: float) -> "ClientConfig":
+        """Cache a feature (or every feature matching a "prefix*" pattern) for ttl_seconds."""
+        self.cache.ttl_overrides[feature_key] = ttl_seconds
+        return self
+    
+    def with_ttl_jitter(self, fraction: float) -> "ClientConfig":
+        """Shorten each cache entry's TTL by a random fraction of up to fraction, e.g. 0.1."""
+        self.cache.ttl_jitter = fraction
+        return self
+    
+    def with_early_refresh(self, beta: float = 1.0) -> "ClientConfig":
+        """Refresh cache entries in the background before they expire (XFetch), earlier for higher beta."""
+        self.cache.early_refresh_beta = beta
+        return self
+    
+    def with_event_queue(
+        self,
+        max_queue_size: int = 10000,
+        batch_size: int = 100,
+        flush_interval_seconds: float = 1.0,
+        workers: int = 4,
+    ) -> "ClientConfig":
+        """Send track events from a bounded background queue instead of the caller's thread."""
+        self.events.enabled = True
+        self.events.max_queue_size = max_queue_size
+        self.events.batch_size = batch_size
+        self.events.flush_interval_seconds = flush_interval_seconds
+        self.events.workers = workers
+        return self
+    
+    def with_event_spool(
+        self,
+        path: str,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_age_seconds: float = 24 * 3600.0,
+        replay_rate: float = 50.0,
+    ) -> "ClientConfig":
+        """Keep track events that fail during an outage in a directory on disk and replay them later."""
+        self.events.spool_path = path
+        self.events.spool_max_bytes = max_bytes
+        self.events.spool_max_age_seconds = max_age_seconds
+        self.events.spool_replay_rate = replay_rate
+        return self
+    
+    def with_event_aggregation(
+        self,
+        sink: Callable[[Any], None],
+        window_seconds: float = 1.0,
+        context_keys: Optional[List[str]] = None,
+        max_groups: int = 10000,
+    ) -> "ClientConfig":
+        """Sum track events per feature, variant, event type and context_keys values, passing one EventSummary per window to sink."""
+        self.events.aggregate_sink = sink
+        self.events.aggregate_window_seconds = window_seconds
+        self.events.aggregate_context_keys = list(context_keys or [])
+        self.events.aggregate_max_groups = max_groups
+        return self
+    
+    def with_impressions(
+        self,
+        sample_rate: float = 1.0,
+        dedup_window_seconds: float = 60.0,
+        dedup_max_size: int = 100000,
+    ) -> "ClientConfig":
+        """Record an impression for each evaluation, sent in the background with sampling and dedup."""
+        self.events.impressions = True
+        self.events.impression_sample_rate = sample_rate
+        self.events.impression_dedup_seconds = dedup_window_seconds
+        self.events.impression_dedup_max_size = dedup_max_size
+        return self
+    
+    def with_negative_cache(self, ttl_seconds: float, max_size: int = 100) -> "ClientConfig":
+        """Cache feature-not-found results per feature key with their own TTL and size limit."""
+        self.cache.negative_ttl_seconds = ttl_seconds
+        self.cache.negative_max_size = max_size
         return self
     
     def with_backoff(self, base_delay: float = 0.1, max_delay: float = 2.0, factor: float = 2.0) -> "ClientConfig":
@@ -1,5 +1,7 @@
 """Request context for feature evaluation."""
 
+import hashlib
+import json
 from typing import Any, Dict, Optional
 
 
@@ -30,6 +32,7 @@ class RequestContext:
     def __init__(self, data: Optional[Dict[str, Any]] = None):
         """Initialize request context with optional data."""
         self._data = data or {}
+        self._fingerprint: Optional[str] = None
     
     @classmethod
     def new(cls) -> "RequestContext":
@@ -38,108 +41,106 @@ class RequestContext:
     
     def with_user_id(self, user_id: str) -> "RequestContext":
         """Set the user ID."""
-        self._data[self.ATTR_USER_ID] = user_id
-        return self
+        return self.set(self.ATTR_USER_ID, user_id)
     
     def with_user_email(self, email: str) -> "RequestContext":
         """Set the user email."""
-        self._data[self.ATTR_USER_EMAIL] = email
-        return self
+        return self.set(self.ATTR_USER_EMAIL, email)
     
     def with_anonymous(self, anonymous: bool) -> "RequestContext":
         """Set whether the user is anonymous."""
-        self._data[self.ATTR_USER_ANONYMOUS] = anonymous
-        return self
+        return self.set(self.ATTR_USER_ANONYMOUS, anonymous)
     
     def with_country(self, country: str) -> "RequestContext":
         """Set the country code."""
-        self._data[self.ATTR_COUNTRY_CODE] = country
-        return self
+        return self.set(self.ATTR_COUNTRY_CODE, country)
     
     def with_region(self, region: str) -> "RequestContext":
         """Set the region."""
-        self._data[self.ATTR_REGION] = region
-        return self
+        return self.set(self.ATTR_REGION, region)
     
     def with_city(self, city: str) -> "RequestContext":
         """Set the city."""
-        self._data[self.ATTR_CITY] = city
-        return self
+        return self.set(self.ATTR_CITY, city)
     
     def with_manufacturer(self, manufacturer: str) -> "RequestContext":
         """Set the device manufacturer."""
-        self._data[self.ATTR_MANUFACTURER] = manufacturer
-        return self
+        return self.set(self.ATTR_MANUFACTURER, manufacturer)
     
     def with_device_type(self, device_type: str) -> "RequestContext":
         """Set the device type."""
-        self._data[self.ATTR_DEVICE_TYPE] = device_type
-        return self
+        return self.set(self.ATTR_DEVICE_TYPE, device_type)
     
     def with_os(self, os: str) -> "RequestContext":
         """Set the operating system."""
-        self._data[self.ATTR_OS] = os
-        return self
+        return self.set(self.ATTR_OS, os)
     
     def with_os_version(self, version: str) -> "RequestContext":
         """Set the operating system version."""
-        self._data[self.ATTR_OS_VERSION] = version
-        return self
+        return self.set(self.ATTR_OS_VERSION, version)
     
     def with_browser(self, browser: str) -> "RequestContext":
         """Set the browser."""
-        self._data[self.ATTR_BROWSER] = browser
-        return self
+        return self.set(self.ATTR_BROWSER, browser)
     
     def with_browser_version(self, version: str) -> "RequestContext":
         """Set the browser version."""
-        self._data[self.ATTR_BROWSER_VERSION] = version
-        return self
+        return self.set(self.ATTR_BROWSER_VERSION, version)
     
     def with_language(self, language: str) -> "RequestContext":
         """Set the language."""
-        self._data[self.ATTR_LANGUAGE] = language
-        return self
+        return self.set(self.ATTR_LANGUAGE, language)
     
     def with_connection_type(self, connection_type: str) -> "RequestContext":
         """Set the connection type."""
-        self._data[self.ATTR_CONNECTION_TYPE] = connection_type
-        return self
+        return self.set(self.ATTR_CONNECTION_TYPE, connection_type)
     
     def with_age(self, age: int) -> "RequestContext":
         """Set the user age."""
-        self._data[self.ATTR_AGE] = age
-        return self
+        return self.set(self.ATTR_AGE, age)
     
     def with_gender(self, gender: str) -> "RequestContext":
         """Set the user gender."""
-        self._data[self.ATTR_GENDER] = gender
-        return self
+        return self.set(self.ATTR_GENDER, gender)
     
     def with_ip(self, ip: str) -> "RequestContext":
         """Set the IP address."""
-        self._data[self.ATTR_IP] = ip
-        return self
+        return self.set(self.ATTR_IP, ip)
     
     def with_app_version(self, version: str) -> "RequestContext":
         """Set the application version."""
-        self._data[self.ATTR_APP_VERSION] = version
-        return self
+        return self.set(self.ATTR_APP_VERSION, version)
     
     def with_platform(self, platform: str) -> "RequestContext":
         """Set the platform."""
-        self._data[self.ATTR_PLATFORM] = platform
-        return self
+        return self.set(self.ATTR_PLATFORM, platform)
     
     def set(self, key: str, value: Any) -> "RequestContext":
         """Set an arbitrary key-value pair."""
         self._data[key] = value
+        self._fingerprint = None
         return self
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get a value by key."""
         return self._data.get(key, default)
     
+    def fingerprint(self) -> str:
+        """Get a stable hash of the context contents.
+        
+        The fingerprint does not depend on insertion order and is computed
+        once, then reused until the context is modified through ``set`` or
+        one of the ``with_*`` methods. Mutating the dictionary passed to the
+        constructor directly is not tracked.
+        
+        Returns:
+            Hex digest identifying the context data
+        """
+        if self._fingerprint is None:
+            encoded = json.dumps(self._data, sort_keys=True, default=str)
+            self._fingerprint = hashlib.md5(encoded.encode()).hexdigest()
+        return self._fingerprint
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert context to dictionary."""
         return self._data.copy()
@@ -0,0 +1,214 @@
+"""Background delivery of track events."""
+
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+from .context import RequestContext
+from .track_event import TrackEvent
+
+QueuedEvent = Tuple[str, TrackEvent]
+
+# Outcomes of sending one event
+SENT = "sent"
+SPOOLED = "spooled"
+FAILED = "failed"
+
+
+@dataclass
+class EventQueueStats:
+    """Counters of the track event queue."""
+    
+    queued: int = 0  # events waiting to be sent
+    sent: int = 0
+    failed: int = 0  # events that could not be delivered after retries
+    dropped: int = 0  # events rejected because the queue was full or closed
+    spooled: int = 0  # failed events kept for later delivery
+    aggregated: int = 0  # events folded into summaries before queueing
+
+
+def snapshot_event(event: TrackEvent) -> TrackEvent:
+    """Copy an event for later delivery, stamping the time it happened.
+    
+    The caller may keep modifying the event and its context after queueing
+    it, and without created_at the server would record the send time. A
+    missing dedup_key is generated, so a copy that is sent again after a
+    timeout, a retry or a spool replay is not counted twice.
+    """
+    return TrackEvent(
+        variant_key=event.variant_key,
+        event_type=event.event_type,
+        reward=event.reward,
+        context=RequestContext(event.context.to_dict()),
+        created_at=event.created_at or datetime.now(timezone.utc),
+        dedup_key=event.dedup_key or uuid.uuid4().hex,
+    )
+
+
+class EventQueue:
+    """Bounded in-memory buffer of track events sent by a background thread.
+    
+    Events are sent once batch_size of them are queued, or every
+    flush_interval_seconds, with up to workers requests in flight. When
+    the buffer is full new events are dropped and counted rather than
+    blocking the caller.
+    """
+    
+    def __init__(
+        self,
+        send: Callable[[str, TrackEvent], None],
+        max_size: int = 10000,
+        batch_size: int = 100,
+        flush_interval_seconds: float = 1.0,
+        workers: int = 4,
+        logger: Optional[Callable[[str, Any], None]] = None,
+        undeliverable: Optional[Callable[[str, TrackEvent, Exception], bool]] = None,
+    ):
+        """Initialize the queue and start its thread.
+        
+        Args:
+            send: Callable delivering one event, raising on failure
+            max_size: Maximum number of events waiting to be sent
+            batch_size: Number of queued events that triggers a flush
+            flush_interval_seconds: Maximum time an event waits before a flush
+            workers: Number of events sent concurrently
+            logger: Optional logger for delivery failures
+            undeliverable: Optional callable given each event that failed,
+                returning True if it kept the event for later delivery
+        """
+        self._send = send
+        self._undeliverable = undeliverable
+        self._max_size = max_size
+        self._batch_size = max(1, batch_size)
+        self._interval = flush_interval_seconds
+        self._logger = logger
+        self._buffer: Deque[QueuedEvent] = deque()
+        self._cond = threading.Condition()
+        self._stats = EventQueueStats()
+        self._accepted = 0  # events accepted so far
+        self._done = 0  # accepted events sent or given up on
+        self._flush_requested = False
+        self._closed = False
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="togglr-events")
+        self._thread = threading.Thread(target=self._run, name="togglr-event-queue", daemon=True)
+        self._thread.start()
+    
+    def put(self, feature_key: str, event: TrackEvent) -> bool:
+        """Queue an event for delivery.
+        
+        Args:
+            feature_key: The feature key the event is for
+            event: The track event, which is copied
+        
+        Returns:
+            True if the event was queued, False if it was dropped
+        """
+        queued = (feature_key, snapshot_event(event))
+        with self._cond:
+            if self._closed or len(self._buffer) >= self._max_size:
+                self._stats.dropped += 1
+                return False
+            self._buffer.append(queued)
+            self._accepted += 1
+            if len(self._buffer) >= self._batch_size:
+                self._cond.notify_all()
+        return True
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Send the queued events now and wait for them.
+        
+        Args:
+            timeout: Maximum seconds to wait, None to wait until done
+        
+        Returns:
+            True if every event queued before the call was sent or given up on
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            target = self._accepted
+            self._flush_requested = True
+            self._cond.notify_all()
+            while self._done < target:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+    
+    def stats(self) -> EventQueueStats:
+        """Get a snapshot of the counters."""
+        with self._cond:
+            return EventQueueStats(
+                queued=len(self._buffer),
+                sent=self._stats.sent,
+                failed=self._stats.failed,
+                dropped=self._stats.dropped,
+                spooled=self._stats.spooled,
+            )
+    
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Stop accepting events and deliver the queued ones.
+        
+        Args:
+            timeout: Maximum seconds to spend draining, None to wait until done
+        
+        Returns:
+            True if the queue was drained, False if events were left behind
+        """
+        drained = self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            if not drained:
+                self._stats.dropped += len(self._buffer)
+                self._buffer.clear()
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        self._executor.shutdown(wait=drained)
+        return drained
+    
+    def _run(self) -> None:
+        """Send batches until closed."""
+        while True:
+            with self._cond:
+                next_flush = time.monotonic() + self._interval
+                while not self._closed and not self._flush_requested and len(self._buffer) < self._batch_size:
+                    remaining = next_flush - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                if self._closed and not self._buffer:
+                    return
+                batch = [self._buffer.popleft() for _ in range(min(len(self._buffer), self._batch_size))]
+                if not self._buffer:
+                    self._flush_requested = False
+            
+            if batch:
+                self._deliver(batch)
+    
+    def _deliver(self, batch: List[QueuedEvent]) -> None:
+        """Send a batch of events concurrently and record the outcome."""
+        outcomes = list(self._executor.map(self._send_one, batch))
+        with self._cond:
+            self._stats.sent += outcomes.count(SENT)
+            self._stats.spooled += outcomes.count(SPOOLED)
+            self._stats.failed += outcomes.count(FAILED)
+            self._done += len(outcomes)
+            self._cond.notify_all()
+    
+    def _send_one(self, item: QueuedEvent) -> str:
+        """Send one event, returning the outcome."""
+        feature_key, event = item
+        try:
+            self._send(feature_key, event)
+            return SENT
+        except Exception as e:
+            if self._undeliverable and self._undeliverable(feature_key, event, e):
+                return SPOOLED
+            if self._logger:
+                self._logger(f"Failed to send track event for {feature_key}: {e}")
+            return FAILED
@@ -0,0 +1,107 @@
+"""Impression events recorded from evaluations."""
+
+import random
+import threading
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from cachetools import TTLCache
+
+from .context import RequestContext
+from .track_event import EventType, TrackEvent
+
+# Context key of a sampled impression holding the sampling rate
+SAMPLE_RATE_CONTEXT_KEY = "togglr.sample_rate"
+
+
+@dataclass
+class ImpressionStats:
+    """Counters of impressions recorded from evaluations."""
+    
+    recorded: int = 0  # impressions handed to the event queue
+    deduplicated: int = 0  # repeats within the dedup window
+    sampled_out: int = 0  # impressions skipped by sampling
+
+
+class ImpressionRecorder:
+    """Turns evaluations into impression events without doing any I/O.
+    
+    An impression is a success event with reward 0 whose variant key is the
+    evaluated value. Repeats for the same user, feature and value within
+    dedup_window_seconds are skipped, and the rest are kept with probability
+    sample_rate; sampled impressions carry SAMPLE_RATE_CONTEXT_KEY so they
+    can be weighted by its inverse. Impressions are passed to sink, which
+    must not block.
+    """
+    
+    def __init__(
+        self,
+        sink: Callable[[str, TrackEvent], None],
+        sample_rate: float = 1.0,
+        dedup_window_seconds: float = 60.0,
+        dedup_max_size: int = 100000,
+        rand: Callable[[], float] = random.random,
+    ):
+        """Initialize the recorder.
+        
+        Args:
+            sink: Callable queueing one impression event
+            sample_rate: Fraction of deduplicated impressions to keep
+            dedup_window_seconds: Window in which repeats are skipped, 0 to keep all
+            dedup_max_size: Maximum number of (user, feature, value) keys remembered
+            rand: Source of uniform random numbers in [0, 1), for tests
+        """
+        self._sink = sink
+        self._sample_rate = sample_rate
+        self._rand = rand
+        self._seen: Optional[TTLCache] = None
+        if dedup_window_seconds > 0:
+            self._seen = TTLCache(maxsize=dedup_max_size, ttl=dedup_window_seconds)
+        self._lock = threading.Lock()
+        self._stats = ImpressionStats()
+    
+    def record(self, feature_key: str, context: RequestContext, value: str, found: bool) -> bool:
+        """Record an impression for an evaluation.
+        
+        Args:
+            feature_key: The evaluated feature key
+            context: The evaluation context
+            value: The evaluated value, used as the variant key
+            found: Whether the feature was found
+        
+        Returns:
+            True if an impression was queued
+        """
+        if not found or not value:
+            return False
+        
+        if self._seen is not None:
+            user = context.get(RequestContext.ATTR_USER_ID)
+            key = (user if user is not None else context.fingerprint(), feature_key, value)
+            with self._lock:
+                if key in self._seen:
+                    self._stats.deduplicated += 1
+                    return False
+                self._seen[key] = True
+        
+        if self._sample_rate < 1.0 and self._rand() >= self._sample_rate:
+            with self._lock:
+                self._stats.sampled_out += 1
+            return False
+        
+        data = context.to_dict()
+        if self._sample_rate < 1.0:
+            data[SAMPLE_RATE_CONTEXT_KEY] = self._sample_rate
+        self._sink(feature_key, TrackEvent(value, EventType.SUCCESS, reward=0.0, context=RequestContext(data)))
+        with self._lock:
+            self._stats.recorded += 1
+        return True
+    
+    def stats(self) -> ImpressionStats:
+        """Get a snapshot of the counters."""
+        with self._lock:
+            return ImpressionStats(
+                recorded=self._stats.recorded,
+                deduplicated=self._stats.deduplicated,
+                sampled_out=self._stats.sampled_out,
+            )
@@ -0,0 +1,61 @@
+"""Publishing of client statistics to a metrics backend."""
+
+import threading
+from typing import Any, Callable, Optional
+
+from .cache import CacheStats
+
+
+class CacheStatsReporter:
+    """Periodically pushes cache statistics to the configured metrics object.
+    
+    The metrics object receives a CacheStats snapshot through its
+    ``record_cache_stats(stats)`` method; objects without that method are
+    ignored.
+    """
+    
+    def __init__(
+        self,
+        collect: Callable[[], CacheStats],
+        metrics: Any,
+        interval_seconds: float,
+        logger: Optional[Callable[[str, Any], None]] = None,
+    ):
+        """Initialize the reporter.
+        
+        Args:
+            collect: Callable returning the current stats
+            metrics: Metrics object to push to
+            interval_seconds: Time between pushes
+            logger: Optional logger for failures
+        """
+        self._collect = collect
+        self._metrics = metrics
+        self._interval = interval_seconds
+        self._logger = logger
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="togglr-cache-stats", daemon=True)
+    
+    def start(self) -> None:
+        """Start pushing stats."""
+        if hasattr(self._metrics, "record_cache_stats"):
+            self._thread.start()
+    
+    def stop(self) -> None:
+        """Stop pushing stats."""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+    
+    def report(self) -> None:
+        """Push the current stats once."""
+        try:
+            self._metrics.record_cache_stats(self._collect())
+        except Exception as e:
+            if self._logger:
+                self._logger(f"Failed to report cache stats: {e}")
+    
+    def _run(self) -> None:
+        """Push stats every interval until stopped."""
+        while not self._stop.wait(self._interval):
+            self.report()
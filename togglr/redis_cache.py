@@ -0,0 +1,478 @@
+"""Evaluation cache in a Redis-compatible server, shared by services on a host."""
+
+import hashlib
+import socket
+import struct
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import unquote, urlparse
+
+from .cache import CacheEntry, CacheItem, CacheStats, wall_clock_offset
+
+# flags, stored_at, expires_at (wall clock), followed by the UTF-8 value
+_VALUE_HEADER = struct.Struct("<Bdd")
+_FLAG_ENABLED = 1
+_FLAG_FOUND = 2
+
+_SCAN_COUNT = 1000
+
+
+class RedisError(Exception):
+    """Error reply from the server."""
+
+
+class RedisProtocolError(RedisError):
+    """Reply or stored value the cache could not parse."""
+
+
+def default_key_prefix(namespace: str) -> str:
+    """Get the default key prefix for a client's entries.
+    
+    Args:
+        namespace: String identifying the cache contents (e.g. API key and
+            base URL), so unrelated clients sharing a server do not share entries
+    
+    Returns:
+        Prefix of the form "togglr:<digest>:"
+    """
+    digest = hashlib.blake2b(namespace.encode(), digest_size=8).hexdigest()
+    return f"togglr:{digest}:"
+
+
+class _Connection:
+    """A single RESP connection speaking just enough of the protocol for the cache."""
+    
+    def __init__(self, url: str, timeout: float):
+        parsed = urlparse(url)
+        if parsed.scheme == "unix":
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._sock.settimeout(timeout)
+            try:
+                self._sock.connect(parsed.path)
+            except OSError:
+                self._sock.close()
+                raise
+        else:
+            self._sock = socket.create_connection(
+                (parsed.hostname or "localhost", parsed.port or 6379),
+                timeout=timeout,
+            )
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reader = self._sock.makefile("rb")
+        
+        try:
+            if parsed.password:
+                args = [unquote(parsed.password)]
+                if parsed.username:
+                    args.insert(0, unquote(parsed.username))
+                self.execute("AUTH", *args)
+            db = parsed.path.lstrip("/") if parsed.scheme != "unix" else ""
+            if db and db != "0":
+                self.execute("SELECT", db)
+        except BaseException:
+            self.close()
+            raise
+    
+    def execute(self, *args: Any) -> Any:
+        """Send one command and read its reply."""
+        return self.pipeline([args])[0]
+    
+    def pipeline(self, commands: Sequence[Sequence[Any]]) -> List[Any]:
+        """Send several commands in one write and read all replies.
+        
+        Raises:
+            RedisError: If any command got an error reply
+        """
+        self._sock.sendall(b"".join(_encode(command) for command in commands))
+        replies = [self._read_reply() for _ in commands]
+        for reply in replies:
+            if isinstance(reply, RedisError):
+                raise reply
+        return replies
+    
+    def _read_reply(self) -> Any:
+        line = self._reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("Connection closed by the cache server")
+        try:
+            return self._parse_reply(line)
+        except ValueError:
+            raise RedisProtocolError(f"Malformed reply from the cache server: {line!r}")
+    
+    def _parse_reply(self, line: bytes) -> Any:
+        kind, payload = line[:1], line[1:-2]
+        if kind == b"+":
+            return payload
+        if kind == b"-":
+            return RedisError(payload.decode(errors="replace"))
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            data = self._reader.read(length + 2)
+            if len(data) != length + 2:
+                raise ConnectionError("Connection closed by the cache server")
+            return data[:-2]
+        if kind == b"*":
+            length = int(payload)
+            if length < 0:
+                return None
+            return [self._read_reply() for _ in range(length)]
+        raise ConnectionError(f"Unexpected reply from the cache server: {line!r}")
+    
+    def close(self) -> None:
+        try:
+            self._reader.close()
+        finally:
+            self._sock.close()
+
+
+def _encode(command: Sequence[Any]) -> bytes:
+    """Encode a command as a RESP array of bulk strings."""
+    parts = [b"*%d\r\n" % len(command)]
+    for arg in command:
+        if isinstance(arg, str):
+            arg = arg.encode()
+        elif isinstance(arg, int):
+            arg = b"%d" % arg
+        parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+    return b"".join(parts)
+
+
+def _check_scan_reply(replies: List[Any]) -> None:
+    """Check that a SCAN reply is a cursor and a list of keys.
+    
+    Raises:
+        RedisProtocolError: If the reply has another shape
+    """
+    reply = replies[0]
+    if (
+        not isinstance(reply, list)
+        or len(reply) != 2
+        or not isinstance(reply[0], bytes)
+        or not isinstance(reply[1], list)
+        or not all(isinstance(key, bytes) for key in reply[1])
+    ):
+        raise RedisProtocolError(f"Unexpected SCAN reply: {reply!r}")
+
+
+class RedisCache:
+    """Evaluation cache stored in a Redis-compatible server.
+    
+    Entries are plain string keys under a per-client prefix that the server
+    expires on its own once they leave the stale window. Connections are
+    pooled and commands for several keys are batched (MGET, pipelined SET).
+    The cache never raises: when the server is unreachable, lookups are
+    misses and writes are dropped, and both are counted in stats().errors.
+    """
+    
+    def __init__(
+        self,
+        url: str,
+        ttl_seconds: float,
+        stale_seconds: float = 0.0,
+        key_prefix: str = "togglr:",
+        timeout: float = 0.1,
+        max_connections: int = 8,
+        logger: Optional[Callable[[str, Any], None]] = None,
+    ):
+        """Initialize the cache. Connections are opened on first use.
+        
+        Args:
+            url: Server URL, redis://[[user]:password@]host[:port][/db] or unix:///path
+            ttl_seconds: Default time to live in seconds
+            stale_seconds: How long expired entries are kept for get_stale()
+            key_prefix: Prefix of every key written by this cache
+            timeout: Socket timeout in seconds
+            max_connections: Maximum number of idle connections kept open
+            logger: Optional logger for server errors
+        
+        Raises:
+            ValueError: If the URL scheme is not redis or unix
+        """
+        scheme = urlparse(url).scheme
+        if scheme not in ("redis", "unix"):
+            raise ValueError(f"Unsupported cache URL scheme: {scheme}")
+        self._url = url
+        self._ttl = ttl_seconds
+        self._stale = stale_seconds
+        self._prefix = key_prefix
+        self._timeout = timeout
+        self._max_connections = max_connections
+        self._logger = logger
+        self._pool: List[_Connection] = []
+        self._pool_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = CacheStats()
+        self._age_total = 0.0
+    
+    def _run(
+        self, 
+        commands: Sequence[Sequence[Any]], 
+        check: Optional[Callable[[List[Any]], None]] = None
+    ) -> Optional[List[Any]]:
+        """Run commands on a pooled connection, returning None if the server failed.
+        
+        check may raise RedisProtocolError for replies of the wrong shape,
+        which drops the connection like an unparsable reply.
+        """
+        with self._pool_lock:
+            conn = self._pool.pop() if self._pool else None
+        try:
+            if conn is None:
+                conn = _Connection(self._url, self._timeout)
+            replies = conn.pipeline(commands)
+            if check is not None:
+                check(replies)
+        except (OSError, RedisError) as e:
+            # After an unparsable reply the connection is out of step with the server
+            if conn is not None and (not isinstance(e, RedisError) or isinstance(e, RedisProtocolError)):
+                conn.close()
+                conn = None
+            self._record_error(e)
+            return None
+        finally:
+            if conn is not None:
+                with self._pool_lock:
+                    if len(self._pool) < self._max_connections:
+                        self._pool.append(conn)
+                        conn = None
+                if conn is not None:
+                    conn.close()
+        return replies
+    
+    def _decode(self, data: bytes) -> Tuple[CacheEntry, float]:
+        """Decode a stored value into an entry and its wall-clock expiry.
+        
+        Raises:
+            RedisProtocolError: If the value is truncated or not written by this cache
+        """
+        try:
+            flags, stored_at, expires_at = _VALUE_HEADER.unpack_from(data)
+            value = data[_VALUE_HEADER.size:].decode()
+        except (struct.error, TypeError, ValueError) as e:
+            raise RedisProtocolError(f"Unreadable cache value: {e}")
+        offset = wall_clock_offset()
+        entry = CacheEntry(
+            value,
+            bool(flags & _FLAG_ENABLED),
+            bool(flags & _FLAG_FOUND),
+            stored_at - offset,
+            expires_at - offset,
+        )
+        return entry, expires_at
+    
+    def _record_error(self, error: Exception) -> None:
+        """Count and log a failure that is treated as a miss."""
+        with self._stats_lock:
+            self._stats.errors += 1
+        if self._logger:
+            self._logger(f"Cache server error: {error}")
+    
+    def _fetch(self, keys: Sequence[str]) -> List[Optional[Tuple[CacheEntry, float]]]:
+        """Read entries, None for keys that are missing or past the stale window."""
+        if not keys:
+            return []
+        replies = self._run([("MGET", *(self._prefix + key for key in keys))])
+        if replies is None:
+            return [None] * len(keys)
+        if not isinstance(replies[0], list) or len(replies[0]) != len(keys):
+            self._record_error(RedisProtocolError(f"Unexpected MGET reply: {replies[0]!r}"))
+            return [None] * len(keys)
+        now = time.time()
+        result: List[Optional[Tuple[CacheEntry, float]]] = []
+        for data in replies[0]:
+            decoded = None
+            if data is not None:
+                try:
+                    decoded = self._decode(data)
+                except RedisProtocolError as e:
+                    self._record_error(e)
+            if decoded is not None and now > decoded[1] + self._stale:
+                decoded = None
+            result.append(decoded)
+        return result
+    
+    def _record_lookup(self, entry: Optional[CacheEntry], stale: bool) -> None:
+        """Update the hit and miss counters."""
+        with self._stats_lock:
+            if entry is None:
+                self._stats.misses += 1
+                return
+            self._stats.hits += 1
+            if stale:
+                self._stats.stale_hits += 1
+            self._age_total += time.monotonic() - entry.stored_at
+    
+    def get(self, key: str) -> Tuple[Optional[CacheEntry], bool]:
+        """Get an entry from the cache.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Tuple of (entry, hit) where hit indicates if the key was found
+        """
+        entry, stale = self.get_stale(key)
+        if entry is None or stale:
+            return None, False
+        return entry, True
+    
+    def get_stale(self, key: str) -> Tuple[Optional[CacheEntry], bool]:
+        """Get an entry from the cache, including expired ones in the stale window.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Tuple of (entry, stale) where entry is None on a miss and stale
+            indicates the entry is past its TTL and should be refreshed
+        """
+        found = self.get_many([key])
+        if key not in found:
+            return None, False
+        return found[key]
+    
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Tuple[CacheEntry, bool]]:
+        """Get several entries with a single MGET.
+        
+        Args:
+            keys: Cache keys
+        
+        Returns:
+            Mapping of each key found to (entry, stale)
+        """
+        now = time.time()
+        found = {}
+        for key, decoded in zip(keys, self._fetch(keys)):
+            if decoded is None:
+                self._record_lookup(None, False)
+                continue
+            entry, expires_at = decoded
+            stale = now > expires_at
+            self._record_lookup(entry, stale)
+            found[key] = (entry, stale)
+        return found
+    
+    def set(
+        self,
+        key: str,
+        value: str,
+        enabled: bool,
+        found: bool,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Set an entry in the cache.
+        
+        Args:
+            key: Cache key
+            value: Feature value
+            enabled: Whether feature is enabled
+            found: Whether feature was found
+            ttl: Time to live for this entry, defaults to the cache TTL
+        """
+        self.set_many([(key, value, enabled, found, ttl)])
+    
+    def set_many(self, items: Iterable[CacheItem]) -> None:
+        """Set several entries in one pipelined round trip.
+        
+        Args:
+            items: (key, value, enabled, found, ttl) tuples, ttl may be None
+        """
+        now = time.time()
+        self._write([
+            (key, value, enabled, found, now + (self._ttl if ttl is None else ttl))
+            for key, value, enabled, found, ttl in items
+        ], now)
+    
+    def restore(self, key: str, value: str, enabled: bool, found: bool, expires_at: float) -> None:
+        """Insert an entry that expires at a given wall-clock time.
+        
+        Args:
+            key: Cache key
+            value: Feature value
+            enabled: Whether feature is enabled
+            found: Whether feature was found
+            expires_at: Wall-clock time (time.time()) when the entry expires
+        """
+        self._write([(key, value, enabled, found, expires_at)], time.time())
+    
+    def _write(self, entries: Sequence[Tuple[str, str, bool, bool, float]], now: float) -> None:
+        """Store (key, value, enabled, found, expires_at) entries."""
+        commands = []
+        for key, value, enabled, found, expires_at in entries:
+            # The server drops the key once it leaves the stale window
+            expire_ms = int((expires_at + self._stale - now) * 1000)
+            if expire_ms <= 0:
+                continue
+            flags = (_FLAG_ENABLED if enabled else 0) | (_FLAG_FOUND if found else 0)
+            data = _VALUE_HEADER.pack(flags, now, expires_at) + value.encode()
+            commands.append(("SET", self._prefix + key, data, "PX", expire_ms))
+        if commands:
+            self._run(commands)
+    
+    def _scan(self) -> List[bytes]:
+        """List the server keys under this cache's prefix."""
+        keys: List[bytes] = []
+        cursor = b"0"
+        while True:
+            replies = self._run(
+                [("SCAN", cursor, "MATCH", self._prefix + "*", "COUNT", _SCAN_COUNT)], _check_scan_reply
+            )
+            if replies is None:
+                return keys
+            cursor, batch = replies[0]
+            keys.extend(batch)
+            if cursor == b"0":
+                return keys
+    
+    def items(self) -> List[Tuple[str, CacheEntry, float]]:
+        """Get all entries that have not left the stale window.
+        
+        Returns:
+            List of (key, entry, expires_at) with wall-clock expiry times
+        """
+        prefix_len = len(self._prefix)
+        keys = [key[prefix_len:].decode(errors="replace") for key in self._scan()]
+        result = []
+        for start in range(0, len(keys), _SCAN_COUNT):
+            batch = keys[start: start + _SCAN_COUNT]
+            for key, decoded in zip(batch, self._fetch(batch)):
+                if decoded is not None:
+                    result.append((key, decoded[0], decoded[1]))
+        return result
+    
+    def clear(self) -> None:
+        """Delete all entries under this cache's prefix."""
+        keys = self._scan()
+        for start in range(0, len(keys), _SCAN_COUNT):
+            self._run([("DEL", *keys[start: start + _SCAN_COUNT])])
+    
+    def close(self) -> None:
+        """Close the pooled connections; entries stay on the server."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, []
+        for conn in pool:
+            conn.close()
+    
+    def size(self) -> int:
+        """Get the number of entries on the server (scans the key space)."""
+        return len(self._scan())
+    
+    def max_size(self) -> int:
+        """Get the maximum cache size, 0 since the server bounds it."""
+        return 0
+    
+    def stats(self) -> CacheStats:
+        """Get this process's counters; size is not included to avoid a key scan."""
+        with self._stats_lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                stale_hits=self._stats.stale_hits,
+                errors=self._stats.errors,
+                average_entry_age=self._age_total / self._stats.hits if self._stats.hits else 0.0,
+            )
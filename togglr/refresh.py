@@ -0,0 +1,83 @@
+"""Background refresh of stale cache entries."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Set
+
+
+class BackgroundRefresher:
+    """Runs cache refreshes on a small worker pool.
+    
+    At most one refresh per key is queued or running at a time, so a hot
+    stale entry served to many callers triggers a single request.
+    """
+    
+    def __init__(
+        self,
+        max_workers: int = 2,
+        logger: Optional[Callable[[str, Any], None]] = None,
+    ):
+        """Initialize the refresher.
+        
+        Args:
+            max_workers: Number of worker threads
+            logger: Optional logger for refresh failures
+        """
+        self._max_workers = max_workers
+        self._logger = logger
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Set[str] = set()
+        self._lock = threading.Lock()
+        self._closed = False
+    
+    def submit(self, key: str, refresh: Callable[[], Any]) -> bool:
+        """Schedule a refresh for a key.
+        
+        Args:
+            key: Cache key being refreshed
+            refresh: Callable performing the refresh
+        
+        Returns:
+            True if a refresh was scheduled, False if one is already pending
+            or the refresher is closed
+        """
+        with self._lock:
+            if self._closed or key in self._pending:
+                return False
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="togglr-refresh",
+                )
+            self._pending.add(key)
+            self._executor.submit(self._run, key, refresh)
+        return True
+    
+    def pending(self) -> int:
+        """Get the number of queued or running refreshes."""
+        with self._lock:
+            return len(self._pending)
+    
+    def close(self, wait: bool = True) -> None:
+        """Stop accepting refreshes and shut the workers down.
+        
+        Args:
+            wait: Whether to wait for running refreshes to finish
+        """
+        with self._lock:
+            self._closed = True
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+    
+    def _run(self, key: str, refresh: Callable[[], Any]) -> None:
+        """Run a refresh and release its key."""
+        try:
+            refresh()
+        except Exception as e:
+            if self._logger:
+                self._logger(f"Background refresh failed for {key}: {e}")
+        finally:
+            with self._lock:
+                self._pending.discard(key)
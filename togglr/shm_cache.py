@@ -0,0 +1,419 @@
+"""Evaluation cache shared between processes through a memory-mapped file."""
+
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+from .cache import CacheEntry, CacheItem, CacheStats, wall_clock_offset
+
+# Region layout: a fixed header followed by `sets * ways` fixed-size slots.
+# A key hashes to one set and may live in any of that set's slots, so a
+# lookup never scans more than `ways` slots and each set can be locked on
+# its own (a threading lock within the process, an fcntl byte-range lock
+# across processes).
+_MAGIC = b"TGLRSHM1"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIIII")  # magic, version, sets, ways, slot_size
+_HEADER_SIZE = 64
+# state, enabled, found, key_len, value_len, key_hash, expires_at, stored_at
+_SLOT = struct.Struct("<BBBxHHQdd")
+
+_EMPTY = 0
+_USED = 1
+
+_LOCK_STRIPES = 64
+# Set locks use byte offsets [0, sets); initialization uses one far past them
+_INIT_LOCK_OFFSET = 1 << 40
+
+
+def default_shared_memory_path(namespace: str) -> str:
+    """Get the default location of a shared cache region.
+    
+    Args:
+        namespace: String identifying the cache contents (e.g. API key and
+            base URL), so unrelated clients on a host do not share entries
+    
+    Returns:
+        Path under /dev/shm when available, otherwise the temp directory
+    """
+    digest = hashlib.blake2b(namespace.encode(), digest_size=8).hexdigest()
+    directory = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(directory, f"togglr-cache-{digest}")
+
+
+class SharedMemoryCache:
+    """Fixed-size evaluation cache in a memory-mapped file shared by processes.
+    
+    All processes opening the same path with the same geometry see the same
+    entries, which suits prefork servers where every worker would otherwise
+    keep its own copy. Entries whose key and value do not fit in a slot are
+    not cached. Requires a POSIX platform for cross-process locking.
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        max_size: int,
+        ttl_seconds: float,
+        stale_seconds: float = 0.0,
+        slot_size: int = 256,
+        ways: int = 8,
+    ):
+        """Initialize the cache, creating the shared region if needed.
+        
+        Args:
+            path: File backing the shared region
+            max_size: Maximum number of entries (rounded up to a multiple of ways)
+            ttl_seconds: Time to live in seconds
+            stale_seconds: How long expired entries are kept for get_stale()
+            slot_size: Bytes per entry, including a 32 byte header
+            ways: Slots per set
+        
+        Raises:
+            RuntimeError: If the platform does not support fcntl locking
+            ValueError: If an existing region has a different geometry
+        """
+        if fcntl is None:
+            raise RuntimeError("SharedMemoryCache requires a POSIX platform")
+        if slot_size <= _SLOT.size:
+            raise ValueError(f"slot_size must be larger than {_SLOT.size} bytes")
+        
+        self._path = path
+        self._ttl = ttl_seconds
+        self._stale = stale_seconds
+        self._ways = max(1, ways)
+        self._sets = max(1, -(-max_size // self._ways))
+        self._slot_size = slot_size
+        self._region_size = _HEADER_SIZE + self._sets * self._ways * slot_size
+        self._locks: List[threading.Lock] = [threading.Lock() for _ in range(_LOCK_STRIPES)]
+        # Counters are per process; the entries themselves are shared
+        self._stats = CacheStats()
+        self._age_total = 0.0
+        self._stats_lock = threading.Lock()
+        
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            self._mm = self._open_region()
+        except Exception:
+            os.close(self._fd)
+            raise
+    
+    def _open_region(self) -> mmap.mmap:
+        """Map the region, initializing the header on first use."""
+        expected = _HEADER.pack(_MAGIC, _VERSION, self._sets, self._ways, self._slot_size)
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, 1, _INIT_LOCK_OFFSET)
+        try:
+            if os.fstat(self._fd).st_size == 0:
+                os.ftruncate(self._fd, self._region_size)
+                mm = mmap.mmap(self._fd, self._region_size)
+                mm[: _HEADER.size] = expected
+                return mm
+            
+            if os.fstat(self._fd).st_size != self._region_size:
+                raise ValueError(f"Shared cache at {self._path} has a different size")
+            mm = mmap.mmap(self._fd, self._region_size)
+            if mm[: _HEADER.size] != expected:
+                mm.close()
+                raise ValueError(f"Shared cache at {self._path} has a different layout")
+            return mm
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, 1, _INIT_LOCK_OFFSET)
+    
+    @staticmethod
+    def _hash(key: bytes) -> int:
+        """Hash a key identically in every process."""
+        return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+    
+    def _lock_set(self, index: int) -> threading.Lock:
+        """Lock a set against other threads and processes."""
+        lock = self._locks[index % _LOCK_STRIPES]
+        lock.acquire()
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, 1, index)
+        return lock
+    
+    def _unlock_set(self, index: int, lock: threading.Lock) -> None:
+        """Release a set locked with _lock_set."""
+        fcntl.lockf(self._fd, fcntl.LOCK_UN, 1, index)
+        lock.release()
+    
+    def _slot_offset(self, index: int, way: int) -> int:
+        """Get the byte offset of a slot."""
+        return _HEADER_SIZE + (index * self._ways + way) * self._slot_size
+    
+    def _find(self, index: int, key_hash: int, key: bytes) -> Optional[int]:
+        """Find the slot holding a key within its set."""
+        mm = self._mm
+        for way in range(self._ways):
+            offset = self._slot_offset(index, way)
+            state, _, _, key_len, _, slot_hash, _, _ = _SLOT.unpack_from(mm, offset)
+            if state != _USED or slot_hash != key_hash or key_len != len(key):
+                continue
+            start = offset + _SLOT.size
+            if mm[start: start + key_len] == key:
+                return offset
+        return None
+    
+    def _read(self, key: str) -> Tuple[Optional[CacheEntry], float]:
+        """Read an entry and its expiry time, dropping it past the stale window."""
+        key_bytes = key.encode()
+        key_hash = self._hash(key_bytes)
+        index = key_hash % self._sets
+        lock = self._lock_set(index)
+        try:
+            offset = self._find(index, key_hash, key_bytes)
+            if offset is None:
+                return None, 0.0
+            
+            _, enabled, found, key_len, value_len, _, expires_at, stored_at = _SLOT.unpack_from(self._mm, offset)
+            if time.time() > expires_at + self._stale:
+                self._mm[offset] = _EMPTY
+                with self._stats_lock:
+                    self._stats.expirations += 1
+                return None, 0.0
+            
+            start = offset + _SLOT.size + key_len
+            value = self._mm[start: start + value_len].decode()
+        finally:
+            self._unlock_set(index, lock)
+        
+        clock_offset = wall_clock_offset()
+        entry = CacheEntry(value, bool(enabled), bool(found), stored_at - clock_offset, expires_at - clock_offset)
+        return entry, expires_at
+    
+    def get(self, key: str) -> Tuple[Optional[CacheEntry], bool]:
+        """Get an entry from the cache.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Tuple of (entry, hit) where hit indicates if the key was found
+        """
+        entry, expires_at = self._read(key)
+        if entry is None or time.time() > expires_at:
+            self._record_lookup(None, False)
+            return None, False
+        self._record_lookup(entry, False)
+        return entry, True
+    
+    def get_stale(self, key: str) -> Tuple[Optional[CacheEntry], bool]:
+        """Get an entry from the cache, including expired ones in the stale window.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Tuple of (entry, stale) where entry is None on a miss and stale
+            indicates the entry is past its TTL and should be refreshed
+        """
+        entry, expires_at = self._read(key)
+        if entry is None:
+            self._record_lookup(None, False)
+            return None, False
+        stale = time.time() > expires_at
+        self._record_lookup(entry, stale)
+        return entry, stale
+    
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Tuple[CacheEntry, bool]]:
+        """Get several entries, including expired ones in the stale window.
+        
+        Args:
+            keys: Cache keys
+        
+        Returns:
+            Mapping of each key found to (entry, stale)
+        """
+        found = {}
+        for key in keys:
+            entry, stale = self.get_stale(key)
+            if entry is not None:
+                found[key] = (entry, stale)
+        return found
+    
+    def _record_lookup(self, entry: Optional[CacheEntry], stale: bool) -> None:
+        """Update the hit and miss counters."""
+        with self._stats_lock:
+            if entry is None:
+                self._stats.misses += 1
+                return
+            self._stats.hits += 1
+            if stale:
+                self._stats.stale_hits += 1
+            self._age_total += time.monotonic() - entry.stored_at
+    
+    def set(
+        self,
+        key: str,
+        value: str,
+        enabled: bool,
+        found: bool,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Set an entry in the cache.
+        
+        Args:
+            key: Cache key
+            value: Feature value
+            enabled: Whether feature is enabled
+            found: Whether feature was found
+            ttl: Time to live for this entry, defaults to the cache TTL
+        """
+        self.restore(key, value, enabled, found, time.time() + (self._ttl if ttl is None else ttl))
+    
+    def set_many(self, items: Iterable[CacheItem]) -> None:
+        """Set several entries.
+        
+        Args:
+            items: (key, value, enabled, found, ttl) tuples, ttl may be None
+        """
+        for key, value, enabled, found, ttl in items:
+            self.set(key, value, enabled, found, ttl)
+    
+    def restore(self, key: str, value: str, enabled: bool, found: bool, expires_at: float) -> None:
+        """Insert an entry that expires at a given wall-clock time.
+        
+        Args:
+            key: Cache key
+            value: Feature value
+            enabled: Whether feature is enabled
+            found: Whether feature was found
+            expires_at: Wall-clock time (time.time()) when the entry expires
+        """
+        key_bytes = key.encode()
+        value_bytes = value.encode()
+        if _SLOT.size + len(key_bytes) + len(value_bytes) > self._slot_size:
+            return
+        
+        key_hash = self._hash(key_bytes)
+        index = key_hash % self._sets
+        now = time.time()
+        lock = self._lock_set(index)
+        try:
+            offset = self._find(index, key_hash, key_bytes)
+            if offset is None:
+                offset = self._choose_victim(index, now)
+            
+            start = offset + _SLOT.size
+            self._mm[start: start + len(key_bytes)] = key_bytes
+            start += len(key_bytes)
+            self._mm[start: start + len(value_bytes)] = value_bytes
+            _SLOT.pack_into(
+                self._mm,
+                offset,
+                _USED,
+                int(enabled),
+                int(found),
+                len(key_bytes),
+                len(value_bytes),
+                key_hash,
+                expires_at,
+                now,
+            )
+        finally:
+            self._unlock_set(index, lock)
+    
+    def _choose_victim(self, index: int, now: float) -> int:
+        """Pick the slot to overwrite: a free or dead slot, else the oldest."""
+        oldest_offset = self._slot_offset(index, 0)
+        oldest_stored = float("inf")
+        for way in range(self._ways):
+            offset = self._slot_offset(index, way)
+            state, _, _, _, _, _, expires_at, stored_at = _SLOT.unpack_from(self._mm, offset)
+            if state != _USED:
+                return offset
+            if now > expires_at + self._stale:
+                with self._stats_lock:
+                    self._stats.expirations += 1
+                return offset
+            if stored_at < oldest_stored:
+                oldest_offset, oldest_stored = offset, stored_at
+        with self._stats_lock:
+            self._stats.evictions += 1
+        return oldest_offset
+    
+    def items(self) -> List[Tuple[str, CacheEntry, float]]:
+        """Get all entries that have not left the stale window.
+        
+        Returns:
+            List of (key, entry, expires_at) with wall-clock expiry times
+        """
+        result = []
+        clock_offset = wall_clock_offset()
+        for index in range(self._sets):
+            lock = self._lock_set(index)
+            try:
+                now = time.time()
+                for way in range(self._ways):
+                    offset = self._slot_offset(index, way)
+                    state, enabled, found, key_len, value_len, _, expires_at, stored_at = _SLOT.unpack_from(
+                        self._mm, offset
+                    )
+                    if state != _USED or now > expires_at + self._stale:
+                        continue
+                    start = offset + _SLOT.size
+                    key = self._mm[start: start + key_len].decode()
+                    value = self._mm[start + key_len: start + key_len + value_len].decode()
+                    entry = CacheEntry(
+                        value, bool(enabled), bool(found), stored_at - clock_offset, expires_at - clock_offset
+                    )
+                    result.append((key, entry, expires_at))
+            finally:
+                self._unlock_set(index, lock)
+        return result
+    
+    def clear(self) -> None:
+        """Clear all entries from the cache, for every process."""
+        for index in range(self._sets):
+            lock = self._lock_set(index)
+            try:
+                for way in range(self._ways):
+                    self._mm[self._slot_offset(index, way)] = _EMPTY
+            finally:
+                self._unlock_set(index, lock)
+    
+    def size(self) -> int:
+        """Get the current number of live entries."""
+        now = time.time()
+        count = 0
+        for index in range(self._sets):
+            for way in range(self._ways):
+                state, _, _, _, _, _, expires_at, _ = _SLOT.unpack_from(self._mm, self._slot_offset(index, way))
+                if state == _USED and now <= expires_at:
+                    count += 1
+        return count
+    
+    def max_size(self) -> int:
+        """Get the maximum cache size."""
+        return self._sets * self._ways
+    
+    def stats(self) -> CacheStats:
+        """Get cumulative counters for lookups made by this process."""
+        with self._stats_lock:
+            stats = CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                stale_hits=self._stats.stale_hits,
+                expirations=self._stats.expirations,
+                evictions=self._stats.evictions,
+                average_entry_age=self._age_total / self._stats.hits if self._stats.hits else 0.0,
+            )
+        stats.size = self.size()
+        stats.max_size = self.max_size()
+        return stats
+    
+    def close(self) -> None:
+        """Unmap the region, leaving its entries for other processes."""
+        if self._mm.closed:
+            return
+        self._mm.close()
+        os.close(self._fd)
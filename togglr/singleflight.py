@@ -0,0 +1,94 @@
+"""Coalescing of concurrent identical calls."""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+@dataclass
+class SingleFlightStats:
+    """Counters for coalesced calls."""
+    
+    calls: int = 0  # calls that actually ran
+    coalesced: int = 0  # callers that waited for another caller's result
+
+
+class _Call:
+    """An in-flight call that other callers can wait on."""
+    
+    __slots__ = ("done", "result", "error")
+    
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls sharing the same key.
+    
+    The first caller for a key runs the function; callers arriving while it
+    is still running block until it finishes and receive the same result,
+    or the same exception.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize the group."""
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self._stats = SingleFlightStats()
+    
+    def do(self, key: str, fn: Callable[[], Any], timeout: Optional[float] = None) -> Tuple[Any, bool]:
+        """Run fn once for all concurrent callers with the same key.
+        
+        Args:
+            key: Deduplication key
+            fn: Function to run
+            timeout: Seconds to wait for another caller's call, None to wait
+                until it finishes
+        
+        Returns:
+            Tuple of (result, shared) where shared indicates the result came
+            from another caller's call
+        
+        Raises:
+            TimeoutError: If another caller's call did not finish within timeout
+            Exception: Whatever fn raised
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self._stats.coalesced += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self._stats.calls += 1
+                leader = True
+        
+        if not leader:
+            if not call.done.wait(timeout):
+                raise TimeoutError(f"call for {key!r} still running after {timeout}s")
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+        
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+    
+    def in_flight(self) -> int:
+        """Get the number of calls currently running."""
+        with self._lock:
+            return len(self._calls)
+    
+    def stats(self) -> SingleFlightStats:
+        """Get a snapshot of the counters."""
+        with self._lock:
+            return SingleFlightStats(calls=self._stats.calls, coalesced=self._stats.coalesced)
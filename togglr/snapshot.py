@@ -0,0 +1,144 @@
+"""On-disk snapshots of the evaluation cache for warm restarts."""
+
+import os
+import struct
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+_MAGIC = b"TGLRSNP1"
+_HEADER = struct.Struct("<8sI")  # magic, entry count
+# expires_at (wall clock), key length, value length, flags
+_RECORD = struct.Struct("<dHIB")
+
+_FLAG_ENABLED = 1
+_FLAG_FOUND = 2
+
+
+def save_snapshot(cache: Any, path: str) -> int:
+    """Write the live entries of a cache to a snapshot file.
+    
+    The file is written next to the target and renamed into place, so a
+    crash never leaves a truncated snapshot behind.
+    
+    Args:
+        cache: Cache providing items()
+        path: Snapshot file path
+    
+    Returns:
+        Number of entries written
+    """
+    items = cache.items()
+    chunks = [_HEADER.pack(_MAGIC, len(items))]
+    for key, entry, expires_at in items:
+        key_bytes = key.encode()
+        value_bytes = entry.value.encode()
+        flags = (_FLAG_ENABLED if entry.enabled else 0) | (_FLAG_FOUND if entry.found else 0)
+        chunks.append(_RECORD.pack(expires_at, len(key_bytes), len(value_bytes), flags))
+        chunks.append(key_bytes)
+        chunks.append(value_bytes)
+    
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(b"".join(chunks))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return len(items)
+
+
+def load_snapshot(cache: Any, path: str, stale_seconds: float = 0.0) -> int:
+    """Load a snapshot into a cache, keeping each entry's remaining TTL.
+    
+    Entries that expired (beyond the stale window) while the process was
+    down are skipped.
+    
+    Args:
+        cache: Cache providing restore()
+        path: Snapshot file path
+        stale_seconds: Stale window of the cache
+    
+    Returns:
+        Number of entries restored
+    
+    Raises:
+        ValueError: If the file is not a valid snapshot
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    
+    if len(data) < _HEADER.size:
+        raise ValueError(f"Snapshot {path} is truncated")
+    magic, count = _HEADER.unpack_from(data, 0)
+    if magic != _MAGIC:
+        raise ValueError(f"{path} is not a cache snapshot")
+    
+    now = time.time()
+    # Many entries share a handful of variant values; decode each once
+    values: Dict[bytes, str] = {}
+    restored = 0
+    offset = _HEADER.size
+    unpack_record = _RECORD.unpack_from
+    for _ in range(count):
+        if offset + _RECORD.size > len(data):
+            raise ValueError(f"Snapshot {path} is truncated")
+        expires_at, key_len, value_len, flags = unpack_record(data, offset)
+        offset += _RECORD.size
+        end = offset + key_len + value_len
+        if end > len(data):
+            raise ValueError(f"Snapshot {path} is truncated")
+        if expires_at + stale_seconds > now:
+            key = data[offset: offset + key_len].decode()
+            raw_value = data[offset + key_len: end]
+            value = values.get(raw_value)
+            if value is None:
+                value = values[raw_value] = raw_value.decode()
+            cache.restore(key, value, bool(flags & _FLAG_ENABLED), bool(flags & _FLAG_FOUND), expires_at)
+            restored += 1
+        offset = end
+    return restored
+
+
+class SnapshotScheduler:
+    """Periodically writes a cache snapshot from a background thread."""
+    
+    def __init__(
+        self,
+        cache: Any,
+        path: str,
+        interval_seconds: float,
+        logger: Optional[Callable[[str, Any], None]] = None,
+    ):
+        """Initialize the scheduler.
+        
+        Args:
+            cache: Cache providing items()
+            path: Snapshot file path
+            interval_seconds: Time between snapshots
+            logger: Optional logger for snapshot failures
+        """
+        self._cache = cache
+        self._path = path
+        self._interval = interval_seconds
+        self._logger = logger
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="togglr-snapshot", daemon=True)
+    
+    def start(self) -> None:
+        """Start writing snapshots."""
+        self._thread.start()
+    
+    def stop(self) -> None:
+        """Stop the background thread."""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+    
+    def _run(self) -> None:
+        """Write a snapshot every interval until stopped."""
+        while not self._stop.wait(self._interval):
+            try:
+                save_snapshot(self._cache, self._path)
+            except Exception as e:
+                if self._logger:
+                    self._logger(f"Cache snapshot failed: {e}")
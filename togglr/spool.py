@@ -0,0 +1,413 @@
+"""Disk spool for track events that could not be delivered."""
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Tuple
+
+from .context import RequestContext
+from .track_event import EventType, TrackEvent
+
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".log"
+CURSOR_FILE = "cursor"
+
+# (segment sequence number, byte offset) of the next record to replay
+Position = Tuple[int, int]
+
+
+@dataclass
+class SpoolStats:
+    """Counters of the event spool."""
+    
+    spooled: int = 0  # events written to disk
+    replayed: int = 0  # spooled events delivered
+    expired: int = 0  # events older than max_age_seconds, not replayed
+    dropped: int = 0  # events lost to the byte cap, unreadable or rejected by the server
+    bytes: int = 0  # size of the segments on disk
+
+
+@dataclass
+class SpooledEvent:
+    """One record read back from the spool."""
+    
+    feature_key: str
+    event: Optional[TrackEvent]  # None if the record could not be read
+    position: Position  # position after this record
+    expired: bool = False
+
+
+def _encode(feature_key: str, event: TrackEvent, now: float) -> bytes:
+    """Encode an event as one JSON line."""
+    record = {"t": now, "k": feature_key, "e": event.to_dict()}
+    return json.dumps(record, separators=(",", ":"), default=str).encode("utf-8") + b"\n"
+
+
+def _decode(line: bytes) -> Tuple[float, str, Optional[TrackEvent]]:
+    """Decode a JSON line into (spooled_at, feature_key, event), event None if unreadable."""
+    try:
+        record = json.loads(line)
+        data = record["e"]
+        created_at = data.get("created_at")
+        event = TrackEvent(
+            variant_key=data["variant_key"],
+            event_type=EventType(data["event_type"]),
+            reward=data.get("reward"),
+            context=RequestContext(data.get("context") or {}),
+            created_at=datetime.fromisoformat(created_at) if created_at else None,
+            dedup_key=data.get("dedup_key"),
+        )
+        return float(record["t"]), str(record["k"]), event
+    except (ValueError, KeyError, TypeError):
+        return 0.0, "", None
+
+
+class EventSpool:
+    """Append-only, segmented on-disk queue of track events.
+    
+    Events are appended as JSON lines to the newest segment file, which is
+    rotated at segment_bytes. Writes are flushed to the OS immediately and
+    fsynced at most every fsync_interval_seconds. A cursor file records how
+    far replay has got; fully replayed segments are deleted. The oldest
+    segments are dropped to stay within max_bytes, and events older than
+    max_age_seconds are skipped on replay.
+    """
+    
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_age_seconds: float = 24 * 3600.0,
+        segment_bytes: int = 1024 * 1024,
+        fsync_interval_seconds: float = 1.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Open the spool, creating the directory if needed.
+        
+        Args:
+            directory: Directory holding the segment files
+            max_bytes: Maximum total size of the segments
+            max_age_seconds: Events spooled longer ago than this are not replayed
+            segment_bytes: Size at which a new segment is started
+            fsync_interval_seconds: Maximum time between fsyncs of written events
+            clock: Wall-clock time source, for tests
+        """
+        self._dir = directory
+        self._max_bytes = max_bytes
+        self._max_age = max_age_seconds
+        self._segment_bytes = min(segment_bytes, max_bytes)
+        self._fsync_interval = fsync_interval_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stats = SpoolStats()
+        
+        os.makedirs(directory, exist_ok=True)
+        self._segments = sorted(self._scan())  # sequence numbers, oldest first
+        self._sizes = {seq: os.path.getsize(self._path(seq)) for seq in self._segments}
+        self._cursor = self._read_cursor()
+        if not self._segments:
+            self._segments.append(1)
+            self._sizes[1] = 0
+        self._file = open(self._path(self._segments[-1]), "ab")
+        self._dirty = False
+        self._last_sync = time.monotonic()
+        with self._lock:
+            self._drop_expired_segments()
+    
+    def append(self, feature_key: str, event: TrackEvent) -> bool:
+        """Write an event to the spool.
+        
+        Args:
+            feature_key: The feature key the event is for
+            event: The track event
+        
+        Returns:
+            True if the event was written, False if it was dropped
+        """
+        line = _encode(feature_key, event, self._clock())
+        with self._lock:
+            if self._file.closed or len(line) > self._segment_bytes:
+                self._stats.dropped += 1
+                return False
+            if self._sizes[self._segments[-1]] + len(line) > self._segment_bytes:
+                self._rotate()
+            while self._total_bytes() + len(line) > self._max_bytes and len(self._segments) > 1:
+                self._drop_segment(self._segments[0])
+            if self._total_bytes() + len(line) > self._max_bytes:
+                self._stats.dropped += 1
+                return False
+            
+            self._file.write(line)
+            self._file.flush()
+            self._sizes[self._segments[-1]] += len(line)
+            self._stats.spooled += 1
+            self._dirty = True
+            self._sync_if_due()
+        return True
+    
+    def peek(self, limit: int) -> List[SpooledEvent]:
+        """Read the oldest events not yet replayed, without consuming them.
+        
+        Args:
+            limit: Maximum number of records to read
+        
+        Returns:
+            Up to limit records, oldest first
+        """
+        now = self._clock()
+        records: List[SpooledEvent] = []
+        with self._lock:
+            seq, offset = self._cursor
+            for segment in self._segments:
+                if segment < seq:
+                    continue
+                start = offset if segment == seq else 0
+                with open(self._path(segment), "rb") as f:
+                    f.seek(start)
+                    position = start
+                    for line in f:
+                        if not line.endswith(b"\n"):
+                            break  # being written, or torn by a crash
+                        position += len(line)
+                        spooled_at, feature_key, event = _decode(line)
+                        expired = event is not None and now - spooled_at > self._max_age
+                        records.append(SpooledEvent(feature_key, event, (segment, position), expired))
+                        if len(records) >= limit:
+                            return records
+        return records
+    
+    def commit(self, record: SpooledEvent) -> None:
+        """Mark a record, and all records before it, as replayed.
+        
+        Args:
+            record: Record returned by peek()
+        """
+        with self._lock:
+            if record.event is None:
+                self._stats.dropped += 1
+            elif record.expired:
+                self._stats.expired += 1
+            if record.position <= self._cursor:
+                return
+            self._cursor = record.position
+            # Replayed segments are no longer needed
+            while self._segments[0] < self._cursor[0]:
+                self._delete_segment(self._segments[0])
+            self._write_cursor()
+    
+    def record_replayed(self) -> None:
+        """Count a record delivered by the replayer."""
+        with self._lock:
+            self._stats.replayed += 1
+    
+    def record_rejected(self) -> None:
+        """Count a record the server refused and that was dropped."""
+        with self._lock:
+            self._stats.dropped += 1
+    
+    def pending_bytes(self) -> int:
+        """Get the number of bytes not yet replayed."""
+        with self._lock:
+            seq, offset = self._cursor
+            return sum(size for s, size in self._sizes.items() if s >= seq) - (offset if seq in self._sizes else 0)
+    
+    def sync(self) -> None:
+        """Fsync written events that are not on disk yet."""
+        with self._lock:
+            self._sync()
+    
+    def sync_if_due(self) -> None:
+        """Fsync written events if the fsync interval has passed."""
+        with self._lock:
+            self._sync_if_due()
+    
+    def stats(self) -> SpoolStats:
+        """Get a snapshot of the counters."""
+        with self._lock:
+            return SpoolStats(
+                spooled=self._stats.spooled,
+                replayed=self._stats.replayed,
+                expired=self._stats.expired,
+                dropped=self._stats.dropped,
+                bytes=self._total_bytes(),
+            )
+    
+    def close(self) -> None:
+        """Fsync and close the current segment."""
+        with self._lock:
+            if not self._file.closed:
+                self._sync()
+                self._file.close()
+    
+    def _path(self, seq: int) -> str:
+        """Get the file name of a segment."""
+        return os.path.join(self._dir, f"{SEGMENT_PREFIX}{seq:012d}{SEGMENT_SUFFIX}")
+    
+    def _scan(self) -> List[int]:
+        """Find the segments left by a previous process."""
+        segments = []
+        for name in os.listdir(self._dir):
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX):
+                try:
+                    segments.append(int(name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]))
+                except ValueError:
+                    continue
+        return segments
+    
+    def _read_cursor(self) -> Position:
+        """Read the replay position, defaulting to the start of the oldest segment."""
+        first = (self._segments[0], 0) if self._segments else (1, 0)
+        try:
+            with open(os.path.join(self._dir, CURSOR_FILE)) as f:
+                seq, offset = (int(part) for part in f.read().split())
+        except (OSError, ValueError):
+            return first
+        return max((seq, offset), first)
+    
+    def _write_cursor(self) -> None:
+        """Persist the replay position; the lock must be held."""
+        path = os.path.join(self._dir, CURSOR_FILE)
+        with open(path + ".tmp", "w") as f:
+            f.write(f"{self._cursor[0]} {self._cursor[1]}\n")
+        os.replace(path + ".tmp", path)
+    
+    def _total_bytes(self) -> int:
+        """Get the size of all segments; the lock must be held."""
+        return sum(self._sizes.values())
+    
+    def _rotate(self) -> None:
+        """Start a new segment; the lock must be held."""
+        self._sync()
+        self._file.close()
+        seq = self._segments[-1] + 1
+        self._segments.append(seq)
+        self._sizes[seq] = 0
+        self._file = open(self._path(seq), "ab")
+        self._drop_expired_segments()
+    
+    def _drop_segment(self, seq: int) -> None:
+        """Delete an unreplayed segment to make room, counting its events; the lock must be held."""
+        start = self._cursor[1] if seq == self._cursor[0] else 0
+        try:
+            with open(self._path(seq), "rb") as f:
+                f.seek(start)
+                self._stats.dropped += sum(1 for line in f if line.endswith(b"\n"))
+        except OSError:
+            pass
+        self._delete_segment(seq)
+    
+    def _drop_expired_segments(self) -> None:
+        """Delete closed segments whose newest event is past max_age; the lock must be held."""
+        cutoff = self._clock() - self._max_age
+        for seq in self._segments[:-1]:
+            try:
+                if os.path.getmtime(self._path(seq)) >= cutoff:
+                    break
+            except OSError:
+                pass
+            self._drop_segment(seq)
+    
+    def _delete_segment(self, seq: int) -> None:
+        """Remove a segment file and move the cursor past it; the lock must be held."""
+        try:
+            os.remove(self._path(seq))
+        except OSError:
+            pass
+        self._segments.remove(seq)
+        del self._sizes[seq]
+        if self._cursor[0] <= seq:
+            self._cursor = (self._segments[0], 0)
+            self._write_cursor()
+    
+    def _sync(self) -> None:
+        """Fsync the current segment; the lock must be held."""
+        if self._dirty and not self._file.closed:
+            os.fsync(self._file.fileno())
+            self._dirty = False
+        self._last_sync = time.monotonic()
+    
+    def _sync_if_due(self) -> None:
+        """Fsync if the fsync interval has passed; the lock must be held."""
+        if self._dirty and time.monotonic() - self._last_sync >= self._fsync_interval:
+            self._sync()
+
+
+class SpoolReplayer:
+    """Background thread replaying spooled events in order at a limited rate.
+    
+    While the server keeps failing with transient errors, replay pauses for
+    retry_interval_seconds between attempts at the oldest event, so an
+    outage costs one request per interval.
+    """
+    
+    def __init__(
+        self,
+        spool: EventSpool,
+        send: Callable[[str, TrackEvent], None],
+        is_transient: Callable[[Exception], bool],
+        rate_per_second: float = 50.0,
+        retry_interval_seconds: float = 5.0,
+        logger: Optional[Callable[[str, Any], None]] = None,
+    ):
+        """Initialize the replayer.
+        
+        Args:
+            spool: Spool to replay
+            send: Callable delivering one event, raising on failure
+            is_transient: Whether a send error means the server may recover
+            rate_per_second: Maximum events replayed per second
+            retry_interval_seconds: Pause after a transient failure
+            logger: Optional logger for failures
+        """
+        self._spool = spool
+        self._send = send
+        self._is_transient = is_transient
+        self._rate = max(rate_per_second, 0.001)
+        self._retry_interval = retry_interval_seconds
+        self._logger = logger
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="togglr-event-spool", daemon=True)
+    
+    def start(self) -> None:
+        """Start replaying."""
+        self._thread.start()
+    
+    def stop(self) -> None:
+        """Stop replaying; unsent events stay in the spool."""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+    
+    def _run(self) -> None:
+        """Replay batches until stopped."""
+        idle = min(1.0, self._retry_interval)
+        while not self._stop.is_set():
+            self._spool.sync_if_due()
+            batch = self._spool.peek(max(1, int(self._rate)))
+            pause = idle if not batch else self._replay(batch)
+            if pause:
+                self._stop.wait(pause)
+    
+    def _replay(self, batch: List[SpooledEvent]) -> float:
+        """Send a batch in order, returning how long to pause afterwards."""
+        for record in batch:
+            if self._stop.is_set():
+                return 0.0
+            if record.event is not None and not record.expired:
+                try:
+                    self._send(record.feature_key, record.event)
+                    self._spool.record_replayed()
+                except Exception as e:
+                    if self._is_transient(e):
+                        if self._logger:
+                            self._logger(f"Replaying spooled events paused: {e}")
+                        return self._retry_interval
+                    self._spool.record_rejected()
+                    if self._logger:
+                        self._logger(f"Dropping spooled event for {record.feature_key}: {e}")
+                self._stop.wait(1.0 / self._rate)
+            self._spool.commit(record)
+        return 0.0
@@ -0,0 +1,255 @@
+"""W-TinyLFU admission policy for the evaluation cache.
+
+A small LRU window admits every new key; when it overflows, its oldest
+key only enters the main segmented LRU if it has been seen more often
+than the main cache's eviction victim. Access frequencies are tracked
+approximately in a count-min sketch that halves its counters periodically,
+so a long tail of one-off keys cannot flush hot entries out of the cache.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+_MASK64 = (1 << 64) - 1
+_SEEDS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0x27D4EB2F165667C5)
+_MISSING = object()
+
+
+class CountMinSketch:
+    """Approximate frequency counter with 4-bit-style saturating counters."""
+    
+    def __init__(self, capacity: int, max_count: int = 15):
+        """Initialize the sketch.
+        
+        Args:
+            capacity: Number of cache entries the frequencies are kept for
+            max_count: Counter saturation value
+        """
+        width = 16
+        while width < 4 * capacity:
+            width <<= 1
+        self._mask = width - 1
+        self._width = width
+        self._table = bytearray(width * len(_SEEDS))
+        self._max_count = max_count
+        # Counters are halved after this many increments so old popularity fades
+        self._sample_size = max(10 * capacity, 16)
+        self._additions = 0
+    
+    def _indexes(self, key: Any) -> List[int]:
+        """Get the counter position of a key in every row."""
+        h = hash(key) & _MASK64
+        return [
+            row * self._width + (((h * seed) & _MASK64) >> 32 & self._mask)
+            for row, seed in enumerate(_SEEDS)
+        ]
+    
+    def increment(self, key: Any) -> None:
+        """Record one access to a key."""
+        table = self._table
+        added = False
+        for i in self._indexes(key):
+            if table[i] < self._max_count:
+                table[i] += 1
+                added = True
+        if added:
+            self._additions += 1
+            if self._additions >= self._sample_size:
+                self._reset()
+    
+    def frequency(self, key: Any) -> int:
+        """Get the estimated access count of a key."""
+        table = self._table
+        return min(table[i] for i in self._indexes(key))
+    
+    def _reset(self) -> None:
+        """Halve every counter."""
+        self._table = bytearray(c >> 1 for c in self._table)
+        self._additions //= 2
+
+
+class WTinyLFUCache:
+    """Bounded mapping with W-TinyLFU admission and eviction.
+    
+    The capacity is split into a 1% LRU window and a segmented main LRU
+    with an 80% protected and 20% probation segment. It exposes the subset
+    of the cachetools cache interface used by LRUCache. It is not
+    thread-safe on its own.
+    """
+    
+    def __init__(
+        self,
+        maxsize: int,
+        getsizeof: Optional[Callable[[Any], int]] = None,
+    ):
+        """Initialize the cache.
+        
+        Args:
+            maxsize: Maximum total size of the entries
+            getsizeof: Size of a value, defaults to 1 per entry
+        """
+        self.maxsize = maxsize
+        self._window_max = max(1, maxsize // 100)
+        self._main_max = max(0, maxsize - self._window_max)
+        self._protected_max = int(self._main_max * 0.8)
+        self._window: "OrderedDict[Any, Any]" = OrderedDict()
+        self._probation: "OrderedDict[Any, Any]" = OrderedDict()
+        self._protected: "OrderedDict[Any, Any]" = OrderedDict()
+        self._sizes: Dict[Any, int] = {}
+        self._window_size = 0
+        self._probation_size = 0
+        self._protected_size = 0
+        # The sketch tracks keys, so size it by entry count even for byte budgets
+        self._sketch = CountMinSketch(maxsize if getsizeof is None else max(16, maxsize // 256))
+        self._getsizeof = getsizeof
+        self.evictions = 0
+    
+    @property
+    def currsize(self) -> int:
+        """Get the total size of the entries."""
+        return self._window_size + self._probation_size + self._protected_size
+    
+    def __len__(self) -> int:
+        return len(self._window) + len(self._probation) + len(self._protected)
+    
+    def __contains__(self, key: Any) -> bool:
+        return key in self._window or key in self._probation or key in self._protected
+    
+    def __iter__(self) -> Iterator[Any]:
+        yield from list(self._window)
+        yield from list(self._probation)
+        yield from list(self._protected)
+    
+    def __getitem__(self, key: Any) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Look a key up, recording the access and updating recency."""
+        self._sketch.increment(key)
+        if key in self._window:
+            self._window.move_to_end(key)
+            return self._window[key]
+        if key in self._protected:
+            self._protected.move_to_end(key)
+            return self._protected[key]
+        if key in self._probation:
+            # A second hit in the main cache promotes to the protected segment
+            value = self._probation.pop(key)
+            size = self._sizes[key]
+            self._probation_size -= size
+            self._protected[key] = value
+            self._protected_size += size
+            while self._protected_size > self._protected_max and len(self._protected) > 1:
+                demoted, demoted_value = self._protected.popitem(last=False)
+                demoted_size = self._sizes[demoted]
+                self._protected_size -= demoted_size
+                self._probation[demoted] = demoted_value
+                self._probation_size += demoted_size
+            return value
+        return default
+    
+    def __setitem__(self, key: Any, value: Any) -> None:
+        size = 1 if self._getsizeof is None else self._getsizeof(value)
+        if size > self.maxsize:
+            raise ValueError("value too large")
+        for segment in (self._window, self._probation, self._protected):
+            if key in segment:
+                self._replace(segment, key, value, size)
+                return
+        
+        self._sketch.increment(key)
+        self._window[key] = value
+        self._sizes[key] = size
+        self._window_size += size
+        while self._window_size > self._window_max and len(self._window) > 1:
+            candidate, candidate_value = self._window.popitem(last=False)
+            candidate_size = self._sizes[candidate]
+            self._window_size -= candidate_size
+            self._admit(candidate, candidate_value, candidate_size)
+        # A single value larger than the window still has to fit the whole cache
+        while self.currsize > self.maxsize:
+            self._evict_main()
+    
+    def _replace(self, segment: "OrderedDict[Any, Any]", key: Any, value: Any, size: int) -> None:
+        """Update the value of a cached key in place."""
+        delta = size - self._sizes[key]
+        self._sizes[key] = size
+        segment[key] = value
+        segment.move_to_end(key)
+        if segment is self._window:
+            self._window_size += delta
+        elif segment is self._probation:
+            self._probation_size += delta
+        else:
+            self._protected_size += delta
+        while self.currsize > self.maxsize:
+            self._evict_main()
+    
+    def _admit(self, candidate: Any, value: Any, size: int) -> None:
+        """Move a key evicted from the window into the main cache if it is popular enough."""
+        main_size = self._probation_size + self._protected_size
+        if main_size + size > self._main_max:
+            if size > self._main_max:
+                self._drop(candidate)
+                return
+            victims = self._probation or self._protected
+            if self._sketch.frequency(candidate) <= self._sketch.frequency(next(iter(victims))):
+                self._drop(candidate)
+                return
+            while self._probation_size + self._protected_size + size > self._main_max:
+                self._evict_main()
+        self._probation[candidate] = value
+        self._probation_size += size
+    
+    def _evict_main(self) -> None:
+        """Evict the least recently used entry of the main cache."""
+        victims = self._probation or self._protected
+        if not victims:
+            # Only the window is left
+            key, _ = self._window.popitem(last=False)
+            self._window_size -= self._sizes[key]
+            self._drop(key)
+            return
+        key, _ = victims.popitem(last=False)
+        if victims is self._probation:
+            self._probation_size -= self._sizes[key]
+        else:
+            self._protected_size -= self._sizes[key]
+        self._drop(key)
+    
+    def _drop(self, key: Any) -> None:
+        """Forget an evicted key."""
+        del self._sizes[key]
+        self.evictions += 1
+    
+    def __delitem__(self, key: Any) -> None:
+        if self.pop(key, _MISSING) is _MISSING:
+            raise KeyError(key)
+    
+    def pop(self, key: Any, default: Any = None) -> Any:
+        """Remove a key, returning its value."""
+        if key in self._window:
+            self._window_size -= self._sizes.pop(key)
+            return self._window.pop(key)
+        if key in self._probation:
+            self._probation_size -= self._sizes.pop(key)
+            return self._probation.pop(key)
+        if key in self._protected:
+            self._protected_size -= self._sizes.pop(key)
+            return self._protected.pop(key)
+        return default
+    
+    def items(self) -> List[Tuple[Any, Any]]:
+        """Get all entries."""
+        return [*self._window.items(), *self._probation.items(), *self._protected.items()]
+    
+    def clear(self) -> None:
+        """Remove all entries, keeping the frequency sketch."""
+        self._window.clear()
+        self._probation.clear()
+        self._protected.clear()
+        self._sizes.clear()
+        self._window_size = self._probation_size = self._protected_size = 0